@@ -0,0 +1,43 @@
+# Бенчмарк: стоимость остатков категории циклом по Product.__add__-семантике
+# против пакетного Category.stats() (numpy, если установлен) и ProductTable.
+#
+# Запуск:
+#     python -m benchmarks.bench_analytics --sizes 10000 1000000
+
+from __future__ import annotations
+
+import argparse
+from typing import List, Optional
+
+from benchmarks.common import timed
+from benchmarks.synthetic import iter_product_dicts
+from src import analytics
+from src.analytics import inventory_stats
+from src.category import Category
+from src.product import Product
+from src.product_table import ProductTable
+
+
+def loop_value(products: List[Product]) -> float:
+    return sum(p.price * p.quantity for p in products)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 1_000_000])
+    args = parser.parse_args(argv)
+
+    print(f"numpy: {'да' if analytics.np is not None else 'нет'}")
+    print(f"{'товаров':>10} {'цикл, мс':>10} {'stats(), мс':>12} {'таблица, мс':>12}")
+    for size in args.sizes:
+        products = [Product(d["name"], d["description"], d["price"], d["quantity"]) for d in iter_product_dicts(size)]
+        category = Category("Bench", "Bench", products)
+        table = ProductTable.from_products(products)
+        loop_ms = timed(loop_value, products) * 1000
+        stats_ms = timed(category.stats) * 1000
+        table_ms = timed(inventory_stats, table) * 1000
+        print(f"{size:>10} {loop_ms:>10.1f} {stats_ms:>12.1f} {table_ms:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
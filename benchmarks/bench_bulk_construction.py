@@ -0,0 +1,55 @@
+# Бенчмарк: создание товаров и категории из уже разобранных строк — объектов в секунду.
+# Сравнивает конструкторы Product(...) + Category(...) с пакетными Product.from_rows (с проверкой
+# и без неё) + Category.from_validated.
+#
+# Запуск:
+#     python -m benchmarks.bench_bulk_construction --sizes 100000 1000000
+
+from __future__ import annotations
+
+import argparse
+from typing import List, Optional, Tuple
+
+from benchmarks.common import timed
+from benchmarks.synthetic import iter_product_dicts
+from src.category import Category
+from src.product import Product
+
+Row = Tuple[str, str, float, int]
+
+
+def _constructors(rows: List[Row]) -> Category:
+    return Category("Bench", "Bench", [Product(*row) for row in rows])
+
+
+def _from_rows(rows: List[Row]) -> Category:
+    return Category.from_validated("Bench", "Bench", Product.from_rows(rows))
+
+
+def _from_rows_unchecked(rows: List[Row]) -> Category:
+    return Category.from_validated("Bench", "Bench", Product.from_rows(rows, validate=False))
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    cases = (
+        ("Product() + Category()", _constructors),
+        ("from_rows + from_validated", _from_rows),
+        ("from_rows(validate=False)", _from_rows_unchecked),
+    )
+    print(f"{'товаров':>10} {'способ':>28} {'время, с':>9} {'объектов/с':>12} {'ускорение':>10}")
+    for size in args.sizes:
+        rows = [(d["name"], d["description"], d["price"], d["quantity"]) for d in iter_product_dicts(size)]
+        base = 0.0
+        for label, build in cases:
+            seconds = timed(build, rows, repeat=args.repeat)
+            base = base or seconds
+            print(f"{size:>10} {label:>28} {seconds:>9.3f} {size / seconds:>12,.0f} {base / seconds:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
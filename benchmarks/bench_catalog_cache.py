@@ -0,0 +1,49 @@
+# Бенчмарк: повторная загрузка одного и того же файла — load_categories_from_json каждый раз
+# против CatalogCache: первая загрузка (промах), попадание в кэш в памяти и загрузка
+# из дискового снимка в новом кэше (как после перезапуска процесса).
+#
+# Запуск:
+#     python -m benchmarks.bench_catalog_cache --size 1000000
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from typing import List, Optional
+
+from benchmarks.common import timed
+from benchmarks.synthetic import write_catalog
+from src.catalog_cache import CatalogCache
+from src.loading import load_categories_from_json
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "catalog.json")
+        snapshots = os.path.join(tmp, "cache")
+        write_catalog(path, args.size)
+        print(f"товаров: {args.size}, файл: {os.path.getsize(path) / 2**20:.1f} МБ")
+
+        cache = CatalogCache(snapshot_dir=snapshots)
+        start = time.perf_counter()
+        cache.load(path)
+        miss = time.perf_counter() - start
+        results = (
+            ("load_categories_from_json", timed(load_categories_from_json, path)),
+            ("кэш: промах + запись снимка", miss),
+            ("кэш: попадание в памяти", timed(cache.load, path)),
+            ("кэш: снимок на диске", timed(lambda: CatalogCache(snapshot_dir=snapshots).load(path))),
+        )
+        print(f"{'вариант':>30} {'время, с':>10}")
+        for label, seconds in results:
+            print(f"{label:>30} {seconds:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
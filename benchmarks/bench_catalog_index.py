@@ -0,0 +1,68 @@
+# Бенчмарк: запросы к каталогу через CatalogIndex против фильтрации get_products()
+# полным проходом — диапазон цен, диапазон цен среди товаров в наличии, автодополнение.
+#
+# Запуск:
+#     python -m benchmarks.bench_catalog_index --size 1000000
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import List, Optional
+
+from benchmarks.common import timed
+from benchmarks.synthetic import make_catalog
+from src.catalog_index import CatalogIndex
+from src.category import Category
+from src.product import Product
+
+
+def scan_range(categories: List[Category], low: float, high: float, in_stock: bool) -> List[Product]:
+    return [
+        p for c in categories for p in c.get_products() if low <= p.price <= high and (not in_stock or p.quantity > 0)
+    ]
+
+
+def scan_prefix(categories: List[Category], prefix: str) -> List[Product]:
+    prefix = prefix.casefold()
+    return [p for c in categories for p in c.get_products() if p.name.casefold().startswith(prefix)][:10]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+
+    categories = [
+        Category(c["name"], c["description"], [Product._from_trusted(**p) for p in c["products"]])
+        for c in make_catalog(args.size)
+    ]
+    start = time.perf_counter()
+    index = CatalogIndex(categories)
+    print(f"товаров: {args.size}, построение индекса: {time.perf_counter() - start:.2f} с")
+
+    print(f"{'запрос':>28} {'проход, мс':>12} {'индекс, мс':>12}")
+    queries = (
+        ("цена 1000..1100", lambda: scan_range(categories, 1000, 1100, False), lambda: index.price_range(1000, 1100)),
+        (
+            "цена 1000..1100, в наличии",
+            lambda: scan_range(categories, 1000, 1100, True),
+            lambda: index.price_range(1000, 1100, in_stock=True),
+        ),
+        (
+            "префикс 'товар 12345'",
+            lambda: scan_prefix(categories, "товар 12345"),
+            lambda: index.autocomplete("товар 12345"),
+        ),
+    )
+    for label, scan, query in queries:
+        print(f"{label:>28} {timed(scan) * 1000:>12.1f} {timed(query) * 1000:>12.3f}")
+
+    product = Product("Товар новый", "Описание", 1050.0, 1)
+    start = time.perf_counter()
+    categories[0].add_product(product)
+    print(f"add_product с обновлением индекса: {(time.perf_counter() - start) * 1000:.3f} мс")
+
+
+if __name__ == "__main__":
+    main()
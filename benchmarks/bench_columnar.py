@@ -0,0 +1,62 @@
+# Бенчмарк: сортировка и top-k товаров категории по объектам и по колонкам (src/columnar.py).
+# Сравнивает sorted()/heapq.nlargest по списку Product с Category.sorted_products / top_products
+# при колоночном хранении, а также запрос сразу после изменения цены одного товара: колоночное
+# хранение обновляет одну ячейку, обычная категория пересобирает колонки price_columns().
+#
+# Запуск:
+#     python -m benchmarks.bench_columnar --sizes 100000 1000000
+
+from __future__ import annotations
+
+import argparse
+import heapq
+from operator import attrgetter
+from typing import Callable, List, Optional, Tuple
+
+from benchmarks.common import timed
+from benchmarks.synthetic import iter_product_dicts
+from src.category import Category
+from src.product import Product
+
+_get_price = attrgetter("price")
+
+
+def _value(product: Product) -> float:
+    return product.price * product.quantity
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--k", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    print(f"{'товаров':>10} {'запрос':>44} {'время, мс':>10}")
+    for size in args.sizes:
+        products = Product.from_rows(
+            [(d["name"], d["description"], d["price"], d["quantity"]) for d in iter_product_dicts(size)]
+        )
+        plain = Category("Bench", "Bench", products)
+        category = Category("Bench", "Bench", products, columnar=True)
+        first = products[0]
+
+        def change_then_top(target: Category) -> None:
+            first.update_price(first.price + 1)
+            target.top_products(args.k)
+
+        cases: List[Tuple[str, Callable[[], object]]] = [
+            ("sorted(products, key=price)", lambda: sorted(category.products_view(), key=_get_price)),
+            ("sorted_products('price')", lambda: category.sorted_products("price")),
+            (f"heapq.nlargest({args.k}, key=price)", lambda: heapq.nlargest(args.k, products, key=_get_price)),
+            (f"top_products({args.k})", lambda: category.top_products(args.k)),
+            (f"heapq.nlargest({args.k}, key=price*quantity)", lambda: heapq.nlargest(args.k, products, key=_value)),
+            (f"top_products({args.k}, 'value')", lambda: category.top_products(args.k, "value")),
+            ("смена цены + top (обычная категория)", lambda: change_then_top(plain)),
+            ("смена цены + top (колоночная)", lambda: change_then_top(category)),
+        ]
+        for label, func in cases:
+            print(f"{size:>10} {label:>44} {timed(func) * 1000:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# Бенчмарк: обновление каталога по новой полной выгрузке — перезагрузка через
+# load_categories_from_json против apply_delta_from_json, когда меняется малая доля товаров.
+#
+# Запуск:
+#     python -m benchmarks.bench_delta --size 1000000 --changed 0.01
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from typing import List, Optional
+
+from benchmarks.synthetic import make_catalog
+from src.delta import apply_delta_from_json
+from src.loading import load_categories_from_json
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--changed", type=float, default=0.01, help="доля изменившихся товаров")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        old_path = os.path.join(tmp, "old.json")
+        new_path = os.path.join(tmp, "new.json")
+        catalog = make_catalog(args.size)
+        with open(old_path, "w", encoding="utf-8") as f:
+            json.dump(catalog, f, ensure_ascii=False)
+        rnd = random.Random(1)
+        for category in catalog:
+            for product in category["products"]:
+                if rnd.random() < args.changed:
+                    product["quantity"] += 1
+        with open(new_path, "w", encoding="utf-8") as f:
+            json.dump(catalog, f, ensure_ascii=False)
+
+        categories = load_categories_from_json(old_path)
+        start = time.perf_counter()
+        load_categories_from_json(new_path)
+        reload_s = time.perf_counter() - start
+        start = time.perf_counter()
+        changes = apply_delta_from_json(categories, new_path)
+        delta_s = time.perf_counter() - start
+
+        print(f"товаров: {args.size}, изменений: {changes}")
+        print(f"полная перезагрузка: {reload_s:.2f} с, дельта: {delta_s:.2f} с")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# Бенчмарк: потоковая выгрузка каталога в JSON, NDJSON и CSV — пропускная способность в МБ/с
+# и пик памяти, выделенной во время выгрузки (tracemalloc), который не должен расти с размером каталога.
+#
+# Запуск:
+#     python -m benchmarks.bench_export --sizes 100000 1000000
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import List, Optional
+
+from benchmarks.synthetic import make_catalog
+from src.category import Category
+from src.export import export_csv, export_json, export_ndjson
+from src.product import Product
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    args = parser.parse_args(argv)
+
+    print(f"{'товаров':>10} {'формат':>7} {'МБ':>8} {'время, с':>9} {'МБ/с':>8} {'пик памяти, МБ':>15}")
+    for size in args.sizes:
+        categories = [
+            Category(c["name"], c["description"], [Product._from_trusted(**p) for p in c["products"]])
+            for c in make_catalog(size)
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            for label, export in (("json", export_json), ("ndjson", export_ndjson), ("csv", export_csv)):
+                path = os.path.join(tmp, f"catalog.{label}")
+                with open(path, "w", encoding="utf-8", newline="") as f:
+                    start = time.perf_counter()
+                    export(categories, f)
+                    elapsed = time.perf_counter() - start
+                with open(path, "w", encoding="utf-8", newline="") as f:
+                    tracemalloc.start()
+                    export(categories, f)
+                    peak = tracemalloc.get_traced_memory()[1] / 2**20
+                    tracemalloc.stop()
+                mb = os.path.getsize(path) / 2**20
+                print(f"{size:>10} {label:>7} {mb:>8.1f} {elapsed:>9.2f} {mb / elapsed:>8.1f} {peak:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# Бенчмарк: параллельная загрузка шардов ingest_catalog при разном числе процессов.
+# Отдельно показано время параллельной части (разбор и проверка шардов) и последовательной
+# (объединение и создание объектов в основном процессе) — она ограничивает ускорение по закону Амдала.
+#
+# Запуск:
+#     python -m benchmarks.bench_ingest --shards 32 --per-shard 50000 --workers 1 2 4 8
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from typing import List, Optional
+
+from benchmarks.synthetic import write_catalog
+from src.ingest import build_categories, merge_shards, parse_shards, resolve_shards
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--shards", type=int, default=32)
+    parser.add_argument("--per-shard", type=int, default=50_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args(argv)
+
+    print(f"ядер: {os.cpu_count()}, шардов: {args.shards}, товаров в шарде: {args.per_shard}")
+    print(
+        f"{'процессов':>10} {'время, с':>10} {'разбор, с':>10} {'послед. часть':>14} "
+        f"{'товаров/с':>12} {'ускорение':>10}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for i in range(args.shards):
+            # у шардов разные seed, но пересекающиеся названия — проверяется и объединение
+            write_catalog(os.path.join(tmp, f"shard_{i:03}.json"), args.per_shard, seed=i)
+
+        paths = resolve_shards(tmp)
+        total = args.shards * args.per_shard
+        base: Optional[float] = None
+        for workers in args.workers:
+            start = time.perf_counter()
+            shards = parse_shards(paths, max_workers=workers)
+            parsed = time.perf_counter()
+            build_categories(merge_shards(shards))
+            elapsed = time.perf_counter() - start
+            serial = elapsed - (parsed - start)
+            base = base or elapsed
+            print(
+                f"{workers:>10} {elapsed:>10.2f} {parsed - start:>10.2f} {serial:>14.2f} "
+                f"{total / elapsed:>12.0f} {base / elapsed:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
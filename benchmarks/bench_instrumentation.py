@@ -0,0 +1,49 @@
+# Бенчмарк: накладные расходы инструментирования загрузки (src/instrumentation.py).
+# Сравнивает load_categories_from_json без instrument() и внутри него и печатает собранные
+# этапы и счётчики. Без instrument() замеры должны укладываться в шум измерения.
+#
+# Запуск:
+#     python -m benchmarks.bench_instrumentation --sizes 10000 100000
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+from typing import List, Optional
+
+from benchmarks.common import timed
+from benchmarks.synthetic import write_catalog
+from src.instrumentation import LoadStats, instrument
+from src.loading import load_categories_from_json
+
+
+def _load_instrumented(path: str) -> None:
+    with instrument():
+        load_categories_from_json(path)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(f"{'товаров':>10} {'выключено, с':>13} {'включено, с':>12} {'разница':>8}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "catalog.json")
+            write_catalog(path, size)
+            off = timed(load_categories_from_json, path, repeat=args.repeat)
+            on = timed(_load_instrumented, path, repeat=args.repeat)
+            print(f"{size:>10} {off:>13.3f} {on:>12.3f} {on / off - 1:>8.1%}")
+
+            stats = LoadStats()
+            with instrument(stats):
+                load_categories_from_json(path)
+            stages = ", ".join(f"{name} {seconds * 1000:.1f} мс" for name, seconds in stats.stages.items())
+            print(f"{'':>10} этапы: {stages}; товаров/с: {stats.rate():,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+# Бенчмарк: загрузка каталога разными JSON-декодерами, с проверками в Product.__init__
+# и в типизированном режиме (схема проверяется один раз при декодировании).
+#
+# Запуск:
+#     python -m benchmarks.bench_json_backends --size 1000000
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+from typing import List, Optional
+
+from benchmarks.common import timed
+from benchmarks.synthetic import write_catalog
+from src.json_backends import available_backends
+from src.loading import load_categories_from_json
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "catalog.json")
+        write_catalog(path, args.size)
+        print(f"товаров: {args.size}, файл: {os.path.getsize(path) / 2**20:.1f} МБ")
+        print(f"{'декодер':>10} {'обычный, с':>12} {'типизированный, с':>18}")
+        for backend in available_backends():
+            plain = timed(load_categories_from_json, path, backend, False, repeat=args.repeat)
+            typed = timed(load_categories_from_json, path, backend, True, repeat=args.repeat)
+            print(f"{backend:>10} {plain:>12.3f} {typed:>18.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# Бенчмарк: байты на товар для прежнего Product с __dict__, текущего Product со __slots__
+# и колоночной ProductTable. Память считается через tracemalloc; строки названий и описаний
+# создаются до замера и разделяются всеми вариантами, поэтому в цифры не входят.
+#
+# Запуск:
+#     python -m benchmarks.bench_product_memory --size 1000000
+
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+from typing import Any, Callable, List, Optional
+
+from benchmarks.synthetic import iter_product_dicts
+from src.product import Product
+from src.product_table import ProductTable
+
+
+class DictProduct:
+    """Прежняя раскладка Product: все поля в __dict__ экземпляра."""
+
+    def __init__(self, name: str, description: str, price: float, quantity: int):
+        self.name = name
+        self.description = description
+        self.__price = float(price)
+        self.quantity = quantity
+
+
+def build_dict(rows: List[Any]) -> Any:
+    return [DictProduct(*row) for row in rows]
+
+
+def build_slots(rows: List[Any]) -> Any:
+    return [Product(*row) for row in rows]
+
+
+def build_table(rows: List[Any]) -> Any:
+    table = ProductTable()
+    for row in rows:
+        table.append(*row)
+    return table
+
+
+def bytes_per_product(build: Callable[[List[Any]], Any], size: int) -> float:
+    rows = [(d["name"], d["description"], d["price"], d["quantity"]) for d in iter_product_dicts(size)]
+    gc.collect()
+    tracemalloc.start()
+    result = build(rows)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current / size
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+
+    print(f"{'раскладка':>22} {'байт на товар':>14}")
+    for label, build in (
+        ("Product с __dict__", build_dict),
+        ("Product со __slots__", build_slots),
+        ("ProductTable", build_table),
+    ):
+        print(f"{label:>22} {bytes_per_product(build, args.size):>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# Бенчмарк: импорт N строк через Product.new_product со списком (линейный поиск, O(N²))
+# и с ProductRegistry (индекс по названию, O(N)).
+# Половина строк — повторы уже импортированных товаров, чтобы проверялось и слияние.
+#
+# Запуск:
+#     python -m benchmarks.bench_product_registry --sizes 1000 10000 100000 1000000
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Any, Dict, List, Optional, Union
+
+from benchmarks.synthetic import iter_product_dicts
+from src.product import Product
+from src.product_registry import ProductRegistry
+
+# выше этого размера линейный вариант считается слишком долго
+LIST_LIMIT = 20_000
+
+
+def make_rows(n: int) -> List[Dict[str, Any]]:
+    rows = list(iter_product_dicts(n))
+    for i, row in enumerate(rows):
+        row["name"] = f"Товар {i // 2}"
+        row["price"] = 100.0 + i  # цена только растёт — без запроса подтверждения
+    return rows
+
+
+def import_rows(rows: List[Dict[str, Any]], target: Union[List[Product], ProductRegistry]) -> float:
+    start = time.perf_counter()
+    for row in rows:
+        Product.new_product(row, target)
+    return time.perf_counter() - start
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    args = parser.parse_args(argv)
+
+    print(f"{'строк':>10} {'список, с':>12} {'реестр, с':>12}")
+    for size in args.sizes:
+        rows = make_rows(size)
+        list_time = f"{import_rows(rows, []):.3f}" if size <= LIST_LIMIT else "—"
+        registry_time = import_rows(make_rows(size), ProductRegistry())
+        print(f"{size:>10} {list_time:>12} {registry_time:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# Бенчмарк: стоимость «запроса на чтение» товаров категории — копия get_products()
+# против представления products_view(). Для каждого варианта — время и память,
+# выделенная за запрос (пик tracemalloc), при чтении первых 20 товаров (страница) и при полном обходе.
+#
+# Запуск:
+#     python -m benchmarks.bench_products_view --sizes 1000 100000 1000000
+
+from __future__ import annotations
+
+import argparse
+import tracemalloc
+from itertools import islice
+from typing import Any, Callable, List, Optional
+
+from benchmarks.common import timed
+from benchmarks.synthetic import iter_product_dicts
+from src.category import Category
+from src.product import Product
+
+
+def allocated_bytes(func: Callable[[], Any]) -> int:
+    """Пик памяти, выделенной за один вызов func."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    args = parser.parse_args(argv)
+
+    print(f"{'товаров':>10} {'запрос':>22} {'время, мкс':>12} {'байт за запрос':>15}")
+    for size in args.sizes:
+        products = [Product._from_trusted(**d) for d in iter_product_dicts(size)]
+        category = Category("Bench", "Bench", products)
+        requests = (
+            ("копия, страница", lambda: list(islice(category.get_products(), 20))),
+            ("представление, стр.", lambda: list(category.products_view()[:20])),
+            ("копия, обход", lambda: sum(p.quantity for p in category.get_products())),
+            ("представление, обход", lambda: sum(p.quantity for p in category.products_view())),
+        )
+        for label, request in requests:
+            micros = timed(request) * 1e6
+            print(f"{size:>10} {label:>22} {micros:>12.1f} {allocated_bytes(request):>15}")
+
+
+if __name__ == "__main__":
+    main()
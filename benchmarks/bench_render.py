@@ -0,0 +1,44 @@
+# Бенчмарк: сборка строки Category.products без кэша (как раньше), повторное обращение
+# к закэшированному свойству и постраничная выдача iter_product_lines / write_products.
+#
+# Запуск:
+#     python -m benchmarks.bench_render --sizes 1000 100000
+
+from __future__ import annotations
+
+import argparse
+import io
+from typing import List, Optional
+
+from benchmarks.common import timed
+from benchmarks.synthetic import iter_product_dicts
+from src.category import Category
+from src.product import Product
+
+
+def render_uncached(products: List[Product]) -> str:
+    """Прежняя реализация свойства products."""
+    return "\n".join(str(p) for p in products) + ("\n" if products else "")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000])
+    parser.add_argument("--page", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    print(f"{'товаров':>10} {'без кэша, мс':>14} {'кэш, мс':>10} {'страница, мс':>14} {'в файл, мс':>12}")
+    for size in args.sizes:
+        products = [Product(d["name"], d["description"], d["price"], d["quantity"]) for d in iter_product_dicts(size)]
+        category = Category("Bench", "Bench", products)
+        _ = category.products
+
+        uncached = timed(render_uncached, products) * 1000
+        cached = timed(lambda: category.products) * 1000
+        page = timed(lambda: list(category.iter_product_lines(size // 2, args.page))) * 1000
+        to_file = timed(lambda: category.write_products(io.StringIO())) * 1000
+        print(f"{size:>10} {uncached:>14.2f} {cached:>10.4f} {page:>14.3f} {to_file:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+# Бенчмарк: пакетная переоценка категории через Category.reprice()
+# против цикла по товарам с Product.update_price.
+#
+# Запуск:
+#     python -m benchmarks.bench_repricing --sizes 100000 1000000
+
+from __future__ import annotations
+
+import argparse
+import random
+from typing import List, Optional
+
+from benchmarks.common import timed
+from benchmarks.synthetic import iter_product_dicts
+from src.category import Category
+from src.product import Product
+from src.repricing import max_decrease_percent
+
+
+def loop_reprice(products: List[Product], new_prices: List[float]) -> None:
+    for product, new_price in zip(products, new_prices):
+        product.update_price(new_price, lambda old, new: new >= old * 0.9)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    args = parser.parse_args(argv)
+
+    policy = max_decrease_percent(10)
+    print(f"{'товаров':>10} {'цикл, с':>10} {'reprice(), с':>13} {'товаров/с':>12}")
+    for size in args.sizes:
+        products = [Product(d["name"], d["description"], d["price"], d["quantity"]) for d in iter_product_dicts(size)]
+        category = Category("Bench", "Bench", products)
+        rng = random.Random(0)
+        new_prices = [p.price * rng.uniform(0.8, 1.2) for p in products]
+        loop_s = timed(loop_reprice, products, new_prices)
+        reprice_s = timed(category.reprice, new_prices, policy)
+        print(f"{size:>10} {loop_s:>10.2f} {reprice_s:>13.2f} {size / reprice_s:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
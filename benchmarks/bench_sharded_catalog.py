@@ -0,0 +1,84 @@
+# Бенчмарк: каталог в процессах-шардах (src/sharded_catalog.py) при разном числе шардов.
+# Замеряет загрузку каталога пачками через upsert, повторный upsert тех же товаров (объединение),
+# запрос итогов категорий и перераспределение при добавлении одного шарда.
+# Ускорение ограничено основным процессом: он раскладывает строки по шардам и сериализует пачки.
+#
+# Запуск:
+#     python -m benchmarks.bench_sharded_catalog --size 1000000 --shards 1 2 4 8
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from typing import List, Optional
+
+from benchmarks.synthetic import make_catalog
+from src.json_backends import CategoryRow
+from src.sharded_catalog import ShardedCatalog
+
+
+def _batches(rows: List[CategoryRow], batch: int) -> List[List[CategoryRow]]:
+    """Делит каталог на пачки примерно по batch товаров."""
+    batches: List[List[CategoryRow]] = [[]]
+    size = 0
+    for row in rows:
+        if size >= batch:
+            batches.append([])
+            size = 0
+        batches[-1].append(row)
+        size += len(row[2])
+    return batches
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--batch", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    rows: List[CategoryRow] = [
+        (
+            c["name"],
+            c["description"],
+            [(p["name"], p["description"], p["price"], p["quantity"]) for p in c["products"]],
+        )
+        for c in make_catalog(args.size)
+    ]
+    batches = _batches(rows, args.batch)
+
+    print(f"товаров: {args.size}, ядер: {os.cpu_count()}")
+    print(
+        f"{'шардов':>7} {'загрузка, с':>12} {'товаров/с':>11} {'ускорение':>10} "
+        f"{'повтор, с':>10} {'итоги, мс':>10} {'+1 шард, с':>11}"
+    )
+    base = 0.0
+    for shards in args.shards:
+        with ShardedCatalog(shards) as catalog:
+            start = time.perf_counter()
+            for batch in batches:
+                catalog.upsert(batch, validate=False)
+            load = time.perf_counter() - start
+            base = base or load
+
+            start = time.perf_counter()
+            for batch in batches:
+                catalog.upsert(batch, validate=False)
+            merge = time.perf_counter() - start
+
+            start = time.perf_counter()
+            catalog.category_totals()
+            totals = time.perf_counter() - start
+
+            start = time.perf_counter()
+            catalog.resize(shards + 1)
+            resize = time.perf_counter() - start
+        print(
+            f"{shards:>7} {load:>12.2f} {args.size / load:>11,.0f} {base / load:>9.1f}x "
+            f"{merge:>10.2f} {totals * 1000:>10.1f} {resize:>11.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# Бенчмарк: холодный старт из JSON (load_categories_from_json) против бинарного снимка:
+# открытие через mmap с чтением одной категории и полная материализация снимка.
+# Каждый вариант запускается в отдельном процессе, чтобы честно замерить пиковый RSS.
+#
+# Запуск:
+#     python -m benchmarks.bench_snapshot --size 1000000
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+from typing import List, Optional
+
+from benchmarks.common import measure_isolated
+from benchmarks.synthetic import write_catalog
+from src.loading import load_categories_from_json
+from src.snapshot import open_snapshot, write_snapshot
+
+
+def run_json(path: str) -> int:
+    return len(load_categories_from_json(path))
+
+
+def run_snapshot_open(path: str) -> int:
+    snapshot = open_snapshot(path)
+    return len(list(snapshot[0]))
+
+
+def run_snapshot_full(path: str) -> int:
+    with open_snapshot(path) as snapshot:
+        return len(snapshot.to_categories())
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "catalog.json")
+        snap_path = os.path.join(tmp, "catalog.snap")
+        write_catalog(json_path, args.size)
+        write_snapshot(load_categories_from_json(json_path), snap_path)
+        print(f"товаров: {args.size}")
+        print(
+            f"JSON: {os.path.getsize(json_path) / 2**20:.1f} МБ, снимок: {os.path.getsize(snap_path) / 2**20:.1f} МБ"
+        )
+        print(f"{'вариант':>28} {'время, с':>10} {'пик RSS, МБ':>12}")
+        for label, func, path in (
+            ("JSON", run_json, json_path),
+            ("снимок: открыть + 1 кат.", run_snapshot_open, snap_path),
+            ("снимок: всё в объекты", run_snapshot_full, snap_path),
+        ):
+            elapsed, rss, _ = measure_isolated(func, path)
+            print(f"{label:>28} {elapsed:>10.3f} {rss:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# Бенчмарк: хранилище каталога в SQLite против загрузки JSON.
+# Замеряет импорт каталога в базу (товаров в секунду), открытие готовой базы, чтение первой
+# и далёкой страницы категории, поиск товара по названию — и полную загрузку того же каталога
+# из JSON через load_categories_from_json.
+#
+# Запуск:
+#     python -m benchmarks.bench_sqlite_store --sizes 100000 1000000
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from typing import List, Optional
+
+from benchmarks.synthetic import write_catalog
+from src.loading import load_categories_from_json
+from src.sqlite_store import open_store
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--page-size", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            json_path = os.path.join(tmp, "catalog.json")
+            db_path = os.path.join(tmp, "catalog.db")
+            write_catalog(json_path, size)
+
+            start = time.perf_counter()
+            categories = load_categories_from_json(json_path)
+            load = time.perf_counter() - start
+            name = categories[-1].products_view()[-1].name
+            del categories
+
+            start = time.perf_counter()
+            with open_store(db_path) as store:
+                store.import_json(json_path)
+            imported = time.perf_counter() - start
+
+            start = time.perf_counter()
+            with open_store(db_path) as store:
+                opened = time.perf_counter() - start
+                category = store.categories()[-1]
+
+                start = time.perf_counter()
+                pages = category.iter_pages(args.page_size)
+                next(pages)
+                first_page = time.perf_counter() - start
+                for _ in range(len(category) // args.page_size // 2):
+                    next(pages)
+                start = time.perf_counter()
+                next(pages, None)
+                middle_page = time.perf_counter() - start
+
+                start = time.perf_counter()
+                found = store.find_products(name)
+                lookup = time.perf_counter() - start
+                assert found
+
+            print(f"товаров: {size}, размер базы: {os.path.getsize(db_path) / 2**20:.1f} МБ")
+            print(f"  загрузка JSON целиком:        {load:9.3f} с")
+            print(f"  импорт в SQLite:              {imported:9.3f} с ({size / imported:,.0f} товаров/с)")
+            print(f"  открытие базы:                {opened * 1000:9.3f} мс")
+            print(f"  первая страница категории:    {first_page * 1000:9.3f} мс")
+            print(f"  страница из середины:         {middle_page * 1000:9.3f} мс")
+            print(f"  поиск товара по названию:     {lookup * 1000:9.3f} мс")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+# Бенчмарк: полный загрузчик load_categories_from_json против потокового iter_categories_from_json.
+# Замеряет время и пиковый RSS на синтетических файлах.
+#
+# Запуск:
+#     python -m benchmarks.bench_streaming_loader --sizes 10000 1000000 10000000
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+from typing import List, Optional
+
+from benchmarks.common import measure_isolated
+from benchmarks.synthetic import write_catalog
+from src.loading import iter_categories_from_json, load_categories_from_json
+
+
+def run_full(path: str) -> int:
+    return sum(len(c.get_products()) for c in load_categories_from_json(path))
+
+
+def run_streaming(path: str) -> int:
+    return sum(len(c.get_products()) for c in iter_categories_from_json(path))
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 1_000_000, 10_000_000])
+    parser.add_argument("--per-category", type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    print(f"{'товаров':>10} {'загрузчик':>10} {'время, с':>10} {'пик RSS, МБ':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            path = os.path.join(tmp, f"catalog_{size}.json")
+            write_catalog(path, size, args.per_category)
+            for label, func in (("полный", run_full), ("потоковый", run_streaming)):
+                elapsed, rss, count = measure_isolated(func, path)
+                assert count == size
+                print(f"{size:>10} {label:>10} {elapsed:>10.2f} {rss:>12.1f}")
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
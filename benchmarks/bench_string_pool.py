@@ -0,0 +1,94 @@
+# Бенчмарк: память и время загрузки каталога с пулом строк и без него (src/string_pool.py).
+# Синтетический каталог с сильно повторяющимися описаниями: описание собирается из нескольких вариантов
+# объёма, цвета, камеры и комплектации (несколько сотен разных строк), а доля --unique-share товаров
+# получает уникальное длинное описание. Память — прирост по tracemalloc после загрузки, в байтах на товар.
+#
+# Запуск:
+#     python -m benchmarks.bench_string_pool --size 1000000
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import random
+import tempfile
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from benchmarks.common import timed
+from src.loading import load_categories_from_json
+from src.string_pool import StringPool
+
+STORAGE = ["64GB", "128GB", "256GB", "512GB", "1024GB"]
+COLORS = ["Серый цвет", "Черный цвет", "Синий", "Gray space", "Белый", "Зелёный"]
+CAMERAS = ["12MP камера", "48MP камера", "108MP камера", "200MP камера"]
+EXTRAS = [
+    "зарядное устройство в комплекте",
+    "без зарядного устройства",
+    "чехол и защитное стекло в подарок",
+    "гарантия 2 года, официальная поставка",
+]
+
+
+def write_repetitive_catalog(path: str, size: int, unique_share: float, per_category: int = 1000) -> None:
+    rnd = random.Random(0)
+    catalog: List[Dict[str, Any]] = []
+    for i in range(size):
+        if i % per_category == 0:
+            catalog.append({"name": f"Категория {len(catalog)}", "description": "Описание", "products": []})
+        description = ", ".join((rnd.choice(STORAGE), rnd.choice(COLORS), rnd.choice(CAMERAS), rnd.choice(EXTRAS)))
+        if rnd.random() < unique_share:
+            description = f"{description}. Партия {i}: " + " ".join(rnd.choice(EXTRAS) for _ in range(4))
+        catalog[-1]["products"].append(
+            {"name": f"Товар {i}", "description": description, "price": 100.0 + i % 1000, "quantity": i % 50}
+        )
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(catalog, f, ensure_ascii=False)
+
+
+def memory_after_load(path: str, make_pool: Callable[[], Optional[StringPool]]) -> int:
+    """Прирост памяти после загрузки; пул выбрасывается до замера — остаются только сами категории."""
+    gc.collect()
+    tracemalloc.start()
+    pool = make_pool()
+    categories = load_categories_from_json(path, strings=pool)
+    del pool
+    gc.collect()
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del categories
+    return current
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--unique-share", type=float, default=0.05)
+    parser.add_argument("--compress-from", type=int, default=256)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "catalog.json")
+        write_repetitive_catalog(path, args.size, args.unique_share)
+        print(f"товаров: {args.size}, уникальных длинных описаний: {args.unique_share:.0%}")
+        print(f"{'вариант':>28} {'МБ':>8} {'байт/товар':>11} {'экономия':>9} {'загрузка, с':>12}")
+        base = 0
+        variants: List[Tuple[str, Callable[[], Optional[StringPool]]]] = [
+            ("без пула", lambda: None),
+            ("StringPool()", StringPool),
+            (f"StringPool({args.compress_from})", lambda: StringPool(compress_from=args.compress_from)),
+        ]
+        for label, make_pool in variants:
+            memory = memory_after_load(path, make_pool)
+            elapsed = timed(lambda: load_categories_from_json(path, strings=make_pool()), repeat=1)
+            base = base or memory
+            print(
+                f"{label:>28} {memory / 2**20:>8.1f} {memory / args.size:>11.0f} "
+                f"{1 - memory / base:>9.0%} {elapsed:>12.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# Общие утилиты бенчмарков: замер времени и пикового RSS в отдельном процессе.
+# Каждый замер запускается в свежем процессе (spawn), иначе ru_maxrss
+# накапливал бы пик от предыдущих прогонов.
+
+from __future__ import annotations
+
+import multiprocessing
+import resource
+import sys
+import time
+from typing import Any, Callable, Tuple
+
+
+def _child(conn: Any, func: Callable[..., Any], args: Tuple[Any, ...]) -> None:
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    conn.send((elapsed, peak_rss_mb(), result))
+    conn.close()
+
+
+def peak_rss_mb() -> float:
+    """Пиковый RSS текущего процесса в мегабайтах."""
+    # в Linux ru_maxrss переживает exec и учитывает память родителя до запуска интерпретатора,
+    # поэтому берём VmHWM текущего адресного пространства
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # в Linux ru_maxrss в килобайтах, в macOS — в байтах
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def measure_isolated(func: Callable[..., Any], *args: Any) -> Tuple[float, float, Any]:
+    """Запускает func(*args) в отдельном процессе, возвращает (секунды, пиковый RSS в МБ, результат)."""
+    ctx = multiprocessing.get_context("spawn")
+    parent, child = ctx.Pipe(duplex=False)
+    proc = ctx.Process(target=_child, args=(child, func, args))
+    proc.start()
+    child.close()
+    elapsed, rss, result = parent.recv()
+    proc.join()
+    return elapsed, rss, result
+
+
+def timed(func: Callable[..., Any], *args: Any, repeat: int = 3) -> float:
+    """Лучшее время из repeat запусков func(*args), в секундах."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
@@ -0,0 +1,166 @@
+# Набор бенчмарков горячих путей для отслеживания регрессий производительности:
+# Product.__init__ (с проверками), Product.new_product (с ProductRegistry), Category.__init__,
+# Category.__str__, Category.products и load_categories_from_json — на синтетических каталогах
+# нескольких размеров. Для каждого случая берётся лучшее время из --repeat запусков;
+# подготовка данных в замер не входит.
+#
+# --save сохраняет результаты в JSON (базовую линию), --compare сравнивает текущий прогон с базовой
+# линией и завершается с кодом 1, если какой-то случай стал медленнее больше чем на --threshold.
+# Базовую линию стоит снимать на той же машине, что и сравнение.
+#
+# Запуск:
+#     python -m benchmarks.suite --save baseline.json
+#     python -m benchmarks.suite --compare baseline.json --threshold 0.2
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from benchmarks.synthetic import iter_product_dicts, write_catalog
+from src.category import Category
+from src.loading import load_categories_from_json
+from src.product import Product
+from src.product_registry import ProductRegistry
+
+# подготовка (размер -> состояние) и замеряемый шаг (состояние -> что угодно)
+Case = Tuple[Callable[[int], Any], Callable[[Any], Any]]
+
+
+def _products(size: int) -> List[Product]:
+    return [Product._from_trusted(**d) for d in iter_product_dicts(size)]
+
+
+def _product_init(dicts: List[Dict[str, Any]]) -> List[Product]:
+    return [Product(d["name"], d["description"], d["price"], d["quantity"]) for d in dicts]
+
+
+def _new_product_setup(size: int) -> List[Dict[str, Any]]:
+    # каждый второй словарь — повтор уже добавленного товара с более высокой ценой
+    # (снижение цены в new_product запросило бы подтверждение через input())
+    dicts = list(iter_product_dicts(size))
+    for i, d in enumerate(dicts):
+        d["name"] = f"Товар {i // 2}"
+        if i % 2:
+            d["price"] = dicts[i - 1]["price"] + 1
+    return dicts
+
+
+def _new_product(dicts: List[Dict[str, Any]]) -> ProductRegistry:
+    registry = ProductRegistry()
+    for d in dicts:
+        Product.new_product(d, registry)
+    return registry
+
+
+def _category_str(category: Category) -> None:
+    for _ in range(1000):
+        str(category)
+
+
+def _load_setup(size: int) -> str:
+    fd, path = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    write_catalog(path, size)
+    return path
+
+
+def _load(path: str) -> List[Category]:
+    try:
+        return load_categories_from_json(path)
+    finally:
+        os.unlink(path)
+
+
+CASES: Dict[str, Case] = {
+    "product_init": (lambda size: list(iter_product_dicts(size)), _product_init),
+    "new_product": (_new_product_setup, _new_product),
+    "category_init": (_products, lambda products: Category("Bench", "Bench", products)),
+    "category_str_x1000": (lambda size: Category("Bench", "Bench", _products(size)), _category_str),
+    "category_products": (lambda size: Category("Bench", "Bench", _products(size)), lambda c: c.products),
+    "load_json": (_load_setup, _load),
+}
+
+
+def run_case(case: Case, size: int, repeat: int) -> float:
+    """Лучшее время из repeat запусков; перед каждым запуском данные готовятся заново."""
+    setup, step = case
+    best = float("inf")
+    for _ in range(repeat):
+        state = setup(size)
+        start = time.perf_counter()
+        step(state)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_suite(names: List[str], scales: List[int], repeat: int) -> Dict[str, float]:
+    """Прогоняет выбранные случаи на всех размерах; ключи результатов — "случай[размер]"."""
+    results: Dict[str, float] = {}
+    for name in names:
+        for size in scales:
+            results[f"{name}[{size}]"] = seconds = run_case(CASES[name], size, repeat)
+            print(f"{name + f'[{size}]':>32} {seconds * 1000:>12.2f} мс", flush=True)
+    return results
+
+
+def compare(
+    baseline: Dict[str, float], current: Dict[str, float], threshold: float, min_delta: float = 0.001
+) -> List[str]:
+    """
+    Печатает сравнение с базовой линией и возвращает случаи, замедлившиеся больше чем на threshold.
+    Замедление меньше min_delta секунд не считается регрессией: на коротких случаях это шум.
+    """
+    regressions: List[str] = []
+    print(f"{'случай':>32} {'база, мс':>12} {'сейчас, мс':>12} {'отношение':>10}")
+    for key, seconds in current.items():
+        base = baseline.get(key)
+        if base is None:
+            print(f"{key:>32} {'—':>12} {seconds * 1000:>12.2f}")
+            continue
+        ratio = seconds / base if base else float("inf")
+        mark = ""
+        if ratio > 1 + threshold and seconds - base > min_delta:
+            regressions.append(key)
+            mark = "  РЕГРЕССИЯ"
+        print(f"{key:>32} {base * 1000:>12.2f} {seconds * 1000:>12.2f} {ratio:>10.2f}{mark}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scales", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=list(CASES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", help="сохранить результаты в JSON-файл")
+    parser.add_argument("--compare", help="сравнить с базовой линией из JSON-файла")
+    parser.add_argument("--threshold", type=float, default=0.2, help="допустимое замедление (0.2 = 20%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0, help="меньшее замедление считается шумом")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.cases, args.scales, args.repeat)
+
+    if args.save:
+        meta = {"python": sys.version.split()[0], "platform": platform.platform(), "repeat": args.repeat}
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"meta": meta, "results": results}, f, ensure_ascii=False, indent=2)
+        print(f"результаты сохранены в {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(baseline, results, args.threshold, args.min_delta_ms / 1000)
+        if regressions:
+            print(f"замедлились больше чем на {args.threshold:.0%}: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+# Генераторы синтетических каталогов для бенчмарков.
+# Файлы пишутся потоково, поэтому можно получить каталог на 10M товаров,
+# не держа его целиком в памяти генератора.
+
+from __future__ import annotations
+
+import json
+import random
+from typing import Any, Dict, Iterator, List
+
+DESCRIPTIONS = [
+    "256GB, Серый цвет, 200MP камера",
+    "512GB, Gray space",
+    "1024GB, Синий",
+    "Фоновая подсветка",
+    "128GB, Черный цвет",
+]
+
+
+def iter_product_dicts(n_products: int, seed: int = 0) -> Iterator[Dict[str, Any]]:
+    """Отдаёт словари товаров в формате data/products.json."""
+    rnd = random.Random(seed)
+    for i in range(n_products):
+        yield {
+            "name": f"Товар {i}",
+            "description": DESCRIPTIONS[i % len(DESCRIPTIONS)],
+            "price": round(rnd.uniform(100.0, 250000.0), 2),
+            "quantity": rnd.randint(0, 100),
+        }
+
+
+def make_catalog(n_products: int, per_category: int = 1000, seed: int = 0) -> List[Dict[str, Any]]:
+    """Строит каталог целиком в памяти (для небольших масштабов)."""
+    catalog: List[Dict[str, Any]] = []
+    for i, product in enumerate(iter_product_dicts(n_products, seed)):
+        if i % per_category == 0:
+            n = len(catalog)
+            catalog.append({"name": f"Категория {n}", "description": f"Описание категории {n}", "products": []})
+        catalog[-1]["products"].append(product)
+    return catalog
+
+
+def write_catalog(path: str, n_products: int, per_category: int = 1000, seed: int = 0) -> None:
+    """Потоково записывает каталог из n_products товаров в JSON-файл."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("[")
+        products = iter_product_dicts(n_products, seed)
+        written = 0
+        n = 0
+        while written < n_products:
+            size = min(per_category, n_products - written)
+            if n:
+                f.write(",")
+            f.write(f'{{"name": "Категория {n}", "description": "Описание категории {n}", "products": [')
+            for j in range(size):
+                if j:
+                    f.write(",")
+                f.write(json.dumps(next(products), ensure_ascii=False))
+            f.write("]}")
+            written += size
+            n += 1
+        f.write("]")
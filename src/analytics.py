@@ -0,0 +1,165 @@
+# Пакетная аналитика по товарам: стоимость остатков, количество единиц,
+# минимальная / максимальная / средняя цена и гистограмма цен.
+# Цены и остатки один раз собираются в колонки (массивы numpy), дальше всё
+# считается векторно, без цикла по Product.__add__. ProductTable отдаёт колонки
+# без копирования, а Category кэширует свои колонки до следующего изменения товаров
+# (Category.price_columns). Если numpy не установлен, используется та же логика на чистом Python.
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Tuple, Union
+
+from src.product import Product
+from src.product_table import ProductTable
+
+try:
+    import numpy as np
+except ImportError:  # numpy — необязательная зависимость
+    np = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from src.category import Category
+
+Products = Union[Iterable[Product], ProductTable, "Category"]
+# (цены, остатки): массивы numpy или array("d") / array("q")
+Columns = Tuple[Any, Any]
+
+_get_price = attrgetter("price")
+_get_quantity = attrgetter("quantity")
+
+
+@dataclass(frozen=True)
+class InventoryStats:
+    """Сводные показатели по набору товаров."""
+
+    count: int
+    total_units: int
+    total_value: float
+    min_price: Optional[float]
+    max_price: Optional[float]
+    mean_price: Optional[float]
+
+
+def product_columns(products: Iterable[Product]) -> Columns:
+    """Собирает колонки цен и остатков из товаров (numpy-массивы только для чтения или array, если numpy нет)."""
+    if iter(products) is products:
+        # одноразовый итератор: обходим дважды, поэтому сохраняем товары
+        products = list(products)
+    prices = array("d", map(_get_price, products))
+    quantities = array("q", map(_get_quantity, products))
+    if np is not None:
+        np_prices, np_quantities = np.frombuffer(prices, dtype=np.float64), np.frombuffer(quantities, dtype=np.int64)
+        np_prices.flags.writeable = False
+        np_quantities.flags.writeable = False
+        return np_prices, np_quantities
+    return prices, quantities
+
+
+def _columns(products: Products) -> Columns:
+    if isinstance(products, ProductTable):
+        if np is not None:
+            return products.as_numpy()
+        return products.prices, products.quantities
+    price_columns = getattr(products, "price_columns", None)
+    if price_columns is not None:
+        return price_columns()  # type: ignore[no-any-return]
+    return product_columns(products)  # type: ignore[arg-type]
+
+
+def _concat(parts: List[Columns]) -> Columns:
+    if np is not None:
+        if not parts:
+            return np.empty(0, dtype=np.float64), np.empty(0, dtype=np.int64)
+        return np.concatenate([p[0] for p in parts]), np.concatenate([p[1] for p in parts])
+    prices: array[float] = array("d")
+    quantities: array[int] = array("q")
+    for part_prices, part_quantities in parts:
+        prices.extend(part_prices)
+        quantities.extend(part_quantities)
+    return prices, quantities
+
+
+def inventory_stats(products: Products) -> InventoryStats:
+    """Считает сводные показатели по товарам за один проход по колонкам."""
+    return _stats(*_columns(products))
+
+
+def _stats(prices: Any, quantities: Any) -> InventoryStats:
+    count = len(prices)
+    if count == 0:
+        return InventoryStats(0, 0, 0.0, None, None, None)
+
+    if np is not None:
+        return InventoryStats(
+            count=count,
+            total_units=int(quantities.sum()),
+            total_value=float(np.dot(prices, quantities)),
+            min_price=float(prices.min()),
+            max_price=float(prices.max()),
+            mean_price=float(prices.mean()),
+        )
+    return InventoryStats(
+        count=count,
+        total_units=sum(quantities),
+        total_value=sum(p * q for p, q in zip(prices, quantities)),
+        min_price=min(prices),
+        max_price=max(prices),
+        mean_price=sum(prices) / count,
+    )
+
+
+def price_histogram(
+    products: Products, bins: int = 10, price_range: Optional[Tuple[float, float]] = None
+) -> Tuple[List[int], List[float]]:
+    """
+    Возвращает гистограмму цен: (количество товаров в каждом интервале, границы интервалов).
+    Границ на одну больше, чем интервалов; последний интервал включает правую границу (как в numpy).
+    """
+    if bins <= 0:
+        raise ValueError("bins должен быть положительным")
+    return _histogram(_columns(products)[0], bins, price_range)
+
+
+def _histogram(prices: Any, bins: int, price_range: Optional[Tuple[float, float]]) -> Tuple[List[int], List[float]]:
+
+    if np is not None:
+        counts, edges = np.histogram(prices, bins=bins, range=price_range)
+        return counts.tolist(), edges.tolist()
+
+    if price_range is not None:
+        low, high = price_range
+    elif len(prices):
+        low, high = min(prices), max(prices)
+    else:
+        low, high = 0.0, 1.0
+    if low == high:
+        low, high = low - 0.5, high + 0.5
+    width = (high - low) / bins
+    edges = [low + i * width for i in range(bins)] + [high]
+    counts = [0] * bins
+    for price in prices:
+        if low <= price <= high:
+            counts[min(int((price - low) / width), bins - 1)] += 1
+    return counts, edges
+
+
+def _catalog_columns(categories: Iterable[Category]) -> Columns:
+    # колонки каждой категории берутся из её кэша, без копирования списков товаров
+    return _concat([category.price_columns() for category in categories])
+
+
+def catalog_stats(categories: Iterable[Category]) -> InventoryStats:
+    """Сводные показатели по всем товарам списка категорий."""
+    return _stats(*_catalog_columns(categories))
+
+
+def catalog_price_histogram(
+    categories: Iterable[Category], bins: int = 10, price_range: Optional[Tuple[float, float]] = None
+) -> Tuple[List[int], List[float]]:
+    """Гистограмма цен по всем товарам списка категорий."""
+    if bins <= 0:
+        raise ValueError("bins должен быть положительным")
+    return _histogram(_catalog_columns(categories)[0], bins, price_range)
@@ -0,0 +1,82 @@
+# Асинхронный API каталога для сервисов на asyncio.
+# Загрузка файлов выполняется в пуле потоков (asyncio.to_thread) и не блокирует цикл событий;
+# несколько файлов читаются конкурентно. Счётчики Category потокобезопасны, а контекст
+# (в том числе активный реестр счётчиков) передаётся в поток вместе с задачей.
+# Смена цены вместо input() спрашивает асинхронную политику подтверждения: готовые
+# approve_price_change / reject_price_change или любую корутину (product, new_price) -> bool.
+
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Iterable, List, Optional, Tuple
+
+from src.category import Category
+from src.loading import load_categories_from_json
+from src.product import Product
+
+PricePolicy = Callable[[Product, float], Awaitable[bool]]
+
+
+async def approve_price_change(product: Product, new_price: float) -> bool:
+    """Политика: снижение цены подтверждается автоматически."""
+    return True
+
+
+async def reject_price_change(product: Product, new_price: float) -> bool:
+    """Политика: любое снижение цены отклоняется."""
+    return False
+
+
+async def load_categories_from_json_async(file_path: str, backend: str = "json") -> List[Category]:
+    """Асинхронно загружает категории из JSON-файла, не блокируя цикл событий."""
+    return await asyncio.to_thread(load_categories_from_json, file_path, backend)
+
+
+async def load_many_async(file_paths: Iterable[str], backend: str = "json") -> List[Category]:
+    """Конкурентно загружает несколько файлов; категории возвращаются в порядке файлов."""
+    results = await asyncio.gather(*(load_categories_from_json_async(path, backend) for path in file_paths))
+    return [category for categories in results for category in categories]
+
+
+async def update_price_async(product: Product, new_price: float, policy: PricePolicy = reject_price_change) -> bool:
+    """
+    Меняет цену товара; снижение цены применяется, только если его одобрила асинхронная политика.
+    Если пока политика решала, цена товара изменилась, политика спрашивается снова уже о новом снижении.
+    Нулевая и отрицательная цена отклоняется. Возвращает True, если цена изменена.
+    """
+    if new_price <= 0:
+        return False
+    while new_price < product.price:
+        seen_price = product.price
+        approved = await policy(product, new_price)
+        if product.price == seen_price:
+            return approved and product.update_price(new_price)
+        # пока политика думала, цену изменили: её решение относилось к другому снижению — спрашиваем снова
+    return product.update_price(new_price)
+
+
+async def update_prices_async(
+    updates: Iterable[Tuple[Product, float]],
+    policy: PricePolicy = reject_price_change,
+    concurrency: Optional[int] = None,
+) -> List[bool]:
+    """
+    Конкурентно применяет пары (товар, новая цена). concurrency ограничивает число
+    одновременно ожидающих политику обновлений. Возвращает результаты в порядке обновлений.
+    """
+    items = list(updates)
+    if concurrency is None:
+        return list(await asyncio.gather(*(update_price_async(p, price, policy) for p, price in items)))
+    if concurrency <= 0:
+        raise ValueError("concurrency должен быть положительным")
+
+    # вместо задачи и семафора на каждое обновление — concurrency воркеров с общим итератором
+    results = [False] * len(items)
+    pending = iter(enumerate(items))
+
+    async def worker() -> None:
+        for i, (product, new_price) in pending:
+            results[i] = await update_price_async(product, new_price, policy)
+
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, len(items)))))
+    return results
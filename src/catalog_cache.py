@@ -0,0 +1,131 @@
+# Кэширующий загрузчик каталога для процессов, которые много раз читают одни и те же JSON-файлы.
+# CatalogCache.load(path) запоминает уже разобранный и проверенный каталог в виде неизменяемых
+# кортежей (как decode_catalog) и при каждом вызове создаёт из них новые Category/Product
+# через Product.from_rows и Category.from_validated: повторно не разбирается JSON и не проверяются поля, а вызывающий
+# получает собственные объекты — испортить кэш через них нельзя.
+# Ключ кэша — (путь, время изменения в наносекундах, размер): изменённый файл загружается заново.
+# В памяти хранится не больше maxsize каталогов, вытесняется давно не использованный (LRU).
+# С snapshot_dir каталог дополнительно сохраняется на диск бинарным снимком (src/snapshot.py),
+# и после перезапуска процесса загружается из снимка без разбора JSON; снимки устаревших версий
+# файла удаляются при записи новой.
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from src.category import Category
+from src.json_backends import CategoryRow, decode_catalog
+from src.product import Product
+from src.snapshot import open_snapshot, write_snapshot_rows
+
+# (путь, время изменения в нс, размер)
+CacheKey = Tuple[str, int, int]
+
+
+def _file_key(file_path: str) -> CacheKey:
+    path = os.path.realpath(file_path)
+    stat = os.stat(path)
+    return path, stat.st_mtime_ns, stat.st_size
+
+
+class CatalogCache:
+    """LRU-кэш загруженных каталогов с необязательным кэшем снимков на диске."""
+
+    def __init__(self, maxsize: int = 8, snapshot_dir: Optional[str] = None, backend: str = "auto"):
+        if maxsize <= 0:
+            raise ValueError("maxsize должен быть положительным")
+        self.maxsize = maxsize
+        self.snapshot_dir = snapshot_dir
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self._entries: OrderedDict[CacheKey, List[CategoryRow]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(self, file_path: str) -> List[Category]:
+        """Загружает каталог из файла или из кэша; каждый вызов возвращает новые объекты."""
+        return [
+            Category.from_validated(name, description, Product.from_rows(rows, validate=False))
+            for name, description, rows in self._rows(file_path)
+        ]
+
+    def _rows(self, file_path: str) -> List[CategoryRow]:
+        key = _file_key(file_path)
+        with self._lock:
+            rows = self._entries.get(key)
+            if rows is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return rows
+            self.misses += 1
+
+        rows = self._read_snapshot(key)
+        from_disk = rows is not None
+        if rows is None:
+            with open(key[0], "rb") as f:
+                rows = decode_catalog(f.read(), self.backend)
+            self._write_snapshot(key, rows)
+
+        with self._lock:
+            if from_disk:
+                self.disk_hits += 1
+            self._entries[key] = rows
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return rows
+
+    def _snapshot_path(self, key: CacheKey) -> Tuple[str, str]:
+        """(префикс снимков этого файла, путь снимка его текущей версии)."""
+        assert self.snapshot_dir is not None
+        prefix = hashlib.sha1(key[0].encode("utf-8")).hexdigest()
+        return prefix, os.path.join(self.snapshot_dir, f"{prefix}-{key[1]}-{key[2]}.snap")
+
+    def _read_snapshot(self, key: CacheKey) -> Optional[List[CategoryRow]]:
+        if self.snapshot_dir is None:
+            return None
+        _, path = self._snapshot_path(key)
+        try:
+            with open_snapshot(path) as snapshot:
+                return snapshot.to_rows()
+        except (FileNotFoundError, ValueError):
+            # снимка нет или он повреждён — загружаем JSON заново
+            return None
+
+    def _write_snapshot(self, key: CacheKey, rows: List[CategoryRow]) -> None:
+        if self.snapshot_dir is None:
+            return
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+        prefix, path = self._snapshot_path(key)
+        # пишем во временный файл и переименовываем: читатель не увидит недописанный снимок
+        fd, tmp_path = tempfile.mkstemp(dir=self.snapshot_dir, suffix=".tmp")
+        os.close(fd)
+        try:
+            write_snapshot_rows(rows, tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        for name in os.listdir(self.snapshot_dir):
+            if name.startswith(prefix + "-") and os.path.join(self.snapshot_dir, name) != path:
+                os.unlink(os.path.join(self.snapshot_dir, name))
+
+    def clear(self) -> None:
+        """Очищает кэш в памяти (снимки на диске остаются)."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return (
+            f"CatalogCache(size={len(self._entries)}, maxsize={self.maxsize}, "
+            f"hits={self.hits}, misses={self.misses}, disk_hits={self.disk_hits})"
+        )
@@ -0,0 +1,184 @@
+# Индекс товаров по нескольким категориям для быстрых запросов без get_products() и полного прохода.
+# CatalogIndex держит три отсортированных индекса:
+#   цены всех товаров — выборка по диапазону цен за O(log n + k);
+#   цены товаров в наличии (quantity > 0) — тот же диапазон только по имеющимся товарам;
+#   названия без учёта регистра — автодополнение по префиксу (отсортированный массив вместо дерева:
+#   все названия с общим префиксом лежат подряд, их начало находится бинарным поиском).
+# Индекс обновляется инкрементально: категории сообщают о новых и удалённых товарах (Category._subscribe),
+# а товары — об изменении цены, остатка и названия (индекс подписан на них как владелец).
+# Товар, лежащий в нескольких категориях, индексируется один раз.
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from operator import itemgetter
+from typing import Dict, Generic, Iterable, List, Optional, TypeVar
+
+from src.category import Category
+from src.product import Product
+
+_T = TypeVar("_T", float, str)
+
+
+class _SortedIndex(Generic[_T]):
+    """
+    Отсортированные ключи и параллельный список номеров товаров.
+    Ключи хранятся отдельно от номеров, а не кортежами: бинарный поиск и сортировка
+    сравнивают числа/строки напрямую, что в разы быстрее сравнения кортежей.
+    """
+
+    def __init__(self) -> None:
+        self.keys: List[_T] = []
+        self.ids: List[int] = []
+
+    def insert(self, key: _T, i: int) -> None:
+        pos = bisect_right(self.keys, key)
+        self.keys.insert(pos, key)
+        self.ids.insert(pos, i)
+
+    def remove(self, key: _T, i: int) -> None:
+        keys, ids = self.keys, self.ids
+        pos = bisect_left(keys, key)
+        while pos < len(keys) and keys[pos] == key:
+            if ids[pos] == i:
+                del keys[pos], ids[pos]
+                return
+            pos += 1
+
+    def extend(self, keys: List[_T], ids: List[int]) -> None:
+        """Добавляет пачку: одна сортировка по ключу (устойчивая, равные ключи — в порядке добавления)."""
+        all_keys, all_ids = self.keys + keys, self.ids + ids
+        if len(all_keys) < 2:
+            self.keys, self.ids = all_keys, all_ids
+            return
+        order = itemgetter(*sorted(range(len(all_keys)), key=all_keys.__getitem__))
+        self.keys = list(order(all_keys))
+        self.ids = list(order(all_ids))
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+
+class CatalogIndex:
+    """Вторичные индексы товаров каталога: диапазон цен, наличие, префикс названия."""
+
+    def __init__(self, categories: Iterable[Category] = ()):
+        self._products: Dict[int, Product] = {}  # номер в индексе -> товар
+        self._ids: Dict[Product, int] = {}  # товар -> номер в индексе
+        self._refs: Dict[Product, int] = {}  # в скольких категориях (с повторами) лежит товар
+        self._next_id = 0
+        self._by_price: _SortedIndex[float] = _SortedIndex()
+        self._in_stock: _SortedIndex[float] = _SortedIndex()
+        self._by_name: _SortedIndex[str] = _SortedIndex()
+        self.add_categories(categories)
+
+    def add_category(self, category: Category) -> None:
+        """Индексирует товары категории и подписывается на добавление и удаление товаров."""
+        self.add_categories([category])
+
+    def add_categories(self, categories: Iterable[Category]) -> None:
+        """Индексирует товары нескольких категорий одной пачкой (одна сортировка на все категории)."""
+        products: List[Product] = []
+        for category in categories:
+            category._subscribe(self)
+            products.extend(category.products_view())
+        self._add(products)
+
+    def _on_products_added(self, category: Category, products: List[Product]) -> None:
+        self._add(products)
+
+    def _on_products_removed(self, category: Category, products: List[Product]) -> None:
+        refs = self._refs
+        for product in products:
+            count = refs.get(product)
+            if count is None:
+                continue
+            if count > 1:
+                refs[product] = count - 1  # товар ещё лежит в другой категории
+                continue
+            del refs[product]
+            i = self._ids.pop(product)
+            del self._products[i]
+            product._detach(self)
+            self._by_price.remove(product.price, i)
+            if product.quantity > 0:
+                self._in_stock.remove(product.price, i)
+            self._by_name.remove(product.name.casefold(), i)
+
+    def _add(self, products: List[Product]) -> None:
+        refs = self._refs
+        new: List[Product] = []
+        for product in products:
+            count = refs.get(product, 0)
+            refs[product] = count + 1
+            if not count:
+                new.append(product)  # товар из нескольких категорий индексируется один раз
+        if not new:
+            return
+        start = self._next_id
+        self._next_id += len(new)
+        for i, product in enumerate(new, start):
+            self._ids[product] = i
+            self._products[i] = product
+            product._attach(self)
+
+        if len(new) == 1:
+            # одиночная вставка — бинарный поиск и сдвиг хвоста
+            product = new[0]
+            self._by_price.insert(product.price, start)
+            if product.quantity > 0:
+                self._in_stock.insert(product.price, start)
+            self._by_name.insert(product.name.casefold(), start)
+            return
+        numbers = list(range(start, start + len(new)))
+        prices = [p.price for p in new]
+        self._by_price.extend(prices, numbers)
+        stocked = [j for j, p in enumerate(new) if p.quantity > 0]
+        self._in_stock.extend([prices[j] for j in stocked], [start + j for j in stocked])
+        self._by_name.extend([p.name.casefold() for p in new], numbers)
+
+    def _on_product_changed(self, product: Product, old_price: float, old_quantity: int, times: int = 1) -> None:
+        # в индексе у товара одна запись, сколько бы раз он ни лежал в категориях — times не нужен
+        i = self._ids[product]
+        if product.price != old_price:
+            self._by_price.remove(old_price, i)
+            self._by_price.insert(product.price, i)
+        if old_quantity > 0:
+            self._in_stock.remove(old_price, i)
+        if product.quantity > 0:
+            self._in_stock.insert(product.price, i)
+
+    def _on_product_renamed(self, product: Product, old_name: str) -> None:
+        i = self._ids[product]
+        self._by_name.remove(old_name.casefold(), i)
+        self._by_name.insert(product.name.casefold(), i)
+
+    def price_range(
+        self, low: Optional[float] = None, high: Optional[float] = None, in_stock: bool = False
+    ) -> List[Product]:
+        """Товары с ценой в диапазоне [low, high] (границы включаются), по возрастанию цены."""
+        index = self._in_stock if in_stock else self._by_price
+        start = 0 if low is None else bisect_left(index.keys, low)
+        stop = len(index) if high is None else bisect_right(index.keys, high)
+        products = self._products
+        return [products[i] for i in index.ids[start:stop]]
+
+    def autocomplete(self, prefix: str, limit: Optional[int] = 10) -> List[Product]:
+        """Товары, название которых начинается с prefix (без учёта регистра), в алфавитном порядке."""
+        prefix = prefix.casefold()
+        names, ids = self._by_name.keys, self._by_name.ids
+        result: List[Product] = []
+        for pos in range(bisect_left(names, prefix), len(names)):
+            if not names[pos].startswith(prefix) or len(result) == limit:
+                break
+            result.append(self._products[ids[pos]])
+        return result
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, product: object) -> bool:
+        return product in self._ids
+
+    def __repr__(self) -> str:
+        return f"CatalogIndex(products={len(self._ids)})"
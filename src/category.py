@@ -11,21 +11,98 @@
 # Category.products — вместо ручной сборки строки просто использует str(product) для каждого товара.
 # Category.__str__ — считает общее количество всех единиц товара (quantity) и выводит "Название категории,
 # количество продуктов: X шт.".
+# Товары хранятся в ProductRegistry (список + индекс по названию), поэтому merge_product()
+# объединяет дубликаты по правилу Product.new_product за O(1).
+# Категория держит накопленные итоги (общий остаток и стоимость остатков): они обновляются за O(1)
+# в add_product/merge_product и по уведомлениям товаров об изменении цены или остатка,
+# поэтому __str__ больше не проходит по всем товарам. consistency_checks = True включает сверку итогов
+# с пересчётом после каждого изменения (для тестов).
+# add_products() (он же extend()) добавляет пачку товаров за один проход: проверка типа идёт
+# прямо во время обхода (подходит и для генераторов), счётчик product_count обновляется один раз.
+# Счётчики category_count и product_count хранятся в потокобезопасном реестре счётчиков (src/counters.py):
+# Category.category_count читает/записывает активный реестр, а каждая категория увеличивает счётчики
+# реестра, который был активен при её создании (и с экземпляра читает именно его).
+# Строка products кэшируется и сбрасывается при добавлении товара, изменении цены/остатка
+# или переименовании товара (описание в строку не входит и кэш не сбрасывает);
+# iter_product_lines() и write_products() отдают строки постранично, не собирая общую строку.
+# stats() и price_histogram() считают аналитику по товарам категории векторно (см. src/analytics.py);
+# колонки цен и остатков кэшируются и сбрасываются вместе с кэшем строки products.
+# products_view() отдаёт товары без копирования — представлением только для чтения (ProductsView);
+# get_products() по-прежнему возвращает копию для тех, кому нужен собственный список.
+# remove_products() удаляет пачку товаров за один проход; find_product() ищет товар по названию за O(1).
+# discard() убирает категорию из каталога целиком: удаляет товары и уменьшает оба счётчика.
+# Подписчики (_subscribe, например CatalogIndex) узнают о добавленных и удалённых товарах
+# через _on_products_added / _on_products_removed.
+# from_validated() создаёт категорию из уже проверенных товаров без проверок типов (пара к Product.from_rows).
+# Обновление счётчиков в __init__ замеряется как этап "counters" внутри instrument() (src/instrumentation.py).
+# Колоночное хранение (columnar=True или enable_columnar(), src/columnar.py) держит цены и остатки
+# в массивах, обновляемых на месте; sorted_products(), top_products() и filter_products() отдают
+# ProductsView по позициям из этих колонок (без columnar — по кэшу price_columns()).
+# reprice() пакетно меняет цены товаров по политике снижения и возвращает отчёт (src/repricing.py).
 
 from __future__ import annotations
 
-from typing import List
+import math
+import weakref
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Protocol, TextIO, Tuple
 
-from src.product import Product
+from src.analytics import Columns, InventoryStats, inventory_stats, price_histogram, product_columns
+from src.columnar import ColumnarStore, argsort, mask_positions, top_k
+from src.counters import CounterRegistry, current_registry
+from src.instrumentation import stage
+from src.product import Product, _gc_paused
+from src.product_registry import ProductRegistry, ProductsView
+from src.repricing import DecreasePolicy, NewPrices, RepricingReport, deny_decrease, reprice
 
 
-class Category:
+class CategoryListener(Protocol):
+    """Подписчик категории (например, индекс каталога), которому сообщают о новых товарах."""
+
+    def _on_products_added(self, category: Category, products: List[Product]) -> None: ...
+
+    def _on_products_removed(self, category: Category, products: List[Product]) -> None: ...
+
+
+class _Counter:
+    """Счётчик Category, хранящийся в реестре счётчиков. С экземпляра читается реестр этой категории."""
+
+    def __init__(self, name: str, doc: str):
+        self.name = name
+        self.__doc__ = doc
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> int:
+        if instance is None or isinstance(instance, type):
+            return current_registry().get(self.name)
+        return int(instance._Category__counters.get(self.name))
+
+
+class _ClassCounter(_Counter):
+    """Счётчик на уровне класса: присваивание Category.product_count = 0 записывает значение в активный реестр."""
+
+    def __set__(self, instance: Any, value: int) -> None:
+        current_registry().set(self.name, value)
+
+
+_CATEGORY_COUNT_DOC = "Количество созданных категорий"
+_PRODUCT_COUNT_DOC = "Общий счетчик всех продуктов всех категорий"
+
+
+class _CategoryMeta(type):
+    """Метакласс: счётчики Category как атрибуты класса, хранящиеся в активном реестре счётчиков."""
+
+    category_count = _ClassCounter("category_count", _CATEGORY_COUNT_DOC)
+    product_count = _ClassCounter("product_count", _PRODUCT_COUNT_DOC)
+
+
+class Category(metaclass=_CategoryMeta):
     """Класс, представляющий категорию товаров."""
 
-    category_count: int = 0
-    product_count: int = 0  # общий счетчик всех продуктов всех категорий
+    category_count = _Counter("category_count", _CATEGORY_COUNT_DOC)
+    product_count = _Counter("product_count", _PRODUCT_COUNT_DOC)
+    consistency_checks: bool = False  # сверять накопленные итоги с пересчётом после каждого изменения
 
-    def __init__(self, name: str, description: str, products: List[Product]):
+    def __init__(self, name: str, description: str, products: List[Product], columnar: bool = False):
         # Проверка типов
         if not isinstance(name, str):
             raise TypeError("name должен быть строкой")
@@ -33,16 +110,40 @@ class Category:
             raise TypeError("description должен быть строкой")
         if not isinstance(products, list):
             raise TypeError("products должен быть списком")
-        if not all(isinstance(p, Product) for p in products):
-            raise TypeError("в products должны быть только объекты класса Product")
 
+        self.__setup(name, description, products, "в products должны быть только объекты класса Product")
+        if columnar:
+            self.enable_columnar()
+
+    @classmethod
+    def from_validated(cls, name: str, description: str, products: List[Product]) -> Category:
+        """
+        Создаёт категорию без проверок типов названия, описания и товаров — для уже проверенных данных
+        (например, товаров из Product.from_rows). Итоги, индекс и счётчики обновляются как в __init__.
+        """
+        category = cls.__new__(cls)
+        with _gc_paused():
+            category.__setup(name, description, products, None)
+        return category
+
+    def __setup(self, name: str, description: str, products: List[Product], error: Optional[str]) -> None:
         self.name: str = name
         self.description: str = description
-        self.__products: List[Product] = products  # приватный список товаров
+        self.__products: ProductRegistry = ProductRegistry()  # приватный список товаров с индексом
+        self.__total_quantity: int = 0
+        self.__total_value: float = 0.0
+        self.__rendered: Optional[str] = None  # кэш строки products
+        self.__columns: Optional[Columns] = None  # кэш колонок цен и остатков для аналитики
+        self.__counters: CounterRegistry = current_registry()
+        self.__listeners: Tuple[weakref.ref[CategoryListener], ...] = ()  # слабые ссылки на подписчиков
+        self.__columnar: Optional[ColumnarStore] = None  # колонки, обновляемые на месте (enable_columnar)
+        self.__discarded = False  # категория убрана из каталога (discard)
+        added = self.__extend(products, error)
 
         # обновляем счетчики
-        Category.category_count += 1
-        Category.product_count += len(products)
+        with stage("counters"):
+            self.__counters.add("category_count")
+            self.__counters.add("product_count", added)
 
     def add_product(self, product: Product) -> None:
         """Добавляет товар в категорию и увеличивает счетчик продуктов."""
@@ -50,21 +151,272 @@ class Category:
             raise TypeError("Можно добавить только объект класса Product")
 
         self.__products.append(product)
-        Category.product_count += 1
+        self.__track(product)
+        if self.__columnar is not None:
+            self.__columnar.append([product])
+        self.__counters.add("product_count")
+        if Category.consistency_checks:
+            self.verify_totals()
+        self.__announce([product])
+
+    def add_products(self, products: Iterable[Product]) -> int:
+        """
+        Добавляет товары пачкой: один проход с проверкой типов, одно расширение списка
+        и одно обновление счетчика. Принимает любой итерируемый объект, в том числе генератор.
+        Если встретился не Product, ни один товар не добавляется. Возвращает число добавленных товаров.
+        """
+        added = self.__extend(products, "Можно добавить только объекты класса Product")
+        self.__counters.add("product_count", added)
+        return added
+
+    extend = add_products
+
+    def __extend(self, products: Iterable[Product], error: Optional[str]) -> int:
+        """Добавляет товары; error — текст TypeError для не-Product, None — без проверки типов."""
+
+        def checked() -> Iterator[Product]:
+            for product in products:
+                if not isinstance(product, Product):
+                    raise TypeError(error)
+                yield product
+
+        start = len(self.__products)
+        self.__products.extend(products if error is None else checked())
+        # то же, что __track для каждого товара, но итоги и кэши обновляются один раз на пачку
+        Product._attach_many(islice(self.__products, start, None), self)
+        quantity, value = 0, 0.0
+        for product in islice(self.__products, start, None):
+            product_quantity = product.quantity
+            quantity += product_quantity
+            value += product.price * product_quantity
+        if len(self.__products) > start:
+            self.__rendered = None
+            self.__columns = None
+            self.__total_quantity += quantity
+            self.__total_value += value
+            if self.__columnar is not None:
+                self.__columnar.append(self.__products[start:])
+        if Category.consistency_checks:
+            self.verify_totals()
+        if self.__listeners and len(self.__products) > start:
+            self.__announce(self.__products[start:])
+        return len(self.__products) - start
+
+    def merge_product(self, product_data: Dict[str, Any]) -> Product:
+        """
+        Добавляет товар из словаря или объединяет его с уже имеющимся товаром с тем же названием
+        (количество складывается, цена обновляется через сеттер). Поиск дубликата — O(1).
+        """
+        size = len(self.__products)
+        product = Product.new_product(product_data, self.__products)
+        if len(self.__products) > size:
+            self.__track(product)
+            if self.__columnar is not None:
+                self.__columnar.append([product])
+            self.__counters.add("product_count")
+            if Category.consistency_checks:
+                self.verify_totals()
+            self.__announce([product])
+        return product
+
+    def remove_products(self, products: Iterable[Product]) -> int:
+        """
+        Удаляет товары из категории (сравнение по идентичности) за один проход по списку товаров
+        и уменьшает счетчик продуктов. Товары, которых нет в категории, пропускаются. Возвращает число удалённых.
+        """
+        removed = self.__products.remove(products)
+        for product in removed:
+            product._detach(self)
+            self.__total_quantity -= product.quantity
+            self.__total_value -= product.price * product.quantity
+        if removed:
+            if not self.__products:
+                # без товаров итоги точно нулевые — не копим ошибку округления
+                self.__total_quantity, self.__total_value = 0, 0.0
+            self.__rendered = None
+            self.__columns = None
+            if self.__columnar is not None:
+                self.__columnar.rebuild(self.__products.view())
+            self.__counters.add("product_count", -len(removed))
+            if Category.consistency_checks:
+                self.verify_totals()
+            self.__announce(removed, added=False)
+        return len(removed)
+
+    def discard(self) -> int:
+        """
+        Убирает категорию из каталога: удаляет все её товары (как remove_products — подписчики, например
+        CatalogIndex, их забывают, product_count уменьшается) и уменьшает category_count.
+        Повторный вызов ничего не делает. Возвращает число удалённых товаров.
+        """
+        if self.__discarded:
+            return 0
+        self.__discarded = True
+        removed = self.remove_products(self.get_products())
+        self.__counters.add("category_count", -1)
+        return removed
+
+    def find_product(self, name: str) -> Optional[Product]:
+        """Возвращает первый товар категории с таким названием или None (O(1), по индексу)."""
+        return self.__products.find(name)
+
+    def _subscribe(self, listener: CategoryListener) -> None:
+        """Подписывает listener на добавление и удаление товаров категории (хранится слабая ссылка)."""
+        alive = tuple(ref for ref in self.__listeners if ref() is not None)
+        self.__listeners = alive + (weakref.ref(listener),)
+
+    def __announce(self, products: List[Product], added: bool = True) -> None:
+        for ref in self.__listeners:
+            listener = ref()
+            if listener is None:
+                continue
+            if added:
+                listener._on_products_added(self, products)
+            else:
+                listener._on_products_removed(self, products)
+
+    def __track(self, product: Product) -> None:
+        """Учитывает товар в накопленных итогах и подписывается на его изменения."""
+        product._attach(self)
+        self.__rendered = None
+        self.__columns = None
+        self.__total_quantity += product.quantity
+        self.__total_value += product.price * product.quantity
+
+    def _on_product_changed(self, product: Product, old_price: float, old_quantity: int, times: int = 1) -> None:
+        """
+        Обновляет накопленные итоги и сбрасывает кэш строки после изменения цены или остатка товара.
+        times — сколько раз товар лежит в категории.
+        """
+        self.__rendered = None
+        self.__columns = None
+        self.__total_quantity += (product.quantity - old_quantity) * times
+        self.__total_value += (product.price * product.quantity - old_price * old_quantity) * times
+        if self.__columnar is not None:
+            self.__columnar.update(product)
+        if Category.consistency_checks:
+            self.verify_totals()
+
+    def _on_product_renamed(self, product: Product, old_name: str) -> None:
+        """Обновляет индекс по названию и сбрасывает кэш строки после переименования товара."""
+        self.__rendered = None
+        self.__products.rename(product, old_name)
+
+    @property
+    def total_quantity(self) -> int:
+        """Общее количество единиц товара на складе (O(1))."""
+        return self.__total_quantity
+
+    @property
+    def total_value(self) -> float:
+        """Общая стоимость остатков: сумма цена × количество (O(1))."""
+        return self.__total_value
+
+    def verify_totals(self) -> None:
+        """Пересчитывает итоги по товарам и выбрасывает AssertionError, если накопленные значения разошлись."""
+        quantity = sum(p.quantity for p in self.__products)
+        value = math.fsum(p.price * p.quantity for p in self.__products)
+        value_matches = math.isclose(value, self.__total_value, rel_tol=1e-9, abs_tol=1e-6) or (
+            math.isnan(value) and math.isnan(self.__total_value)  # цена NaN допустима, а NaN != NaN
+        )
+        if quantity != self.__total_quantity or not value_matches:
+            raise AssertionError(
+                f"Итоги категории {self.name!r} расходятся: остаток {self.__total_quantity} != {quantity}, "
+                f"стоимость {self.__total_value} != {value}"
+            )
 
     def get_products(self) -> List[Product]:
         """Возвращает копию списка товаров (чтение без возможности изменить напрямую)."""
-        return list(self.__products)
+        return self.__products.to_list()
+
+    def products_view(self) -> ProductsView:
+        """Возвращает представление товаров только для чтения, без копирования списка (O(1))."""
+        return self.__products.view()
+
+    def price_columns(self) -> Columns:
+        """
+        Колонки (цены, остатки) товаров категории — снимок на момент вызова (и с columnar, и без):
+        последующие изменения товаров в нём не отражаются. Строятся один раз до следующего изменения.
+        """
+        if self.__columnar is not None:
+            return self.__columnar.columns()
+        if self.__columns is None:
+            self.__columns = product_columns(self.__products)
+        return self.__columns
+
+    def __query_columns(self) -> Columns:
+        # запросы сразу превращают колонки в позиции, поэтому им снимок не нужен — берём колонки хранилища
+        if self.__columnar is not None:
+            return self.__columnar._live_columns()
+        return self.price_columns()
+
+    def enable_columnar(self) -> ColumnarStore:
+        """
+        Включает колоночное хранение цен и остатков (src/columnar.py): колонки обновляются на месте
+        при каждом изменении, и сортировки, выборки и price_columns() не пересобирают их из товаров.
+        """
+        if self.__columnar is None:
+            self.__columnar = ColumnarStore(self.__products.view())
+        return self.__columnar
+
+    @property
+    def columnar(self) -> bool:
+        """Включено ли колоночное хранение."""
+        return self.__columnar is not None
+
+    def sorted_products(self, key: str = "price", descending: bool = False) -> ProductsView:
+        """Товары, упорядоченные по цене, остатку или стоимости остатка ("price", "quantity", "value")."""
+        return self.__products.view(argsort(self.__query_columns(), key, descending))
+
+    def top_products(self, k: int, key: str = "price") -> ProductsView:
+        """k товаров с наибольшей ценой, остатком или стоимостью остатка, по убыванию."""
+        return self.__products.view(top_k(self.__query_columns(), k, key))
+
+    def filter_products(self, mask: Any) -> ProductsView:
+        """
+        Товары, отобранные булевой маской по колонкам price_columns(), например
+        prices, quantities = category.price_columns(); category.filter_products((prices > 1000) & (quantities > 0)).
+        """
+        return self.__products.view(mask_positions(self.__query_columns(), mask))
+
+    def stats(self) -> InventoryStats:
+        """Возвращает сводные показатели: стоимость остатков, число единиц, мин./макс./средняя цена."""
+        return inventory_stats(self)
+
+    def price_histogram(
+        self, bins: int = 10, price_range: Optional[Tuple[float, float]] = None
+    ) -> Tuple[List[int], List[float]]:
+        """Возвращает гистограмму цен товаров категории."""
+        return price_histogram(self, bins, price_range)
+
+    def reprice(self, new_prices: NewPrices, policy: DecreasePolicy = deny_decrease) -> RepricingReport:
+        """Пакетно меняет цены товаров категории без input() (см. src/repricing.py). Возвращает отчёт."""
+        return reprice(self.__products, new_prices, policy)
 
     @property
     def products(self) -> str:
-        """Возвращает строку со списком всех продуктов, используя __str__ каждого продукта."""
-        return "\n".join(str(p) for p in self.__products) + ("\n" if self.__products else "")
+        """Возвращает строку со списком всех продуктов, используя __str__ каждого продукта (с кэшированием)."""
+        if self.__rendered is None:
+            self.__rendered = "".join(self.iter_product_lines())
+        return self.__rendered
+
+    def iter_product_lines(self, offset: int = 0, limit: Optional[int] = None) -> Iterator[str]:
+        """Отдаёт строки товаров (str(product) с переводом строки), начиная с offset, не более limit штук."""
+        stop = None if limit is None else offset + limit
+        for product in islice(self.__products, offset, stop):
+            yield f"{product}\n"
+
+    def write_products(self, fp: TextIO, offset: int = 0, limit: Optional[int] = None) -> int:
+        """Записывает строки товаров в файловый объект без сборки общей строки. Возвращает число строк."""
+        written = 0
+        for line in self.iter_product_lines(offset, limit):
+            fp.write(line)
+            written += 1
+        return written
 
     def __repr__(self) -> str:
         return f"Category(name={self.name!r}, products={len(self.__products)})"
 
     def __str__(self) -> str:
         """Возвращает строку: Название категории, количество продуктов на складе: X шт."""
-        total_quantity = sum(p.quantity for p in self.__products)
-        return f"{self.name}, количество продуктов на складе: {total_quantity} шт."
+        return f"{self.name}, количество продуктов на складе: {self.__total_quantity} шт."
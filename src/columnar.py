@@ -0,0 +1,179 @@
+# Колоночное хранение цен и остатков категории и запросы по ним: сортировка, top-k, фильтрация.
+# ColumnarStore держит цены и остатки товаров категории в массивах numpy (или array("d") / array("q"),
+# если numpy не установлен) в порядке товаров категории и обновляет их на месте: при добавлении
+# товаров колонки дописываются, при изменении цены или остатка меняется одна ячейка, поэтому
+# запросы не пересобирают колонки из объектов после каждого изменения (как Category.price_columns()).
+# Включается через Category(..., columnar=True) или Category.enable_columnar().
+# columns() (а через него и Category.price_columns()) отдаёт копию колонок, которая не меняется вместе
+# с товарами — как снимок, который строит Category без колоночного хранения.
+#
+# Запросы работают с любыми колонками (цены, остатки) и возвращают позиции товаров в категории:
+#   argsort — порядок по цене, остатку или стоимости остатка (цена × количество, как Product.__add__);
+#   top_k — k лучших через np.argpartition (O(n)) и сортировку только этих k;
+#   mask_positions — позиции товаров, отобранных булевой маской.
+# Category превращает позиции в ProductsView — представление без копирования товаров.
+
+from __future__ import annotations
+
+import heapq
+from array import array
+from itertools import compress
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Sequence
+
+from src.analytics import Columns
+from src.product import Product
+
+try:
+    import numpy as np
+except ImportError:  # numpy — необязательная зависимость
+    np = None  # type: ignore[assignment]
+
+SORT_KEYS = ("price", "quantity", "value")
+# позиции товаров: массив индексов numpy или список (без numpy)
+Positions = Any
+
+_get_price = attrgetter("price")
+_get_quantity = attrgetter("quantity")
+
+
+def _key_column(columns: Columns, key: str) -> Any:
+    prices, quantities = columns
+    if key == "price":
+        return prices
+    if key == "quantity":
+        return quantities
+    if key == "value":
+        if np is not None:
+            return prices * quantities
+        return [p * q for p, q in zip(prices, quantities)]
+    raise ValueError(f"Неизвестный ключ сортировки: {key!r}, доступны: {', '.join(SORT_KEYS)}")
+
+
+def argsort(columns: Columns, key: str = "price", descending: bool = False) -> Positions:
+    """Позиции товаров, упорядоченные по key; равные значения сохраняют порядок товаров в категории."""
+    column = _key_column(columns, key)
+    if np is not None:
+        return np.argsort(-column if descending else column, kind="stable")
+    return sorted(range(len(column)), key=column.__getitem__, reverse=descending)
+
+
+def top_k(columns: Columns, k: int, key: str = "price") -> Positions:
+    """Позиции k товаров с наибольшим key, по убыванию (np.argpartition — без сортировки всего массива)."""
+    column = _key_column(columns, key)
+    k = max(0, min(k, len(column)))
+    if np is None:
+        return heapq.nlargest(k, range(len(column)), key=column.__getitem__)
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+    negated = -np.asarray(column)
+    if k < len(negated):
+        candidates = np.argpartition(negated, k - 1)[:k]
+    else:
+        candidates = np.arange(len(negated))
+    return candidates[np.argsort(negated[candidates], kind="stable")]
+
+
+def mask_positions(columns: Columns, mask: Any) -> Positions:
+    """Позиции товаров, для которых mask истинна; mask — булев массив длиной с колонки."""
+    size = len(columns[0])
+    if len(mask) != size:
+        raise ValueError(f"длина маски {len(mask)} не совпадает с числом товаров {size}")
+    if np is not None:
+        return np.flatnonzero(mask)
+    return list(compress(range(size), mask))
+
+
+class ColumnarStore:
+    """Колонки цен и остатков товаров категории, обновляемые на месте."""
+
+    def __init__(self, products: Sequence[Product]):
+        self._size = 0
+        self._rows: Dict[int, int] = {}  # id товара -> его первая строка
+        self._duplicates: Dict[int, List[int]] = {}  # остальные строки товаров, лежащих в категории дважды
+        self._snapshot: Optional[Columns] = None  # копия для columns(), до следующего изменения
+        if np is not None:
+            self._prices = np.empty(max(len(products), 16), dtype=np.float64)
+            self._quantities = np.empty(max(len(products), 16), dtype=np.int64)
+        else:
+            self._prices = array("d")
+            self._quantities = array("q")
+        self.append(products)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, products: Sequence[Product]) -> None:
+        """Дописывает строки товаров в конец колонок."""
+        start, count = self._size, len(products)
+        self._snapshot = None
+        rows = self._rows
+        for row, key in enumerate(map(id, products), start):
+            if rows.setdefault(key, row) != row:
+                self._duplicates.setdefault(key, []).append(row)
+        if np is None:
+            self._prices.extend(map(_get_price, products))
+            self._quantities.extend(map(_get_quantity, products))
+        else:
+            end = start + count
+            if end > len(self._prices):
+                # удвоение ёмкости (np.resize создаёт новые массивы)
+                capacity = max(end, 2 * len(self._prices))
+                self._prices = np.resize(self._prices, capacity)
+                self._quantities = np.resize(self._quantities, capacity)
+            self._prices[start:end] = np.fromiter(map(_get_price, products), dtype=np.float64, count=count)
+            self._quantities[start:end] = np.fromiter(map(_get_quantity, products), dtype=np.int64, count=count)
+        self._size += count
+
+    def update(self, product: Product) -> None:
+        """Записывает текущие цену и остаток товара в его строки."""
+        key = id(product)
+        row = self._rows.get(key)
+        if row is None:
+            return
+        self._snapshot = None
+        price, quantity = product.price, product.quantity
+        self._prices[row] = price
+        self._quantities[row] = quantity
+        for row in self._duplicates.get(key, ()):
+            self._prices[row] = price
+            self._quantities[row] = quantity
+
+    def rebuild(self, products: Sequence[Product]) -> None:
+        """Пересобирает колонки заново (после удаления товаров позиции сдвигаются)."""
+        self._size = 0
+        self._snapshot = None
+        self._rows.clear()
+        self._duplicates.clear()
+        if np is None:
+            self._prices = array("d")
+            self._quantities = array("q")
+        else:
+            self._prices = np.empty(max(len(products), 16), dtype=np.float64)
+            self._quantities = np.empty(max(len(products), 16), dtype=np.int64)
+        self.append(products)
+
+    def columns(self) -> Columns:
+        """
+        (цены, остатки) — копия на момент вызова, как у Category.price_columns() без колоночного хранения:
+        последующие изменения в ней не отражаются. С numpy — массивы только для чтения.
+        Копия строится один раз до следующего изменения.
+        """
+        if self._snapshot is None:
+            if np is None:
+                self._snapshot = array("d", self._prices), array("q", self._quantities)
+            else:
+                prices, quantities = self._prices[: self._size].copy(), self._quantities[: self._size].copy()
+                prices.flags.writeable = False
+                quantities.flags.writeable = False
+                self._snapshot = prices, quantities
+        return self._snapshot
+
+    def _live_columns(self) -> Columns:
+        """(цены, остатки) без копирования — меняются вместе с товарами; только для немедленных запросов."""
+        if np is None:
+            return self._prices, self._quantities
+        return self._prices[: self._size], self._quantities[: self._size]
+
+    def __repr__(self) -> str:
+        return f"ColumnarStore(products={self._size})"
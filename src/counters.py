@@ -0,0 +1,118 @@
+# Счётчики каталога.
+# AtomicCounter — целочисленный счётчик с блокировкой: инкременты из разных потоков не теряются.
+# CounterRegistry — набор именованных счётчиков. Реестров может быть несколько: активный реестр
+# выбирается через use_registry() (contextvars), по умолчанию используется общий на процесс.
+# Реестр можно выгрузить в словарь (snapshot) — например, в процессе-воркере multiprocessing —
+# и прибавить к другому реестру через merge().
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Mapping, Union
+
+
+class AtomicCounter:
+    """Потокобезопасный целочисленный счётчик."""
+
+    __slots__ = ("_value", "_lock")
+
+    def __init__(self, value: int = 0):
+        self._value = value
+        self._lock = threading.Lock()
+
+    def add(self, amount: int = 1) -> int:
+        """Атомарно прибавляет amount и возвращает новое значение."""
+        with self._lock:
+            self._value += amount
+            return self._value
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    @value.setter
+    def value(self, value: int) -> None:
+        with self._lock:
+            self._value = value
+
+    def __repr__(self) -> str:
+        return f"AtomicCounter({self._value})"
+
+
+class CounterRegistry:
+    """Набор именованных атомарных счётчиков."""
+
+    def __init__(self) -> None:
+        self._counters: Dict[str, AtomicCounter] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str) -> AtomicCounter:
+        """Возвращает счётчик по имени, создавая его при первом обращении."""
+        counter = self._counters.get(name)
+        if counter is None:
+            with self._lock:
+                counter = self._counters.setdefault(name, AtomicCounter())
+        return counter
+
+    def add(self, name: str, amount: int = 1) -> int:
+        """Атомарно прибавляет amount к счётчику name."""
+        return self.counter(name).add(amount)
+
+    def get(self, name: str) -> int:
+        """Текущее значение счётчика (0, если его ещё нет)."""
+        counter = self._counters.get(name)
+        return counter.value if counter is not None else 0
+
+    def set(self, name: str, value: int) -> None:
+        """Устанавливает значение счётчика."""
+        self.counter(name).value = value
+
+    def snapshot(self) -> Dict[str, int]:
+        """Возвращает значения всех счётчиков в виде словаря (его можно передать между процессами)."""
+        with self._lock:
+            counters = list(self._counters.items())
+        return {name: counter.value for name, counter in counters}
+
+    def merge(self, other: Union[CounterRegistry, Mapping[str, int]]) -> None:
+        """Прибавляет к своим счётчикам значения другого реестра или снимка snapshot()."""
+        values = other.snapshot() if isinstance(other, CounterRegistry) else other
+        for name, amount in values.items():
+            self.add(name, amount)
+
+    def reset(self) -> None:
+        """Обнуляет все счётчики."""
+        for name in self.snapshot():
+            self.set(name, 0)
+
+    def __repr__(self) -> str:
+        return f"CounterRegistry({self.snapshot()})"
+
+
+_default_registry = CounterRegistry()
+_current_registry: ContextVar[CounterRegistry] = ContextVar("counter_registry", default=_default_registry)
+
+
+def default_registry() -> CounterRegistry:
+    """Общий для процесса реестр счётчиков."""
+    return _default_registry
+
+
+def current_registry() -> CounterRegistry:
+    """Активный реестр счётчиков в текущем контексте."""
+    return _current_registry.get()
+
+
+@contextmanager
+def use_registry(registry: CounterRegistry) -> Iterator[CounterRegistry]:
+    """
+    Делает registry активным внутри блока with.
+    Новые потоки начинают с реестра по умолчанию; для пула потоков запускайте задачи
+    через contextvars.copy_context().run или входите в use_registry внутри задачи.
+    """
+    token = _current_registry.set(registry)
+    try:
+        yield registry
+    finally:
+        _current_registry.reset(token)
@@ -0,0 +1,125 @@
+# Инкрементальное обновление каталога по полной выгрузке поставщика.
+# apply_delta() сравнивает новую выгрузку (кортежи decode_catalog) с уже загруженным списком Category
+# по названиям категорий и товаров и применяет только отличия:
+#   новые категории и товары добавляются;
+#   у существующих товаров меняются цена и остаток, если они отличаются;
+#   товары и категории, которых нет в выгрузке, удаляются (категории — через Category.discard(),
+#   поэтому уменьшаются счётчики и их товары пропадают из подписанных индексов).
+# Повторы товара внутри одной категории выгрузки объединяются по правилу Product.new_product
+# (количество складывается, остаётся более высокая цена) — тем же _merge_row, что и при загрузке шардов.
+# Сравнение — один проход по выгрузке с поиском товара по индексу категории (O(1)); объекты
+# создаются, а итоги, кэши и индексы пересчитываются только для изменившихся товаров.
+# Удаление из категории — один проход по её списку на всю пачку удалений.
+# Результат — ChangeSet со списками изменений вместо перезагрузки всего каталога.
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Iterable, List, Tuple
+
+from src.category import Category
+from src.ingest import ShardRows, _merge_row
+from src.json_backends import CategoryRow, decode_catalog
+from src.product import Product
+
+# (категория, товар)
+ProductRef = Tuple[str, str]
+
+
+@dataclass
+class ChangeSet:
+    """Изменения, применённые apply_delta."""
+
+    added_categories: List[str] = field(default_factory=list)
+    removed_categories: List[str] = field(default_factory=list)
+    added: List[ProductRef] = field(default_factory=list)
+    updated: List[ProductRef] = field(default_factory=list)
+    removed: List[ProductRef] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return (
+            len(self.added_categories)
+            + len(self.removed_categories)
+            + len(self.added)
+            + len(self.updated)
+            + len(self.removed)
+        )
+
+    def __str__(self) -> str:
+        return (
+            f"категорий: +{len(self.added_categories)} -{len(self.removed_categories)}, "
+            f"товаров: +{len(self.added)} ~{len(self.updated)} -{len(self.removed)}"
+        )
+
+
+def _merge_feed(feed: Iterable[CategoryRow]) -> ShardRows:
+    """Группирует выгрузку по категориям; повторы товара объединяются как в Product.new_product."""
+    merged: ShardRows = {}
+    for cat_name, description, rows in feed:
+        products = merged.setdefault(cat_name, (description, {}))[1]
+        for row in rows:
+            _merge_row(products, *row)
+    return merged
+
+
+def apply_delta(categories: List[Category], feed: Iterable[CategoryRow]) -> ChangeSet:
+    """
+    Приводит список categories (изменяется на месте) к выгрузке feed и возвращает применённые изменения.
+    Строки feed должны быть уже проверены (как их возвращает decode_catalog).
+    """
+    changes = ChangeSet()
+    merged = _merge_feed(feed)
+    existing = {category.name: category for category in categories}
+
+    for cat_name, (description, rows) in merged.items():
+        category = existing.get(cat_name)
+        if category is None:
+            categories.append(
+                Category.from_validated(
+                    cat_name,
+                    description,
+                    Product.from_rows(((name, *row) for name, row in rows.items()), validate=False),
+                )
+            )
+            changes.added_categories.append(cat_name)
+            changes.added.extend((cat_name, name) for name in rows)
+            continue
+
+        new_products: List[Product] = []
+        for name, (p_description, price, quantity) in rows.items():
+            product = category.find_product(name)
+            if product is None:
+                new_products.append(Product._from_trusted(name, p_description, price, quantity))
+                changes.added.append((cat_name, name))
+                continue
+            changed = False
+            if product.price != price:
+                product.update_price(price)
+                changed = True
+            if product.quantity != quantity:
+                product.quantity = quantity
+                changed = True
+            if changed:
+                changes.updated.append((cat_name, name))
+
+        if len(rows) < len(category.products_view()) + len(new_products):
+            # в категории есть товары, которых нет в выгрузке
+            stale = [p for p in category.products_view() if p.name not in rows]
+            category.remove_products(stale)
+            changes.removed.extend((cat_name, p.name) for p in stale)
+        if new_products:
+            category.add_products(new_products)
+
+    for category in categories:
+        if category.name not in merged:
+            category.discard()
+            changes.removed_categories.append(category.name)
+    if changes.removed_categories:
+        categories[:] = [category for category in categories if category.name in merged]
+    return changes
+
+
+def apply_delta_from_json(categories: List[Category], file_path: str, backend: str = "auto") -> ChangeSet:
+    """Читает выгрузку из JSON-файла (формат data/products.json) и применяет её через apply_delta."""
+    with open(file_path, "rb") as f:
+        return apply_delta(categories, decode_catalog(f.read(), backend))
@@ -0,0 +1,108 @@
+# Потоковая выгрузка каталога в файл: JSON (та же схема, что читает load_categories_from_json),
+# NDJSON (одна строка на товар) и CSV (одна запись на товар).
+# Строки копятся пачками по chunk_size товаров и пишутся в файл одним write(), поэтому память
+# не зависит от размера каталога: в ней одновременно лежит только текущая пачка строк.
+# Товары читаются через Category.products_view(), без копирования списков.
+# В NDJSON и CSV у каждой строки есть название и описание категории; категория без товаров
+# записывается одной строкой с пустыми полями товара. Прочитать эти форматы обратно можно через
+# iter_categories_from_ndjson / iter_categories_from_csv (src/loading.py).
+
+from __future__ import annotations
+
+import csv
+from json.encoder import encode_basestring
+from typing import Any, Iterable, List, TextIO, Tuple
+
+from src.category import Category
+
+CSV_FIELDS = ("category", "category_description", "name", "description", "price", "quantity")
+_CHUNK_SIZE = 10_000
+
+# строка в JSON без экранирования кириллицы (C-реализация из модуля json); цены пишутся через repr(float)
+_encode = encode_basestring
+# бесконечную цену и NaN Product допускает, а repr() даёт для них не JSON — пишем токены, как json.dumps
+_NON_FINITE = {"inf": "Infinity", "-inf": "-Infinity", "nan": "NaN"}
+
+
+def _price(value: float) -> str:
+    text = repr(value)
+    return _NON_FINITE.get(text, text)
+
+
+def export_json(categories: Iterable[Category], fp: TextIO, chunk_size: int = _CHUNK_SIZE) -> int:
+    """Пишет категории JSON-массивом в формате data/products.json. Возвращает число записанных товаров."""
+    written = 0
+    buf: List[str] = ["["]
+    for n, category in enumerate(categories):
+        buf.append(
+            f'{"," if n else ""}\n{{"name": {_encode(category.name)}, '
+            f'"description": {_encode(category.description)}, "products": ['
+        )
+        for i, product in enumerate(category.products_view()):
+            buf.append(
+                f'{"," if i else ""}\n{{"name": {_encode(product.name)}, '
+                f'"description": {_encode(product.description)}, '
+                f'"price": {_price(product.price)}, "quantity": {product.quantity}}}'
+            )
+            written += 1
+            if len(buf) >= chunk_size:
+                fp.write("".join(buf))
+                buf.clear()
+        buf.append("]}")
+    buf.append("\n]\n")
+    fp.write("".join(buf))
+    return written
+
+
+def export_ndjson(categories: Iterable[Category], fp: TextIO, chunk_size: int = _CHUNK_SIZE) -> int:
+    """Пишет по одной JSON-строке на товар (с названием и описанием категории). Возвращает число товаров."""
+    written = 0
+    buf: List[str] = []
+    for category in categories:
+        head = f'{{"category": {_encode(category.name)}, "category_description": {_encode(category.description)}'
+        products = category.products_view()
+        if not products:
+            buf.append(f"{head}}}\n")
+        for product in products:
+            buf.append(
+                f'{head}, "name": {_encode(product.name)}, "description": {_encode(product.description)}, '
+                f'"price": {_price(product.price)}, "quantity": {product.quantity}}}\n'
+            )
+            written += 1
+            if len(buf) >= chunk_size:
+                fp.write("".join(buf))
+                buf.clear()
+    fp.write("".join(buf))
+    return written
+
+
+def export_csv(categories: Iterable[Category], fp: TextIO, chunk_size: int = _CHUNK_SIZE) -> int:
+    """
+    Пишет CSV с заголовком CSV_FIELDS, по одной записи на товар. Возвращает число товаров.
+    Файл нужно открывать с newline="", как того требует модуль csv.
+    """
+    writer = csv.writer(fp)
+    writer.writerow(CSV_FIELDS)
+    written = 0
+    rows: List[Tuple[Any, ...]] = []
+    for category in categories:
+        products = category.products_view()
+        if not products:
+            rows.append((category.name, category.description, "", "", "", ""))
+        for product in products:
+            rows.append(
+                (
+                    category.name,
+                    category.description,
+                    product.name,
+                    product.description,
+                    product.price,
+                    product.quantity,
+                )
+            )
+            written += 1
+            if len(rows) >= chunk_size:
+                writer.writerows(rows)
+                rows.clear()
+    writer.writerows(rows)
+    return written
@@ -0,0 +1,104 @@
+# Параллельная загрузка каталога из нескольких JSON-файлов (шардов) формата data/products.json.
+# Каждый шард разбирается и проверяется в отдельном процессе (ProcessPoolExecutor); процессы
+# возвращают простые кортежи, без объектов Product, чтобы не тратить время на их сериализацию.
+# В основном процессе категории объединяются по названию, а товары с одинаковым названием —
+# по правилу Product.new_product: количество складывается, остаётся более высокая цена.
+# Строки уже проверены в воркерах, поэтому товары и категории создаются без повторных проверок
+# (Product.from_rows(validate=False), Category.from_validated).
+# Объединение шардов и создание объектов идут в основном процессе последовательно: объекты
+# Product/Category нельзя дёшево передать между процессами (pickle стоит столько же, сколько создание).
+# Эту последовательную часть отдельно замеряет benchmarks/bench_ingest.py.
+
+from __future__ import annotations
+
+import glob
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.category import Category
+from src.product import Product, _validate_fields
+
+# название товара -> (описание, цена, количество)
+ProductRows = Dict[str, Tuple[str, float, int]]
+# название категории -> (описание, товары)
+ShardRows = Dict[str, Tuple[str, ProductRows]]
+
+
+def _merge_row(products: ProductRows, name: str, description: str, price: float, quantity: int) -> None:
+    """Добавляет строку товара или объединяет её с уже имеющейся (как Product.new_product)."""
+    existing = products.get(name)
+    if existing is None:
+        products[name] = (description, float(price), quantity)
+    else:
+        products[name] = (existing[0], max(existing[1], float(price)), existing[2] + quantity)
+
+
+def parse_shard(path: str) -> ShardRows:
+    """Читает и проверяет один шард, объединяя дубликаты внутри него."""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    shard: ShardRows = {}
+    for cat in data:
+        name, description = cat["name"], cat["description"]
+        if not isinstance(name, str) or not isinstance(description, str):
+            raise TypeError(f"{path}: название и описание категории должны быть строками")
+        products = shard.setdefault(name, (description, {}))[1]
+        for p in cat["products"]:
+            _validate_fields(p["name"], p["description"], p["price"], p["quantity"])
+            _merge_row(products, p["name"], p["description"], p["price"], p["quantity"])
+    return shard
+
+
+def resolve_shards(source: str, pattern: str = "*.json") -> List[str]:
+    """Возвращает отсортированный список файлов: из папки (по pattern) или по glob-шаблону."""
+    if os.path.isdir(source):
+        paths = glob.glob(os.path.join(source, pattern))
+    else:
+        paths = glob.glob(source)
+    if not paths:
+        raise FileNotFoundError(f"Не найдено ни одного файла каталога: {source}")
+    return sorted(paths)
+
+
+def merge_shards(shards: Iterable[ShardRows]) -> ShardRows:
+    """Объединяет шарды: категории — по названию, товары — по правилу Product.new_product."""
+    merged: ShardRows = {}
+    for shard in shards:
+        for cat_name, (description, products) in shard.items():
+            target = merged.setdefault(cat_name, (description, {}))[1]
+            for name, (p_description, price, quantity) in products.items():
+                _merge_row(target, name, p_description, price, quantity)
+    return merged
+
+
+def parse_shards(paths: Sequence[str], max_workers: Optional[int] = None) -> List[ShardRows]:
+    """Разбирает шарды в пуле процессов (max_workers=1 или один файл — в текущем процессе)."""
+    if max_workers == 1 or len(paths) == 1:
+        return [parse_shard(path) for path in paths]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(parse_shard, paths))
+
+
+def build_categories(merged: ShardRows) -> List[Category]:
+    """Создаёт категории и товары из объединённых (и уже проверенных) строк."""
+    return [
+        Category.from_validated(
+            cat_name,
+            description,
+            Product.from_rows(((name, *row) for name, row in rows.items()), validate=False),
+        )
+        for cat_name, (description, rows) in merged.items()
+    ]
+
+
+def ingest_catalog(source: str, max_workers: Optional[int] = None, pattern: str = "*.json") -> List[Category]:
+    """
+    Загружает каталог из папки или glob-шаблона с JSON-шардами.
+    Шарды разбираются параллельно в max_workers процессах (по умолчанию — по числу ядер);
+    max_workers=1 разбирает их последовательно в текущем процессе.
+    """
+    paths = resolve_shards(source, pattern)
+    return build_categories(merge_shards(parse_shards(paths, max_workers)))
@@ -0,0 +1,121 @@
+# Инструментирование загрузки каталога: таймеры этапов и счётчики.
+# Включается явно блоком `with instrument() as stats:` — внутри него загрузчики (src/loading.py)
+# и Category записывают время этапов (чтение файла, декодирование JSON, создание товаров,
+# создание категорий, обновление счётчиков) и счётчики (прочитано байт, создано товаров и категорий)
+# в объект LoadStats. Активный LoadStats хранится в contextvars, как активный реестр счётчиков.
+# Без instrument() каждый замер стоит одного чтения ContextVar: stage() возвращает общий пустой
+# контекстный менеджер, count() сразу выходит.
+# Этапы могут быть вложенными (например, "counters" входит в "categories"), время этапа суммируется
+# по всем его вхождениям. Вместо или вместе с LoadStats можно передать хук on_stage(name, seconds).
+# profile_call() запускает одну функцию под cProfile или tracemalloc и возвращает результат и отчёт.
+
+from __future__ import annotations
+
+import cProfile
+import pstats
+import time
+import tracemalloc
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, TypeVar, Union
+
+StageHook = Callable[[str, float], None]
+_T = TypeVar("_T")
+
+
+@dataclass
+class LoadStats:
+    """Время этапов (в секундах) и счётчики одного или нескольких вызовов загрузчика."""
+
+    stages: Dict[str, float] = field(default_factory=dict)
+    counts: Dict[str, int] = field(default_factory=dict)
+    on_stage: Optional[StageHook] = field(default=None, repr=False, compare=False)
+
+    def add_time(self, name: str, seconds: float) -> None:
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+        if self.on_stage is not None:
+            self.on_stage(name, seconds)
+
+    def add_count(self, name: str, amount: int = 1) -> None:
+        self.counts[name] = self.counts.get(name, 0) + amount
+
+    def rate(self, counter: str = "products", stage: str = "total") -> float:
+        """Скорость: значение счётчика в секунду этапа (по умолчанию — товаров в секунду за всю загрузку)."""
+        seconds = self.stages.get(stage, 0.0)
+        return self.counts.get(counter, 0) / seconds if seconds else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Словарь для логов и метрик: этапы, счётчики и товаров в секунду."""
+        return {"stages": dict(self.stages), "counts": dict(self.counts), "products_per_second": self.rate()}
+
+
+_active: ContextVar[Optional[LoadStats]] = ContextVar("active_load_stats", default=None)
+_NULL = nullcontext()
+
+
+@contextmanager
+def instrument(stats: Optional[LoadStats] = None, on_stage: Optional[StageHook] = None) -> Iterator[LoadStats]:
+    """Включает сбор статистики внутри блока with и возвращает объект, в который она пишется."""
+    if stats is None:
+        stats = LoadStats(on_stage=on_stage)
+    elif on_stage is not None:
+        stats.on_stage = on_stage
+    token = _active.set(stats)
+    try:
+        yield stats
+    finally:
+        _active.reset(token)
+
+
+def current_stats() -> Optional[LoadStats]:
+    """Активный LoadStats или None, если инструментирование выключено."""
+    return _active.get()
+
+
+@contextmanager
+def _timed(stats: LoadStats, name: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats.add_time(name, time.perf_counter() - start)
+
+
+def stage(name: str) -> AbstractContextManager[None]:
+    """Замеряет время блока with как этап name (без instrument() ничего не делает)."""
+    stats = _active.get()
+    if stats is None:
+        return _NULL
+    return _timed(stats, name)
+
+
+def count(name: str, amount: int = 1) -> None:
+    """Прибавляет amount к счётчику name (без instrument() ничего не делает)."""
+    stats = _active.get()
+    if stats is not None:
+        stats.add_count(name, amount)
+
+
+def profile_call(
+    func: Callable[..., _T], *args: Any, mode: str = "cprofile", **kwargs: Any
+) -> Tuple[_T, Union[pstats.Stats, tracemalloc.Snapshot]]:
+    """
+    Выполняет func(*args, **kwargs) под профилировщиком и возвращает (результат, отчёт).
+    mode="cprofile" — отчёт pstats.Stats; mode="tracemalloc" — снимок выделений памяти tracemalloc.Snapshot.
+    """
+    if mode == "cprofile":
+        profiler = cProfile.Profile()
+        result = profiler.runcall(func, *args, **kwargs)
+        return result, pstats.Stats(profiler)
+    if mode == "tracemalloc":
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        try:
+            result = func(*args, **kwargs)
+            return result, tracemalloc.take_snapshot()
+        finally:
+            if started:
+                tracemalloc.stop()
+    raise ValueError(f"Неизвестный режим профилирования: {mode!r}, доступны: 'cprofile', 'tracemalloc'")
@@ -0,0 +1,114 @@
+# Выбор JSON-декодера для загрузки каталога.
+# Поддерживаются orjson, msgspec и стандартный json; "auto" берёт самый быстрый из установленных
+# и при их отсутствии откатывается на стандартный json.
+# decode_catalog() — типизированный путь: схема (названия/описания — строки, цена > 0,
+# количество — целое >= 0) проверяется один раз при декодировании, после чего товары можно
+# создавать без повторных проверок в Product.__init__. С msgspec проверку делает сам декодер,
+# поэтому для typed-загрузки "auto" выбирает msgspec первым. Ошибки схемы msgspec приводятся
+# к тем же TypeError/ValueError, что и на остальных декодерах.
+
+from __future__ import annotations
+
+import json
+from collections import deque
+from itertools import starmap
+from typing import Annotated, Any, Callable, Dict, List, Tuple
+
+from src.product import _validate_fields
+
+try:
+    import orjson
+except ImportError:  # orjson — необязательная зависимость
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:  # msgspec — необязательная зависимость
+    msgspec = None  # type: ignore[assignment]
+
+# (название, описание, цена, количество)
+ProductRow = Tuple[str, str, float, int]
+# (название, описание, товары)
+CategoryRow = Tuple[str, str, List[ProductRow]]
+
+BACKENDS = ("orjson", "msgspec", "json")
+
+if msgspec is not None:
+
+    class _ProductSchema(msgspec.Struct):
+        name: str
+        description: str
+        price: Annotated[float, msgspec.Meta(gt=0)]
+        quantity: Annotated[int, msgspec.Meta(ge=0)]
+
+    class _CategorySchema(msgspec.Struct):
+        name: str
+        description: str
+        products: List[_ProductSchema]
+
+    _catalog_decoder = msgspec.json.Decoder(List[_CategorySchema])
+
+
+def available_backends() -> List[str]:
+    """Список установленных декодеров в порядке предпочтения."""
+    modules: Dict[str, Any] = {"orjson": orjson, "msgspec": msgspec, "json": json}
+    return [name for name in BACKENDS if modules[name] is not None]
+
+
+def resolve_backend(backend: str = "auto") -> str:
+    """Проверяет название декодера; "auto" заменяет на самый быстрый из установленных."""
+    if backend == "auto":
+        return available_backends()[0]
+    if backend not in BACKENDS:
+        raise ValueError(f"Неизвестный JSON-декодер: {backend!r}, доступны: {', '.join(BACKENDS)}")
+    if backend not in available_backends():
+        raise ImportError(f"JSON-декодер {backend!r} не установлен")
+    return backend
+
+
+def get_decoder(backend: str = "auto") -> Callable[[bytes], Any]:
+    """Возвращает функцию, декодирующую байты JSON в объекты Python."""
+    name = resolve_backend(backend)
+    if name == "orjson":
+        return orjson.loads  # type: ignore[no-any-return]
+    if name == "msgspec":
+        return msgspec.json.decode  # type: ignore[no-any-return]
+    return json.loads
+
+
+def validate_catalog(data: Any) -> List[CategoryRow]:
+    """Проверяет структуру каталога и поля товаров, возвращает его в виде кортежей."""
+    if not isinstance(data, list):
+        raise TypeError("каталог должен быть JSON-массивом категорий")
+    catalog: List[CategoryRow] = []
+    for cat in data:
+        if not isinstance(cat["name"], str):
+            raise TypeError("name должен быть строкой")
+        if not isinstance(cat["description"], str):
+            raise TypeError("description должен быть строкой")
+        if not isinstance(cat["products"], list):
+            raise TypeError("products должен быть списком")
+        rows: List[ProductRow] = [(p["name"], p["description"], p["price"], p["quantity"]) for p in cat["products"]]
+        deque(starmap(_validate_fields, rows), maxlen=0)  # проверка всей пачки без цикла на Python
+        catalog.append((cat["name"], cat["description"], rows))
+    return catalog
+
+
+def decode_catalog(raw: bytes, backend: str = "auto") -> List[CategoryRow]:
+    """
+    Декодирует каталог и один раз проверяет схему. С msgspec схема проверяется самим декодером,
+    поэтому "auto" здесь предпочитает msgspec, если он установлен.
+    """
+    if backend == "auto" and msgspec is not None:
+        backend = "msgspec"
+    if resolve_backend(backend) != "msgspec":
+        return validate_catalog(get_decoder(backend)(raw))
+    try:
+        categories = _catalog_decoder.decode(raw)
+    except msgspec.ValidationError as exc:
+        # повторяем проверку на обычных объектах, чтобы тип и текст ошибки совпадали с другими декодерами
+        validate_catalog(msgspec.json.decode(raw))
+        raise TypeError(str(exc)) from exc
+    return [
+        (c.name, c.description, [(p.name, p.description, p.price, p.quantity) for p in c.products]) for c in categories
+    ]
@@ -1,22 +1,218 @@
 from __future__ import annotations
 
+import csv
 import json
-from typing import List
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
 
 from src.category import Category
+from src.instrumentation import count, stage
+from src.json_backends import decode_catalog, get_decoder
 from src.product import Product
+from src.string_pool import StringPool
 
+# Размер порции текста, которую потоковый загрузчик читает из файла за один раз.
+_CHUNK_SIZE = 1 << 16
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# хвост буфера, в котором мог оборваться литерал или число (true, -1.5e); пустой — если позиция в самом конце
+_TRUNCATED_TAIL = re.compile(r"[\w.+\-]*\Z")
 
-def load_categories_from_json(file_path: str) -> List[Category]:
+
+def _build_category(cat: Dict[str, Any]) -> Category:
+    """Создаёт категорию с товарами из словаря в формате data/products.json."""
+    products = [Product(p["name"], p["description"], p["price"], p["quantity"]) for p in cat["products"]]
+    return Category(cat["name"], cat["description"], products)
+
+
+def load_categories_from_json(
+    file_path: str, backend: str = "json", typed: bool = False, strings: Optional[StringPool] = None
+) -> List[Category]:
     """
     Загружает категории и товары из JSON-файла.
+    backend — JSON-декодер ("json", "orjson", "msgspec" или "auto", см. src/json_backends.py).
+    typed=True проверяет схему один раз при декодировании и создаёт товары без повторных проверок;
+    иначе поля товаров проверяются пачкой в Product.from_rows.
+    strings — пул строк (src/string_pool.py): одинаковые названия и описания товаров хранятся одним объектом,
+    а длинные описания — сжатыми, если пул создан с compress_from.
+    Внутри instrument() (src/instrumentation.py) записывает время этапов и счётчики загрузки.
+    """
+    with stage("total"):
+        with stage("read"):
+            with open(file_path, "rb") as f:
+                raw = f.read()
+        count("bytes_read", len(raw))
+
+        with stage("decode"):
+            if typed:
+                rows = decode_catalog(raw, backend)
+            else:
+                data = json.loads(raw) if backend == "json" else get_decoder(backend)(raw)
+                rows = [
+                    (
+                        cat["name"],
+                        cat["description"],
+                        [(p["name"], p["description"], p["price"], p["quantity"]) for p in cat["products"]],
+                    )
+                    for cat in data
+                ]
+        with stage("products"):
+            # без typed строки проверяются здесь — пачкой, с теми же ошибками, что у Product.__init__
+            product_lists = [Product.from_rows(products, not typed, strings) for _, _, products in rows]
+        with stage("categories"):
+            # без typed названия и описания категорий проверяет Category.__init__
+            make = Category.from_validated if typed else Category
+            categories = [
+                make(name, description, products) for (name, description, _), products in zip(rows, product_lists)
+            ]
+    count("categories", len(categories))
+    count("products", sum(len(products) for products in product_lists))
+    return categories
+
+
+def _may_be_truncated(exc: json.JSONDecodeError, buf: str) -> bool:
+    """
+    Могла ли ошибка raw_decode возникнуть из-за того, что буфер оборвался посреди элемента:
+    незакрытая строка, ошибка в самом конце буфера или недочитанный литерал/число (true, -1e) в его хвосте.
+    """
+    return exc.msg.startswith("Unterminated string") or _TRUNCATED_TAIL.match(buf, exc.pos) is not None
+
+
+def _iter_json_array(f: TextIO, chunk_size: int = _CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Поэлементно разбирает JSON-массив верхнего уровня, читая файл порциями.
+    В памяти одновременно держится только текущий элемент массива (и недочитанный хвост буфера).
+    Как и json.load, отклоняет данные после массива; синтаксическая ошибка внутри буфера выбрасывается
+    сразу, без дочитывания остатка файла.
+    """
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+    eof = False
+    read_size = chunk_size
+
+    def read_more() -> None:
+        nonlocal buf, pos, eof
+        chunk = f.read(read_size)
+        if not chunk:
+            eof = True
+        buf = buf[pos:] + chunk
+        pos = 0
+
+    def next_char() -> str:
+        nonlocal pos
+        while True:
+            pos = _WHITESPACE.match(buf, pos).end()  # type: ignore[union-attr]
+            if pos < len(buf):
+                return buf[pos]
+            if eof:
+                raise json.JSONDecodeError("Неожиданный конец файла", buf, pos)
+            read_more()
+
+    def check_end() -> None:
+        # после закрывающей скобки допустимы только пробельные символы, как в json.load
+        nonlocal pos
+        while True:
+            pos = _WHITESPACE.match(buf, pos).end()  # type: ignore[union-attr]
+            if pos < len(buf):
+                raise json.JSONDecodeError("Лишние данные после JSON-массива", buf, pos)
+            if eof:
+                return
+            read_more()
+
+    if next_char() != "[":
+        raise json.JSONDecodeError("Ожидался JSON-массив", buf, pos)
+    pos += 1
+    if next_char() == "]":
+        pos += 1
+        check_end()
+        return
+
+    while True:
+        try:
+            obj, end = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError as exc:
+            if eof or not _may_be_truncated(exc, buf):
+                # ошибка внутри буфера, а не на его обрыве — дочитывать файл бесполезно
+                raise
+            # элемент не поместился в буфер — дочитываем, каждый раз удваивая порцию,
+            # чтобы повторные попытки разбора крупной категории стоили O(размер категории)
+            read_more()
+            read_size *= 2
+            continue
+        if not eof and _TRUNCATED_TAIL.match(buf, end) is not None:
+            # значение могло оборваться на границе буфера (например, число "1." из "1.5") — проверяем ещё раз
+            read_more()
+            continue
+
+        read_size = chunk_size
+        pos = end
+        yield obj
+
+        c = next_char()
+        if c == "]":
+            pos += 1
+            check_end()
+            return
+        if c != ",":
+            raise json.JSONDecodeError("Ожидалась запятая между элементами массива", buf, pos)
+        pos += 1
+        next_char()
+
+
+def iter_categories_from_json(file_path: str, chunk_size: int = _CHUNK_SIZE) -> Iterator[Category]:
+    """
+    Потоково загружает категории из JSON-файла, отдавая по одной категории за раз.
+    Пиковое потребление памяти ограничено размером самой крупной категории, а не всего файла.
     """
     with open(file_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+        for cat in _iter_json_array(f, chunk_size):
+            category = _build_category(cat)
+            count("categories")
+            count("products", len(cat["products"]))
+            yield category
 
-    categories: List[Category] = []
-    for cat in data:
-        products = [Product(p["name"], p["description"], p["price"], p["quantity"]) for p in cat["products"]]
-        categories.append(Category(cat["name"], cat["description"], products))
 
-    return categories
+def _group_rows(rows: Iterable[Tuple[str, str, Optional[Product]]]) -> Iterator[Category]:
+    """Собирает категории из идущих подряд строк (категория, описание, товар или None для пустой категории)."""
+    current: Optional[Tuple[str, str]] = None
+    products: List[Product] = []
+    for name, description, product in rows:
+        if (name, description) != current:
+            if current is not None:
+                yield Category(current[0], current[1], products)
+            current, products = (name, description), []
+        if product is not None:
+            products.append(product)
+    if current is not None:
+        yield Category(current[0], current[1], products)
+
+
+def iter_categories_from_ndjson(file_path: str) -> Iterator[Category]:
+    """Потоково читает категории из NDJSON, записанного src.export.export_ndjson."""
+    with open(file_path, "r", encoding="utf-8") as f:
+        rows = (json.loads(line) for line in f if line.strip())
+        yield from _group_rows(
+            (
+                row["category"],
+                row["category_description"],
+                Product(row["name"], row["description"], row["price"], row["quantity"]) if "name" in row else None,
+            )
+            for row in rows
+        )
+
+
+def iter_categories_from_csv(file_path: str) -> Iterator[Category]:
+    """Потоково читает категории из CSV, записанного src.export.export_csv."""
+    with open(file_path, "r", encoding="utf-8", newline="") as f:
+        yield from _group_rows(
+            (
+                row["category"],
+                row["category_description"],
+                (
+                    Product(row["name"], row["description"], float(row["price"]), int(row["quantity"]))
+                    if row["price"]
+                    else None
+                ),
+            )
+            for row in csv.DictReader(f)
+        )
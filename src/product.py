@@ -11,34 +11,159 @@
 # Если цена понижается — спрашивать у пользователя подтверждение через input("...").
 # Product.__str__ — теперь возвращает "Название, X руб. Остаток: Y шт.".
 # Product.__add__ — реализовано сложение стоимости товаров на складе.
+# Product объявлен со __slots__: у экземпляров нет __dict__, что заметно экономит память на миллионах товаров.
+# Проверки полей и подтверждение смены цены вынесены в функции модуля, чтобы их переиспользовал ProductTable.
+# Остаток (quantity) тоже стал свойством: при изменении цены или остатка товар уведомляет
+# своих владельцев (категории) через _on_product_changed, чтобы те обновили накопленные итоги за O(1).
+# Название тоже свойство: при переименовании владельцы получают _on_product_renamed
+# (категория обновляет индекс по названию и сбрасывает кэш вывода).
+# Владельцы хранятся слабыми ссылками: товар не удерживает в памяти категории, в которых лежал.
+# При удалении товара из категории она отписывается через _detach.
+# update_price() меняет цену без input()/print(): решение о снижении принимает переданная функция confirm
+# (на нём построен асинхронный путь смены цены).
+# new_product принимает и обычный список, и ProductRegistry: у реестра поиск по названию идёт через индекс за O(1).
+# from_rows() создаёт пачку товаров из кортежей (название, описание, цена, количество): поля проверяются
+# одним проходом по всей пачке до создания объектов или не проверяются вовсе при validate=False,
+# объекты создаются без вызова __init__, а сборщик циклического мусора на это время приостанавливается.
+# Описание — свойство: с пулом строк (from_rows(..., strings=pool), src/string_pool.py) длинное описание
+# может храниться сжатым и распаковывается при обращении.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import gc
+import weakref
+from collections import deque
+from contextlib import contextmanager
+from itertools import starmap
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Protocol, Tuple, Union
+
+if TYPE_CHECKING:
+    from src.json_backends import ProductRow
+    from src.product_registry import ProductRegistry
+    from src.string_pool import StoredText, StringPool
+
+
+class ProductOwner(Protocol):
+    """Владелец товара (например, категория), которого товар уведомляет о своих изменениях."""
+
+    def _on_product_changed(self, product: Product, old_price: float, old_quantity: int, times: int = 1) -> None: ...
+
+    def _on_product_renamed(self, product: Product, old_name: str) -> None: ...
+
+
+def _validate_fields(name: str, description: str, price: float, quantity: int) -> None:
+    """Проверяет типы и диапазоны полей товара."""
+    if not isinstance(name, str):
+        raise TypeError("name должен быть строкой")
+    if not isinstance(description, str):
+        raise TypeError("description должен быть строкой")
+    if not isinstance(price, (int, float)):
+        raise TypeError("price должен быть числом")
+    if price <= 0:
+        raise ValueError("price не может быть нулевым или отрицательным")
+    if not isinstance(quantity, int):
+        raise TypeError("quantity должен быть целым числом")
+    if quantity < 0:
+        raise ValueError("quantity не может быть отрицательным")
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """
+    Приостанавливает сборщик циклического мусора на время массового создания объектов: иначе он
+    запускается каждые несколько сотен выделений и обходит все уже созданные товары.
+    Сами товары циклов не образуют (владельцы хранятся слабыми ссылками), поэтому мусор не теряется.
+    """
+    if not gc.isenabled():
+        yield
+        return
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+def _confirm_price_change(old_price: float, new_price: float) -> bool:
+    """Проверяет новую цену и при снижении спрашивает подтверждение. Возвращает True, если цену можно менять."""
+    if new_price <= 0:
+        print("Цена не должна быть нулевая или отрицательная")
+        return False
+
+    if new_price < old_price:
+        confirm = input(f"Цена снижается с {old_price} до {new_price}. Подтвердите (y/n): ").strip().lower()
+        if confirm != "y":
+            print("Изменение цены отменено")
+            return False
+
+    return True
 
 
 class Product:
     """Класс, представляющий товар."""
 
+    __slots__ = ("__name", "__description", "__price", "__quantity", "__owners")
+
     def __init__(self, name: str, description: str, price: float, quantity: int):
         # Проверка типов
-        if not isinstance(name, str):
-            raise TypeError("name должен быть строкой")
-        if not isinstance(description, str):
-            raise TypeError("description должен быть строкой")
-        if not isinstance(price, (int, float)):
-            raise TypeError("price должен быть числом")
-        if price <= 0:
-            raise ValueError("price не может быть нулевым или отрицательным")
-        if not isinstance(quantity, int):
-            raise TypeError("quantity должен быть целым числом")
-        if quantity < 0:
-            raise ValueError("quantity не может быть отрицательным")
-
-        self.name: str = name
-        self.description: str = description
+        _validate_fields(name, description, price, quantity)
+
+        self.__name: str = name
+        self.__description: StoredText = description
         self.__price: float = float(price)  # приватный атрибут
-        self.quantity: int = quantity
+        self.__quantity: int = quantity
+        # слабые ссылки на категории, содержащие товар
+        self.__owners: Optional[Tuple[weakref.ref[ProductOwner], ...]] = None
+
+    @classmethod
+    def _from_trusted(cls, name: str, description: str, price: float, quantity: int) -> Product:
+        """Создаёт товар без проверок полей — только для данных, уже проверенных при декодировании."""
+        product = cls.__new__(cls)
+        product.__name = name
+        product.__description = description
+        product.__price = float(price)
+        product.__quantity = quantity
+        product.__owners = None
+        return product
+
+    @classmethod
+    def from_rows(
+        cls, rows: Iterable[ProductRow], validate: bool = True, strings: Optional[StringPool] = None
+    ) -> List[Product]:
+        """
+        Создаёт товары из строк (название, описание, цена, количество) без вызова __init__ для каждой.
+        validate=True сначала проверяет всю пачку (те же ошибки, что у __init__; при ошибке не создаётся
+        ни один товар); validate=False пропускает проверку — только для данных, уже проверенных раньше.
+        strings — пул строк (src/string_pool.py): одинаковые названия и описания хранятся одним объектом.
+        """
+        if validate:
+            rows = rows if isinstance(rows, (list, tuple)) else list(rows)
+            deque(starmap(_validate_fields, rows), maxlen=0)
+        source: Iterable[Tuple[str, StoredText, float, int]] = rows
+        if strings is not None:
+            intern, describe = strings.intern, strings.description
+            source = ((intern(n), describe(d), p, q) for n, d, p, q in rows)
+        new = cls.__new__
+        products: List[Product] = []
+        append = products.append
+        with _gc_paused():
+            for name, description, price, quantity in source:
+                product = new(cls)
+                product.__name = name
+                product.__description = description
+                product.__price = float(price)
+                product.__quantity = quantity
+                product.__owners = None
+                append(product)
+        return products
+
+    def __getstate__(self) -> Tuple[str, StoredText, float, int]:
+        """Состояние для copy и pickle — без владельцев: копия не должна обновлять чужие категории."""
+        return self.__name, self.__description, self.__price, self.__quantity
+
+    def __setstate__(self, state: Tuple[str, StoredText, float, int]) -> None:
+        self.__name, self.__description, self.__price, self.__quantity = state
+        self.__owners = None
 
     def __repr__(self) -> str:
         return f"Product(name={self.name!r}, price={self.__price}, quantity={self.quantity})"
@@ -46,6 +171,29 @@ class Product:
     def __str__(self) -> str:
         return f"{self.name}, {self.__price} руб. Остаток: {self.quantity} шт."
 
+    @property
+    def name(self) -> str:
+        """Геттер для названия товара"""
+        return self.__name
+
+    @name.setter
+    def name(self, new_name: str) -> None:
+        """Сеттер для названия: сообщает категориям о переименовании"""
+        old_name = self.__name
+        self.__name = new_name
+        for owner in self._owners():
+            owner._on_product_renamed(self, old_name)
+
+    @property
+    def description(self) -> str:
+        """Описание товара (сжатое пулом строк описание распаковывается при каждом обращении)."""
+        description = self.__description
+        return description if isinstance(description, str) else str(description)
+
+    @description.setter
+    def description(self, value: str) -> None:
+        self.__description = value
+
     @property
     def price(self) -> float:
         """Геттер для приватного атрибута __price"""
@@ -54,18 +202,99 @@ class Product:
     @price.setter
     def price(self, new_price: float) -> None:
         """Сеттер для приватного атрибута __price"""
-        if new_price <= 0:
-            print("Цена не должна быть нулевая или отрицательная")
+        if not _confirm_price_change(self.__price, new_price):
             return
 
-        if new_price < self.__price:
-            confirm = input(f"Цена снижается с {self.__price} до {new_price}. Подтвердите (y/n): ").strip().lower()
-            if confirm != "y":
-                print("Изменение цены отменено")
-                return
-
         # обновляем цену как при повышении, так и при снижении после подтверждения
+        self.__set_price(new_price)
+
+    def update_price(self, new_price: float, confirm: Optional[Callable[[float, float], bool]] = None) -> bool:
+        """
+        Меняет цену без вывода в консоль и без input().
+        Нулевая и отрицательная цена отклоняется; снижение цены применяется, если confirm(старая, новая)
+        вернула True (без confirm снижение разрешено). Возвращает True, если цена изменена.
+        """
+        if new_price <= 0:
+            return False
+        if new_price < self.__price and confirm is not None and not confirm(self.__price, new_price):
+            return False
+        self.__set_price(new_price)
+        return True
+
+    def __set_price(self, new_price: float) -> None:
+        old_price = self.__price
         self.__price = float(new_price)
+        self._notify(old_price, self.__quantity)
+
+    @property
+    def quantity(self) -> int:
+        """Геттер для остатка на складе"""
+        return self.__quantity
+
+    @quantity.setter
+    def quantity(self, value: int) -> None:
+        """Сеттер для остатка: сообщает категориям об изменении"""
+        old_quantity = self.__quantity
+        self.__quantity = value
+        self._notify(self.__price, old_quantity)
+
+    def _attach(self, owner: ProductOwner) -> None:
+        """Подписывает владельца на изменения товара."""
+        owners = self.__owners or ()
+        for ref in owners:
+            if ref() is None:
+                owners = tuple(ref for ref in owners if ref() is not None)
+                break
+        self.__owners = owners + (weakref.ref(owner),)
+
+    @staticmethod
+    def _attach_many(products: Iterable[Product], owner: ProductOwner) -> None:
+        """Подписывает владельца на пачку товаров; товары без владельцев получают один общий кортеж ссылок."""
+        shared = (weakref.ref(owner),)
+        for product in products:
+            if product.__owners:
+                product._attach(owner)
+            else:
+                product.__owners = shared
+
+    def _detach(self, owner: ProductOwner) -> None:
+        """Отписывает владельца (одну подписку — товар мог быть добавлен в категорию дважды)."""
+        owners = [ref for ref in self.__owners or () if ref() is not None]
+        for i, ref in enumerate(owners):
+            if ref() is owner:
+                del owners[i]
+                break
+        self.__owners = tuple(owners) or None
+
+    def _owners(self) -> List[ProductOwner]:
+        """Живые владельцы товара; ссылки на уже удалённых владельцев отбрасываются."""
+        if not self.__owners:
+            return []
+        owners = [owner for owner in (ref() for ref in self.__owners) if owner is not None]
+        if len(owners) != len(self.__owners):
+            self.__owners = tuple(ref for ref in self.__owners if ref() is not None) or None
+        return owners
+
+    def _notify(self, old_price: float, old_quantity: int) -> None:
+        owners = self.__owners
+        if not owners:
+            return
+        if len(owners) == 1:
+            # горячий путь пакетной смены цен: один владелец, без промежуточных структур
+            owner = owners[0]()
+            if owner is not None:
+                owner._on_product_changed(self, old_price, old_quantity)
+            else:
+                self._owners()  # отбрасываем ссылку на удалённого владельца
+            return
+        # товар мог быть добавлен в категорию несколько раз: каждый владелец получает одно уведомление
+        # с числом подписок times, чтобы между уведомлениями его итоги не оставались пересчитанными наполовину
+        subscriptions: Dict[int, Tuple[ProductOwner, int]] = {}
+        for owner in self._owners():
+            seen = subscriptions.get(id(owner))
+            subscriptions[id(owner)] = (owner, seen[1] + 1 if seen else 1)
+        for owner, times in subscriptions.values():
+            owner._on_product_changed(self, old_price, old_quantity, times)
 
     def __add__(self, other: Product) -> float:
         if not isinstance(other, Product):
@@ -73,17 +302,25 @@ class Product:
         return self.price * self.quantity + other.price * other.quantity
 
     @classmethod
-    def new_product(cls, product_data: Dict[str, Any], products_list: List[Product]) -> Product:
+    def new_product(
+        cls, product_data: Dict[str, Any], products_list: Union[List[Product], ProductRegistry]
+    ) -> Product:
         name = product_data["name"]
         description = product_data["description"]
         price = product_data["price"]
         quantity = product_data["quantity"]
 
-        for existing_product in products_list:
-            if existing_product.name == name:  # можно добавить .lower() для игнорирования регистра
-                existing_product.quantity += quantity
-                existing_product.price = price  # сеттер сам спросит или обновит
-                return existing_product
+        existing_product: Optional[Product]
+        if isinstance(products_list, list):
+            # можно добавить .lower() для игнорирования регистра (в ProductRegistry — опция casefold)
+            existing_product = next((p for p in products_list if p.name == name), None)
+        else:
+            existing_product = products_list.find(name)
+
+        if existing_product is not None:
+            existing_product.quantity += quantity
+            existing_product.price = price  # сеттер сам спросит или обновит
+            return existing_product
 
         new_prod = cls(name, description, price, quantity)
         products_list.append(new_prod)
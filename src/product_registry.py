@@ -0,0 +1,170 @@
+# Индексированная коллекция товаров.
+# ProductRegistry хранит товары в порядке добавления (как список) и дополнительно
+# держит словарь "название -> товар", поэтому Product.new_product находит дубликат за O(1),
+# а не линейным проходом по списку.
+# Опция casefold включает сравнение названий без учёта регистра.
+# remove() удаляет пачку товаров за один проход с перестройкой индекса.
+# view() отдаёт ProductsView — представление только для чтения без копирования списка:
+# оно ведёт себя как последовательность (len, индексы, срезы, обход), но изменить через него
+# коллекцию нельзя. Срез представления — тоже представление, а не копия.
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from itertools import islice
+from operator import attrgetter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union, overload
+
+from src.product import Product
+
+_get_name = attrgetter("name")
+
+
+class ProductRegistry:
+    """Коллекция товаров с индексом по названию."""
+
+    def __init__(self, products: Optional[Iterable[Product]] = None, casefold: bool = False):
+        self.casefold: bool = casefold
+        self._items: List[Product] = []
+        self._index: Dict[str, Product] = {}
+        if products is not None:
+            self.extend(products)
+
+    def _key(self, name: str) -> str:
+        return name.casefold() if self.casefold else name
+
+    def find(self, name: str) -> Optional[Product]:
+        """Возвращает первый добавленный товар с таким названием или None."""
+        return self._index.get(self._key(name))
+
+    def append(self, product: Product) -> None:
+        """Добавляет товар в конец коллекции и в индекс."""
+        self._items.append(product)
+        # как и линейный поиск, индекс указывает на первый товар с таким названием
+        self._index.setdefault(self._key(product.name), product)
+
+    def extend(self, products: Iterable[Product]) -> None:
+        """Добавляет несколько товаров одной операцией; при ошибке во время обхода коллекция не меняется."""
+        items = self._items
+        start = len(items)
+        try:
+            items.extend(products)
+        except BaseException:
+            del items[start:]
+            raise
+
+        index = self._index
+        if not index:
+            # пустой индекс строим одним dict(): обход с конца оставляет первый товар с каждым названием
+            added = items[start:][::-1]
+            names = map(_get_name, added)
+            self._index = dict(zip(map(str.casefold, names) if self.casefold else names, added))
+            return
+        for product in islice(items, start, None):
+            index.setdefault(self._key(product.name), product)
+
+    def rename(self, product: Product, old_name: str) -> None:
+        """Обновляет индекс после переименования товара (O(n), переименования редки)."""
+        for name in (old_name, product.name):
+            key = self._key(name)
+            self._index.pop(key, None)
+            first = next((p for p in self._items if self._key(p.name) == key), None)
+            if first is not None:
+                self._index[key] = first
+
+    def remove(self, products: Iterable[Product]) -> List[Product]:
+        """
+        Удаляет товары (сравнение по идентичности) одним проходом по коллекции — O(n) на всю пачку,
+        а не на каждый товар. Возвращает удалённые товары в порядке коллекции.
+        """
+        doomed = {id(p) for p in products}
+        if not doomed:
+            return []
+        kept: List[Product] = []
+        removed: List[Product] = []
+        for product in self._items:
+            (removed if id(product) in doomed else kept).append(product)
+        if removed:
+            self._items[:] = kept  # на месте: представления view() продолжают видеть коллекцию
+            self._index = {}
+            for product in kept:
+                self._index.setdefault(self._key(product.name), product)
+        return removed
+
+    def merge(self, product_data: Dict[str, Any]) -> Product:
+        """Добавляет товар из словаря или объединяет его с существующим (см. Product.new_product)."""
+        return Product.new_product(product_data, self)
+
+    def to_list(self) -> List[Product]:
+        """Возвращает копию списка товаров."""
+        return list(self._items)
+
+    def view(self, positions: Optional[Sequence[int]] = None) -> ProductsView:
+        """Возвращает представление товаров (или товаров на позициях positions) только для чтения, без копирования."""
+        return ProductsView(self._items, positions)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Product]:
+        return iter(self._items)
+
+    @overload
+    def __getitem__(self, index: int) -> Product: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Product]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Product, List[Product]]:
+        return self._items[index]
+
+    def __contains__(self, item: object) -> bool:
+        if isinstance(item, str):
+            return self._key(item) in self._index
+        return item in self._items
+
+    def __repr__(self) -> str:
+        return f"ProductRegistry(products={len(self._items)}, casefold={self.casefold})"
+
+
+class ProductsView(Sequence[Product]):
+    """
+    Представление списка товаров только для чтения. Полное представление «живое» — видит товары,
+    добавленные после его создания; срез фиксирует диапазон позиций на момент взятия среза.
+    Вместо диапазона представление может держать любые позиции (например, массив индексов numpy
+    после сортировки или фильтрации) — они тоже фиксируются на момент создания.
+    """
+
+    __slots__ = ("_items", "_positions")
+
+    def __init__(self, items: List[Product], positions: Optional[Sequence[int]] = None):
+        self._items = items
+        self._positions = positions
+
+    def __len__(self) -> int:
+        return len(self._items) if self._positions is None else len(self._positions)
+
+    @overload
+    def __getitem__(self, index: int) -> Product: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> ProductsView: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Product, ProductsView]:
+        if self._positions is None:
+            if isinstance(index, slice):
+                return ProductsView(self._items, range(len(self._items))[index])
+            return self._items[index]
+        if isinstance(index, slice):
+            return ProductsView(self._items, self._positions[index])
+        return self._items[self._positions[index]]
+
+    def __iter__(self) -> Iterator[Product]:
+        if self._positions is None:
+            return iter(self._items)
+        if isinstance(self._positions, range) and self._positions.step == 1:
+            return islice(self._items, self._positions.start, self._positions.stop)
+        return map(self._items.__getitem__, self._positions)
+
+    def __repr__(self) -> str:
+        return f"ProductsView(products={len(self)})"
@@ -0,0 +1,129 @@
+# Колоночное хранилище товаров.
+# ProductTable держит цены и остатки в непрерывных массивах array("d") / array("q"),
+# а названия и описания — в обычных списках строк. Вместо отдельного объекта на каждый
+# товар таблица выдаёт лёгкие представления ProductRow (только ссылка на таблицу и номер строки),
+# которые ведут себя как Product: свойство price с тем же сеттером, __str__, __add__.
+# Если установлен numpy, as_numpy() отдаёт колонки как массивы numpy без копирования.
+
+from __future__ import annotations
+
+from array import array
+from typing import Any, Iterable, Iterator, List, Tuple, Union
+
+from src.product import Product, _confirm_price_change, _validate_fields
+
+try:
+    import numpy as np
+except ImportError:  # numpy — необязательная зависимость
+    np = None  # type: ignore[assignment]
+
+
+class ProductTable:
+    """Таблица товаров с колонками цен и остатков в непрерывных массивах."""
+
+    def __init__(self) -> None:
+        self.names: List[str] = []
+        self.descriptions: List[str] = []
+        self.prices: array[float] = array("d")
+        self.quantities: array[int] = array("q")
+
+    @classmethod
+    def from_products(cls, products: Iterable[Product]) -> ProductTable:
+        """Строит таблицу из объектов Product."""
+        table = cls()
+        for product in products:
+            table.append(product.name, product.description, product.price, product.quantity)
+        return table
+
+    def append(self, name: str, description: str, price: float, quantity: int) -> ProductRow:
+        """Добавляет строку (с теми же проверками, что и Product.__init__) и возвращает её представление."""
+        _validate_fields(name, description, price, quantity)
+        # сначала массивы: пока живы представления as_numpy(), их append бросает BufferError,
+        # и таблица должна остаться согласованной
+        self.prices.append(float(price))
+        try:
+            self.quantities.append(quantity)
+        except BufferError:
+            self.prices.pop()
+            raise
+        self.names.append(name)
+        self.descriptions.append(description)
+        return ProductRow(self, len(self.names) - 1)
+
+    def to_product(self, index: int) -> Product:
+        """Создаёт полноценный объект Product из строки таблицы."""
+        return Product(self.names[index], self.descriptions[index], self.prices[index], self.quantities[index])
+
+    def as_numpy(self) -> Tuple[Any, Any]:
+        """
+        Возвращает (цены, остатки) как массивы numpy, разделяющие память с таблицей.
+        Пока эти массивы (или их срезы) живы, append() бросает BufferError и не меняет таблицу.
+        """
+        if np is None:
+            raise ImportError("Для ProductTable.as_numpy() нужен пакет numpy")
+        return np.frombuffer(self.prices, dtype=np.float64), np.frombuffer(self.quantities, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, index: int) -> ProductRow:
+        size = len(self.names)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("индекс строки вне таблицы")
+        return ProductRow(self, index)
+
+    def __iter__(self) -> Iterator[ProductRow]:
+        return (ProductRow(self, i) for i in range(len(self.names)))
+
+    def __repr__(self) -> str:
+        return f"ProductTable(products={len(self.names)})"
+
+
+class ProductRow:
+    """Лёгкое представление одной строки ProductTable с интерфейсом Product."""
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: ProductTable, index: int):
+        self._table = table
+        self._index = index
+
+    @property
+    def name(self) -> str:
+        return self._table.names[self._index]
+
+    @property
+    def description(self) -> str:
+        return self._table.descriptions[self._index]
+
+    @property
+    def price(self) -> float:
+        """Цена из колонки таблицы."""
+        return self._table.prices[self._index]
+
+    @price.setter
+    def price(self, new_price: float) -> None:
+        """Меняет цену по тем же правилам, что и Product.price."""
+        if _confirm_price_change(self.price, new_price):
+            self._table.prices[self._index] = float(new_price)
+
+    @property
+    def quantity(self) -> int:
+        return self._table.quantities[self._index]
+
+    @quantity.setter
+    def quantity(self, value: int) -> None:
+        self._table.quantities[self._index] = value
+
+    def __repr__(self) -> str:
+        return f"ProductRow(name={self.name!r}, price={self.price}, quantity={self.quantity})"
+
+    def __str__(self) -> str:
+        return f"{self.name}, {self.price} руб. Остаток: {self.quantity} шт."
+
+    def __add__(self, other: Union[ProductRow, Product]) -> float:
+        if not isinstance(other, (ProductRow, Product)):
+            raise TypeError("Складывать можно только с другим Product")
+        return self.price * self.quantity + other.price * other.quantity
@@ -0,0 +1,88 @@
+# Пакетная смена цен (переоценка) без print() и input().
+# reprice() за один проход применяет новые цены к товарам — по порядку (последовательность цен)
+# или по названию (словарь название -> цена). Снижение цены решает политика — функция
+# (старая цена, новая цена) -> bool, как confirm в Product.update_price: allow_decrease,
+# deny_decrease или max_decrease_percent(p). Вместо вывода в консоль возвращается компактный
+# отчёт RepricingReport с номерами применённых, отклонённых политикой и некорректных изменений.
+# Категории получают уведомления товаров как при обычной смене цены, поэтому итоги и кэши
+# остаются согласованными (Category.reprice() — то же самое для товаров категории).
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Mapping, Optional, Sequence, Sized, Tuple, Union
+
+from src.product import Product
+
+# (старая цена, новая цена) -> можно ли снизить цену
+DecreasePolicy = Callable[[float, float], bool]
+# новые цены по порядку товаров или по названию товара
+NewPrices = Union[Sequence[float], Mapping[str, float]]
+
+
+def allow_decrease(old_price: float, new_price: float) -> bool:
+    """Политика: любое снижение цены разрешено."""
+    return True
+
+
+def deny_decrease(old_price: float, new_price: float) -> bool:
+    """Политика: любое снижение цены отклоняется."""
+    return False
+
+
+def max_decrease_percent(percent: float) -> DecreasePolicy:
+    """Политика: снижение разрешено, если цена падает не больше чем на percent процентов."""
+    if not 0 <= percent <= 100:
+        raise ValueError("percent должен быть от 0 до 100")
+    factor = 1 - percent / 100
+
+    def policy(old_price: float, new_price: float) -> bool:
+        return new_price >= old_price * factor
+
+    return policy
+
+
+@dataclass(frozen=True)
+class RepricingReport:
+    """Итог переоценки: номера товаров (в порядке обхода), разбитые по результату."""
+
+    applied: array = field(default_factory=lambda: array("q"))
+    rejected: array = field(default_factory=lambda: array("q"))  # снижение не прошло политику
+    invalid: array = field(default_factory=lambda: array("q"))  # нулевая или отрицательная цена
+
+    def __str__(self) -> str:
+        return f"применено: {len(self.applied)}, отклонено: {len(self.rejected)}, некорректно: {len(self.invalid)}"
+
+
+def reprice(
+    products: Iterable[Product], new_prices: NewPrices, policy: DecreasePolicy = deny_decrease
+) -> RepricingReport:
+    """
+    Применяет новые цены к товарам за один проход.
+    new_prices — последовательность той же длины, что и products, или словарь название -> цена
+    (товары, которых нет в словаре, пропускаются и в отчёт не попадают).
+    """
+    report = RepricingReport()
+    applied, rejected, invalid = report.applied.append, report.rejected.append, report.invalid.append
+
+    if isinstance(new_prices, Mapping):
+        get = new_prices.get
+        pairs: Iterable[Tuple[Product, Optional[float]]] = ((p, get(p.name)) for p in products)
+    else:
+        if not isinstance(products, Sized):
+            products = list(products)
+        if len(products) != len(new_prices):
+            raise ValueError(f"цен ({len(new_prices)}) не столько же, сколько товаров ({len(products)})")
+        pairs = zip(products, new_prices)
+
+    for i, (product, new_price) in enumerate(pairs):
+        if new_price is None:
+            continue
+        if new_price <= 0:
+            invalid(i)
+        elif product.update_price(new_price, policy):
+            applied(i)
+        else:
+            rejected(i)
+    return report
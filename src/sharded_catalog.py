@@ -0,0 +1,283 @@
+# Каталог, разделённый между несколькими процессами (шардами).
+# Товар попадает в шард по согласованному хешированию названия (HashRing): у каждого шарда
+# replicas точек на кольце, товар принадлежит первой точке по часовой стрелке от хеша его названия.
+# Хеш — blake2b, а не встроенный hash(): он одинаков во всех процессах и запусках.
+# Каждый шард — отдельный процесс со своими объектами Category/Product (частями категорий),
+# связь с ним — multiprocessing.Pipe. Команды отправляются всем нужным шардам сразу, а ответы
+# собираются после, поэтому шарды обрабатывают пачки параллельно.
+#
+# upsert() добавляет товары с семантикой Product.new_product (количество складывается, остаётся
+# более высокая цена — без input(), как при загрузке шардов и в apply_delta).
+# category_totals() собирает с шардов итоги категорий (как в Category.__str__) и складывает их.
+# resize() меняет число шардов: по свойству согласованного хеширования переезжают только товары,
+# чья точка на кольце сменила владельца (примерно 1/N каталога при добавлении одного шарда).
+
+from __future__ import annotations
+
+import hashlib
+import multiprocessing
+from bisect import bisect
+from collections import deque
+from dataclasses import dataclass
+from itertools import starmap
+from multiprocessing.connection import Connection
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.category import Category
+from src.json_backends import CategoryRow, ProductRow
+from src.product import Product, _validate_fields
+
+_REPLICAS = 64
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class HashRing:
+    """Кольцо согласованного хеширования: название товара -> номер шарда."""
+
+    def __init__(self, shards: int, replicas: int = _REPLICAS):
+        if shards <= 0:
+            raise ValueError("число шардов должно быть положительным")
+        self.shards = shards
+        self.replicas = replicas
+        points = sorted((_hash(f"{shard}:{replica}"), shard) for shard in range(shards) for replica in range(replicas))
+        self._points = [point for point, _ in points]
+        self._owners = [shard for _, shard in points]
+
+    def shard_for(self, name: str) -> int:
+        return self._owners[bisect(self._points, _hash(name)) % len(self._points)]
+
+    def __repr__(self) -> str:
+        return f"HashRing(shards={self.shards}, replicas={self.replicas})"
+
+
+@dataclass(frozen=True)
+class CategoryTotals:
+    """Итоги категории, собранные со всех шардов."""
+
+    name: str
+    description: str
+    products: int
+    quantity: int
+    value: float
+
+    def __str__(self) -> str:
+        return f"{self.name}, количество продуктов на складе: {self.quantity} шт."
+
+
+# (категория, описание категории, название, описание, цена, количество)
+_ShardRow = Tuple[str, str, str, str, float, int]
+
+
+def _upsert(categories: Dict[str, Category], rows: List[_ShardRow]) -> int:
+    """Объединяет строки с товарами шарда; новые товары добавляются в категории пачкой."""
+    pending: Dict[str, Dict[str, Product]] = {}
+    for cat_name, cat_description, name, description, price, quantity in rows:
+        category = categories.get(cat_name)
+        if category is None:
+            category = categories[cat_name] = Category.from_validated(cat_name, cat_description, [])
+        new = pending.setdefault(cat_name, {})
+        product = category.find_product(name) or new.get(name)
+        if product is None:
+            new[name] = Product._from_trusted(name, description, price, quantity)
+            continue
+        product.quantity += quantity
+        if price > product.price:
+            product.update_price(price)
+    for cat_name, products in pending.items():
+        categories[cat_name].add_products(products.values())
+    return sum(map(len, pending.values()))
+
+
+def _extract(categories: Dict[str, Category], ring: HashRing, shard: int) -> List[_ShardRow]:
+    """Удаляет из шарда товары, которые по кольцу ring принадлежат другим шардам, и возвращает их строки."""
+    moved: List[_ShardRow] = []
+    for category in categories.values():
+        leaving = [p for p in category.products_view() if ring.shard_for(p.name) != shard]
+        if leaving:
+            category.remove_products(leaving)
+            moved.extend(
+                (category.name, category.description, p.name, p.description, p.price, p.quantity) for p in leaving
+            )
+    return moved
+
+
+def _serve(conn: Connection) -> None:
+    """Цикл процесса-шарда: выполняет команды из канала, отвечает ("ok", результат) или ("error", исключение)."""
+    categories: Dict[str, Category] = {}
+    while True:
+        command, *args = conn.recv()
+        if command == "stop":
+            conn.close()
+            return
+        try:
+            result: Any
+            if command == "upsert":
+                result = _upsert(categories, args[0])
+            elif command == "totals":
+                result = {
+                    c.name: (c.description, len(c.products_view()), c.total_quantity, c.total_value)
+                    for c in categories.values()
+                }
+            elif command == "find":
+                result = [
+                    (c.name, (p.name, p.description, p.price, p.quantity))
+                    for c in categories.values()
+                    if (p := c.find_product(args[0])) is not None
+                ]
+            elif command == "extract":
+                result = _extract(categories, HashRing(*args[0]), args[1])
+            else:
+                raise ValueError(f"неизвестная команда шарда: {command!r}")
+        except Exception as exc:
+            conn.send(("error", exc))
+        else:
+            conn.send(("ok", result))
+
+
+class ShardedCatalog:
+    """Каталог в нескольких процессах-шардах с маршрутизацией товаров по названию."""
+
+    def __init__(self, shards: int = 4, replicas: int = _REPLICAS):
+        self.ring = HashRing(shards, replicas)
+        self._context = multiprocessing.get_context()
+        self._workers: List[Tuple[Any, Connection]] = []
+        try:
+            self._start(shards)
+        except BaseException:
+            self.close()
+            raise
+
+    @property
+    def shards(self) -> int:
+        return len(self._workers)
+
+    def _start(self, count: int) -> None:
+        for _ in range(count):
+            parent, child = self._context.Pipe()
+            process = self._context.Process(target=_serve, args=(child,), daemon=True)
+            process.start()
+            child.close()
+            self._workers.append((process, parent))
+
+    def _call(self, requests: Dict[int, Tuple[Any, ...]]) -> Dict[int, Any]:
+        """Отправляет команды шардам (номер -> команда), затем собирает ответы."""
+        for shard, request in requests.items():
+            self._workers[shard][1].send(request)
+        results: Dict[int, Any] = {}
+        error: Optional[BaseException] = None
+        for shard in requests:
+            status, result = self._workers[shard][1].recv()
+            if status == "error":
+                error = error or result
+            else:
+                results[shard] = result
+        if error is not None:
+            raise error
+        return results
+
+    def upsert(self, rows: Iterable[CategoryRow], validate: bool = True) -> int:
+        """
+        Добавляет товары из кортежей (категория, описание, товары), как decode_catalog, в их шарды.
+        Повторы объединяются как в Product.new_product. validate=False — для уже проверенных строк.
+        Возвращает число новых товаров.
+        """
+        batches: Dict[int, List[_ShardRow]] = {}
+        shard_for = self.ring.shard_for
+        for cat_name, cat_description, products in rows:
+            if validate:
+                if not isinstance(cat_name, str) or not isinstance(cat_description, str):
+                    raise TypeError("название и описание категории должны быть строками")
+                deque(starmap(_validate_fields, products), maxlen=0)
+            for name, description, price, quantity in products:
+                batches.setdefault(shard_for(name), []).append(
+                    (cat_name, cat_description, name, description, float(price), quantity)
+                )
+        return sum(self._call({shard: ("upsert", batch) for shard, batch in batches.items()}).values())
+
+    def new_product(self, category: str, description: str, product_data: Dict[str, Any]) -> Product:
+        """Аналог Product.new_product: добавляет товар в категорию или объединяет с имеющимся; возвращает итог."""
+        row: ProductRow = (
+            product_data["name"],
+            product_data["description"],
+            product_data["price"],
+            product_data["quantity"],
+        )
+        self.upsert([(category, description, [row])])
+        found = [product for cat_name, product in self.find_products(row[0]) if cat_name == category]
+        return found[0]
+
+    def find_products(self, name: str) -> List[Tuple[str, Product]]:
+        """Товары с таким названием во всех категориях (запрос идёт только в шард этого названия)."""
+        shard = self.ring.shard_for(name)
+        found = self._call({shard: ("find", name)})[shard]
+        return [(cat_name, Product._from_trusted(*row)) for cat_name, row in found]
+
+    def category_totals(self) -> Dict[str, CategoryTotals]:
+        """Итоги всех категорий: число товаров, общий остаток и стоимость, сложенные по шардам."""
+        merged: Dict[str, CategoryTotals] = {}
+        for part in self._call({shard: ("totals",) for shard in range(self.shards)}).values():
+            for name, (description, products, quantity, value) in part.items():
+                seen = merged.get(name)
+                if seen is not None:
+                    description = seen.description
+                    products += seen.products
+                    quantity += seen.quantity
+                    value += seen.value
+                merged[name] = CategoryTotals(name, description, products, quantity, value)
+        return merged
+
+    def __len__(self) -> int:
+        """Число товаров во всех шардах."""
+        return sum(totals.products for totals in self.category_totals().values())
+
+    def resize(self, shards: int) -> int:
+        """Меняет число шардов и переносит товары, сменившие шард. Возвращает число перенесённых товаров."""
+        ring = HashRing(shards, self.ring.replicas)
+        old = self.shards
+        if shards > old:
+            self._start(shards - old)
+        # каждый прежний шард отдаёт товары, которые по новому кольцу принадлежат другим шардам
+        extracted = self._call(
+            {shard: ("extract", (ring.shards, ring.replicas), shard) for shard in range(old)}
+        ).values()
+        for process, conn in self._workers[shards:]:
+            conn.send(("stop",))
+            process.join()
+            conn.close()
+        del self._workers[shards:]
+        self.ring = ring
+
+        batches: Dict[int, List[_ShardRow]] = {}
+        moved = 0
+        for rows in extracted:
+            moved += len(rows)
+            for row in rows:
+                batches.setdefault(ring.shard_for(row[2]), []).append(row)
+        self._call({shard: ("upsert", batch) for shard, batch in batches.items()})
+        return moved
+
+    def close(self) -> None:
+        """Останавливает процессы шардов."""
+        for process, conn in self._workers:
+            try:
+                conn.send(("stop",))
+            except OSError:
+                pass
+        for process, conn in self._workers:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+            conn.close()
+        self._workers.clear()
+
+    def __enter__(self) -> ShardedCatalog:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"ShardedCatalog(shards={self.shards})"
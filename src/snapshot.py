@@ -0,0 +1,261 @@
+# Бинарный снимок каталога.
+# Снимок пишется из списка Category и открывается через mmap, поэтому холодный старт не требует
+# разбора JSON: заголовок читается сразу, а объекты Product создаются только при обращении к ним.
+#
+# Формат (little-endian, все секции выровнены по 8 байт):
+#   заголовок: MAGIC, число категорий, товаров и строк, смещения секций;
+#   категории: (id названия, id описания, первый товар, число товаров) — по 4 x uint64;
+#   цены: float64 на товар; остатки: int64 на товар;
+#   id названий и id описаний товаров: uint32 на товар;
+#   таблица строк: смещения (uint64, строк + 1) и общий блок UTF-8.
+# Одинаковые строки (например, повторяющиеся описания) хранятся в таблице один раз.
+# write_snapshot_rows() и CatalogSnapshot.to_rows() работают с кортежами decode_catalog,
+# без объектов Category (на этом построен дисковый кэш src/catalog_cache.py).
+
+from __future__ import annotations
+
+import mmap
+import struct
+import sys
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, TypeVar
+
+from src.category import Category
+from src.json_backends import CategoryRow, ProductRow
+from src.product import Product
+
+MAGIC = b"ECSNAP01"
+_HEADER = struct.Struct("<8s3Q7Q")
+_View = TypeVar("_View", bound="memoryview[Any]")
+_SECTIONS = ("categories", "prices", "quantities", "name_ids", "description_ids", "string_offsets", "strings")
+
+
+def _pad(data: bytes) -> bytes:
+    return data + b"\0" * (-len(data) % 8)
+
+
+def write_snapshot(categories: Iterable[Category], path: str) -> None:
+    """Записывает категории и товары в бинарный снимок."""
+    _write(
+        (
+            (c.name, c.description, ((p.name, p.description, p.price, p.quantity) for p in c.products_view()))
+            for c in categories
+        ),
+        path,
+    )
+
+
+def write_snapshot_rows(rows: Iterable[CategoryRow], path: str) -> None:
+    """Записывает в снимок каталог в виде кортежей (как возвращает decode_catalog), без объектов Category."""
+    _write(rows, path)
+
+
+def _write(categories: Iterable[Tuple[str, str, Iterable[ProductRow]]], path: str) -> None:
+    string_ids: Dict[str, int] = {}
+    blob = bytearray()
+    string_offsets = array("Q", [0])
+
+    def intern(text: str) -> int:
+        sid = string_ids.get(text)
+        if sid is None:
+            sid = string_ids[text] = len(string_ids)
+            blob.extend(text.encode("utf-8"))
+            string_offsets.append(len(blob))
+        return sid
+
+    category_table = array("Q")
+    prices = array("d")
+    quantities = array("q")
+    name_ids = array("I")
+    description_ids = array("I")
+    for category_name, category_description, products in categories:
+        first = len(prices)
+        for name, description, price, quantity in products:
+            prices.append(price)
+            quantities.append(quantity)
+            name_ids.append(intern(name))
+            description_ids.append(intern(description))
+        category_table.extend((intern(category_name), intern(category_description), first, len(prices) - first))
+
+    sections = [
+        _pad(section.tobytes())
+        for section in (category_table, prices, quantities, name_ids, description_ids, string_offsets)
+    ] + [bytes(blob)]
+    offsets = []
+    position = _HEADER.size
+    for section in sections:
+        offsets.append(position)
+        position += len(section)
+
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, len(category_table) // 4, len(prices), len(string_ids), *offsets))
+        for section in sections:
+            f.write(section)
+
+
+class CatalogSnapshot:
+    """Открытый через mmap снимок каталога. Категории и товары создаются лениво, при обращении."""
+
+    def __init__(self, path: str):
+        if sys.byteorder != "little":
+            raise RuntimeError("Снимки каталога поддерживаются только на little-endian платформах")
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, n_categories, n_products, n_strings, *offsets = _HEADER.unpack_from(self._mmap)
+        except struct.error:
+            self._mmap.close()
+            raise ValueError(f"{path}: файл слишком короткий для снимка каталога") from None
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path}: это не снимок каталога")
+
+        self.category_count: int = n_categories
+        self.product_count: int = n_products
+        view = memoryview(self._mmap)
+        bounds = dict(zip(_SECTIONS, offsets))
+        self._views: List[memoryview] = [view]
+
+        def keep(part: _View) -> _View:
+            self._views.append(part)
+            return part
+
+        def section(name: str, size: int) -> memoryview:
+            # смещения берутся из заголовка, поэтому у обрезанного или испорченного файла
+            # секция может выходить за конец mmap — срез memoryview молча бы её укоротил
+            start = bounds[name]
+            end = start + size
+            if not _HEADER.size <= start <= end <= len(view):
+                raise ValueError(f"{path}: секция {name} выходит за пределы файла (файл обрезан?)")
+            return keep(view[start:end])
+
+        try:
+            self._categories = keep(section("categories", n_categories * 4 * 8).cast("Q"))
+            self.prices = keep(section("prices", n_products * 8).cast("d"))
+            self.quantities = keep(section("quantities", n_products * 8).cast("q"))
+            self._name_ids = keep(section("name_ids", n_products * 4).cast("I"))
+            self._description_ids = keep(section("description_ids", n_products * 4).cast("I"))
+            self._string_offsets = keep(section("string_offsets", (n_strings + 1) * 8).cast("Q"))
+            self._strings = section("strings", len(view) - bounds["strings"])
+            if self._string_offsets[-1] > len(self._strings):
+                raise ValueError(f"{path}: таблица строк выходит за пределы файла (файл обрезан?)")
+        except ValueError:
+            self.close()
+            raise
+
+    def string(self, sid: int) -> str:
+        """Возвращает строку из таблицы строк по её номеру."""
+        start, end = self._string_offsets[sid], self._string_offsets[sid + 1]
+        return str(self._strings[start:end], "utf-8")
+
+    def product(self, index: int) -> Product:
+        """Создаёт объект Product для товара с общим номером index."""
+        return Product._from_trusted(*self.product_row(index))
+
+    def product_row(self, index: int) -> ProductRow:
+        """Поля товара с общим номером index: (название, описание, цена, количество)."""
+        return (
+            self.string(self._name_ids[index]),
+            self.string(self._description_ids[index]),
+            self.prices[index],
+            self.quantities[index],
+        )
+
+    def to_rows(self) -> List[CategoryRow]:
+        """Читает весь снимок в виде кортежей, как decode_catalog, не создавая объектов Product."""
+        # строки и колонки декодируются целиком за один проход — это быстрее поштучного string()
+        blob = bytes(self._strings)
+        offsets = self._string_offsets.tolist()
+        strings = [blob[start:end].decode("utf-8") for start, end in zip(offsets, offsets[1:])]
+        products: List[ProductRow] = list(
+            zip(
+                map(strings.__getitem__, self._name_ids.tolist()),
+                map(strings.__getitem__, self._description_ids.tolist()),
+                self.prices.tolist(),
+                self.quantities.tolist(),
+            )
+        )
+        table = self._categories.tolist()
+        rows: List[CategoryRow] = []
+        for name_id, description_id, first, count in zip(*[iter(table)] * 4):
+            end = first + count
+            rows.append((strings[name_id], strings[description_id], products[first:end]))
+        return rows
+
+    def to_categories(self) -> List[Category]:
+        """Материализует весь снимок в список Category."""
+        return [category.to_category() for category in self]
+
+    def close(self) -> None:
+        """Освобождает представления памяти и закрывает mmap."""
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        self._mmap.close()
+
+    def __enter__(self) -> CatalogSnapshot:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.category_count
+
+    def __getitem__(self, index: int) -> SnapshotCategory:
+        if index < 0:
+            index += self.category_count
+        if not 0 <= index < self.category_count:
+            raise IndexError("номер категории вне снимка")
+        return SnapshotCategory(self, index)
+
+    def __iter__(self) -> Iterator[SnapshotCategory]:
+        return (SnapshotCategory(self, i) for i in range(self.category_count))
+
+    def __repr__(self) -> str:
+        return f"CatalogSnapshot(categories={self.category_count}, products={self.product_count})"
+
+
+class SnapshotCategory:
+    """Категория внутри снимка: название, описание и товары читаются из mmap по запросу."""
+
+    __slots__ = ("_snapshot", "_name_id", "_description_id", "_first", "_count")
+
+    def __init__(self, snapshot: CatalogSnapshot, index: int):
+        self._snapshot = snapshot
+        start, end = index * 4, index * 4 + 4
+        row = snapshot._categories[start:end]
+        self._name_id, self._description_id, self._first, self._count = row.tolist()
+
+    @property
+    def name(self) -> str:
+        return self._snapshot.string(self._name_id)
+
+    @property
+    def description(self) -> str:
+        return self._snapshot.string(self._description_id)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> Product:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("номер товара вне категории")
+        return self._snapshot.product(self._first + index)
+
+    def __iter__(self) -> Iterator[Product]:
+        return (self._snapshot.product(self._first + i) for i in range(self._count))
+
+    def to_category(self) -> Category:
+        """Создаёт полноценную Category со всеми товарами."""
+        return Category(self.name, self.description, list(self))
+
+    def __repr__(self) -> str:
+        return f"SnapshotCategory(name={self.name!r}, products={self._count})"
+
+
+def open_snapshot(path: str) -> CatalogSnapshot:
+    """Открывает снимок каталога через mmap."""
+    return CatalogSnapshot(path)
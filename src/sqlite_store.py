@@ -0,0 +1,253 @@
+# Хранилище каталога в SQLite (стандартный модуль sqlite3).
+# Каталог импортируется один раз (из JSON, из списка Category или из кортежей decode_catalog)
+# пакетными executemany в одной транзакции, после чего открыть его можно мгновенно: при открытии
+# ничего не читается, а товары категории подгружаются по запросу — страницами по номеру записи
+# (WHERE id > ? LIMIT ?), поэтому чтение страницы не зависит от её номера.
+#
+# Схема: categories(id, name UNIQUE, description) и products(id, category_id, name, description,
+# price, quantity) с уникальным индексом (category_id, name) для поиска товара в категории,
+# индексом по category_id (в SQLite он упорядочен и по id — на нём идут страницы категории)
+# и индексом по name для поиска по всему каталогу.
+#
+# Повторное добавление товара с тем же названием в ту же категорию — upsert с семантикой
+# Product.new_product: количество складывается, остаётся более высокая цена (как при загрузке шардов
+# и в apply_delta — без input()). Описание остаётся от первой записи.
+# Товары, которые возвращает хранилище, — отдельные объекты Product: их изменения в базу не пишутся.
+
+from __future__ import annotations
+
+import sqlite3
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.category import Category
+from src.json_backends import CategoryRow, ProductRow, decode_catalog
+from src.product import Product, _validate_fields
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS categories (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    description TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS products (
+    id INTEGER PRIMARY KEY,
+    category_id INTEGER NOT NULL REFERENCES categories (id),
+    name TEXT NOT NULL,
+    description TEXT NOT NULL,
+    price REAL NOT NULL,
+    quantity INTEGER NOT NULL,
+    UNIQUE (category_id, name)
+);
+CREATE INDEX IF NOT EXISTS products_category ON products (category_id);
+CREATE INDEX IF NOT EXISTS products_name ON products (name);
+"""
+
+_UPSERT_CATEGORY = "INSERT INTO categories (name, description) VALUES (?, ?) ON CONFLICT (name) DO NOTHING"
+
+# семантика Product.new_product: количество складывается, остаётся более высокая цена
+_UPSERT_PRODUCT = """
+INSERT INTO products (category_id, name, description, price, quantity) VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (category_id, name) DO UPDATE SET
+    quantity = quantity + excluded.quantity,
+    price = max(price, excluded.price)
+"""
+
+_PRODUCT_COLUMNS = "name, description, price, quantity"
+_PAGE_SIZE = 1000
+
+
+class CatalogStore:
+    """Каталог в базе SQLite. Категории и товары читаются из базы по запросу."""
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        if path != ":memory:":
+            # журнал WAL: пакетная запись не блокирует читателей, fsync — только на контрольных точках
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def import_rows(self, rows: Iterable[CategoryRow]) -> int:
+        """
+        Добавляет категории и товары из кортежей decode_catalog (уже проверенных) одной транзакцией.
+        Повторы товаров объединяются как в Product.new_product. Возвращает число обработанных строк товаров.
+        """
+        imported = 0
+
+        def product_params(category_id: int, products: Iterable[ProductRow]) -> Iterator[Tuple[Any, ...]]:
+            nonlocal imported
+            for row in products:
+                imported += 1
+                yield (category_id, *row)
+
+        with self._conn:
+            for name, description, products in rows:
+                self._conn.execute(_UPSERT_CATEGORY, (name, description))
+                self._conn.executemany(_UPSERT_PRODUCT, product_params(self._category_id(name), products))
+        return imported
+
+    def import_categories(self, categories: Iterable[Category]) -> int:
+        """Добавляет объекты Category с их товарами (см. import_rows)."""
+        return self.import_rows(
+            (
+                category.name,
+                category.description,
+                [(p.name, p.description, p.price, p.quantity) for p in category.products_view()],
+            )
+            for category in categories
+        )
+
+    def import_json(self, file_path: str, backend: str = "auto") -> int:
+        """Добавляет каталог из JSON-файла формата data/products.json (схема проверяется при декодировании)."""
+        with open(file_path, "rb") as f:
+            return self.import_rows(decode_catalog(f.read(), backend))
+
+    def add_category(self, name: str, description: str) -> StoredCategory:
+        """Создаёт пустую категорию (если такой ещё нет) и возвращает её."""
+        if not isinstance(name, str):
+            raise TypeError("name должен быть строкой")
+        if not isinstance(description, str):
+            raise TypeError("description должен быть строкой")
+        with self._conn:
+            self._conn.execute(_UPSERT_CATEGORY, (name, description))
+        return self.category(name)
+
+    def new_product(self, category: str, product_data: Dict[str, Any]) -> Product:
+        """
+        Аналог Product.new_product для хранилища: добавляет товар в категорию или объединяет его
+        с товаром того же названия одним upsert. Возвращает товар в том виде, в каком он сохранён.
+        """
+        row = (product_data["name"], product_data["description"], product_data["price"], product_data["quantity"])
+        _validate_fields(*row)
+        category_id = self._category_id(category)
+        with self._conn:
+            self._conn.execute(_UPSERT_PRODUCT, (category_id, *row))
+        product = self._find(category_id, row[0])
+        assert product is not None
+        return product
+
+    def category(self, name: str) -> StoredCategory:
+        """Категория по названию; KeyError, если её нет."""
+        found = self._conn.execute("SELECT id, name, description FROM categories WHERE name = ?", (name,)).fetchone()
+        if found is None:
+            raise KeyError(name)
+        return StoredCategory(self, *found)
+
+    def categories(self) -> List[StoredCategory]:
+        """Все категории в порядке добавления (без товаров)."""
+        query = "SELECT id, name, description FROM categories ORDER BY id"
+        return [StoredCategory(self, *row) for row in self._conn.execute(query)]
+
+    def find_products(self, name: str) -> List[Tuple[str, Product]]:
+        """Товары с таким названием во всех категориях: пары (название категории, товар). Поиск по индексу."""
+        query = (
+            "SELECT c.name, p.name, p.description, p.price, p.quantity FROM products p "
+            "JOIN categories c ON c.id = p.category_id WHERE p.name = ? ORDER BY p.id"
+        )
+        return [(row[0], Product._from_trusted(*row[1:])) for row in self._conn.execute(query, (name,))]
+
+    @property
+    def product_count(self) -> int:
+        return int(self._conn.execute("SELECT count(*) FROM products").fetchone()[0])
+
+    def _category_id(self, name: str) -> int:
+        found = self._conn.execute("SELECT id FROM categories WHERE name = ?", (name,)).fetchone()
+        if found is None:
+            raise KeyError(name)
+        return int(found[0])
+
+    def _find(self, category_id: int, name: str) -> Optional[Product]:
+        query = f"SELECT {_PRODUCT_COLUMNS} FROM products WHERE category_id = ? AND name = ?"
+        row = self._conn.execute(query, (category_id, name)).fetchone()
+        return None if row is None else Product._from_trusted(*row)
+
+    def _page(self, category_id: int, after: int, limit: int) -> List[Tuple[Any, ...]]:
+        query = f"SELECT id, {_PRODUCT_COLUMNS} FROM products WHERE category_id = ? AND id > ? ORDER BY id LIMIT ?"
+        return self._conn.execute(query, (category_id, after, limit)).fetchall()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> CatalogStore:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return int(self._conn.execute("SELECT count(*) FROM categories").fetchone()[0])
+
+    def __iter__(self) -> Iterator[StoredCategory]:
+        return iter(self.categories())
+
+    def __repr__(self) -> str:
+        return f"CatalogStore(path={self.path!r}, categories={len(self)})"
+
+
+class StoredCategory:
+    """Категория в хранилище: товары, итоги и поиск читаются из базы при каждом обращении."""
+
+    __slots__ = ("_store", "_id", "name", "description")
+
+    def __init__(self, store: CatalogStore, category_id: int, name: str, description: str):
+        self._store = store
+        self._id = category_id
+        self.name = name
+        self.description = description
+
+    def _scalar(self, expression: str) -> Any:
+        query = f"SELECT {expression} FROM products WHERE category_id = ?"
+        return self._store._conn.execute(query, (self._id,)).fetchone()[0]
+
+    def __len__(self) -> int:
+        return int(self._scalar("count(*)"))
+
+    @property
+    def total_quantity(self) -> int:
+        """Общий остаток товаров категории (одним запросом SUM)."""
+        return int(self._scalar("coalesce(sum(quantity), 0)"))
+
+    @property
+    def total_value(self) -> float:
+        """Стоимость остатков категории."""
+        return float(self._scalar("coalesce(sum(price * quantity), 0.0)"))
+
+    def iter_pages(self, page_size: int = _PAGE_SIZE) -> Iterator[List[Product]]:
+        """Товары категории страницами по page_size, в порядке добавления."""
+        after = 0
+        while True:
+            rows = self._store._page(self._id, after, page_size)
+            if not rows:
+                return
+            after = rows[-1][0]
+            yield Product.from_rows([row[1:] for row in rows], validate=False)
+
+    def iter_products(self, page_size: int = _PAGE_SIZE) -> Iterator[Product]:
+        """Все товары категории по одному; из базы они читаются страницами по page_size."""
+        for page in self.iter_pages(page_size):
+            yield from page
+
+    def find_product(self, name: str) -> Optional[Product]:
+        """Товар категории по названию (по индексу) или None."""
+        return self._store._find(self._id, name)
+
+    def new_product(self, product_data: Dict[str, Any]) -> Product:
+        """Добавляет товар или объединяет его с уже имеющимся (см. CatalogStore.new_product)."""
+        return self._store.new_product(self.name, product_data)
+
+    def to_category(self) -> Category:
+        """Загружает всю категорию в обычный объект Category."""
+        products = [product for page in self.iter_pages() for product in page]
+        return Category.from_validated(self.name, self.description, products)
+
+    def __str__(self) -> str:
+        return f"{self.name}, количество продуктов на складе: {self.total_quantity} шт."
+
+    def __repr__(self) -> str:
+        return f"StoredCategory(name={self.name!r})"
+
+
+def open_store(path: str) -> CatalogStore:
+    """Открывает (или создаёт) хранилище каталога в файле SQLite."""
+    return CatalogStore(path)
@@ -0,0 +1,82 @@
+# Пул строк для загрузки каталога: одинаковые названия и описания хранятся одним объектом str.
+# В реальных каталогах описания сильно повторяются ("256GB, Серый цвет" и т. п.), а JSON-декодер
+# создаёт новую строку для каждой записи. StringPool.intern() возвращает уже сохранённую строку,
+# равную переданной, поэтому копии из разных записей освобождаются сразу после загрузки.
+# Пул — обычный словарь на время загрузки (в отличие от sys.intern его можно выбросить целиком).
+#
+# С compress_from=N описания длиной от N байт (UTF-8) хранятся сжатыми zlib в CompressedText
+# и распаковываются при каждом обращении к Product.description. Одинаковые длинные описания
+# тоже хранятся один раз: они находятся по хешу blake2b, без хранения исходной строки.
+# Пул используют Product.from_rows(..., strings=pool) и load_categories_from_json(..., strings=pool).
+
+from __future__ import annotations
+
+import hashlib
+import zlib
+from typing import Dict, Union
+
+# raw deflate с окном 512 байт: описания короткие, а подготовка стандартного окна 32 КБ
+# (zlib.compress по умолчанию) на каждую строку в несколько раз дольше самого сжатия
+_WBITS = -9
+_MEM_LEVEL = 1
+
+
+class CompressedText:
+    """Строка, сжатая zlib (raw deflate); распаковывается при каждом str()."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, text: str):
+        compressor = zlib.compressobj(6, zlib.DEFLATED, _WBITS, _MEM_LEVEL)
+        self._data = compressor.compress(text.encode("utf-8")) + compressor.flush()
+
+    def __str__(self) -> str:
+        return zlib.decompress(self._data, _WBITS).decode("utf-8")
+
+    def __len__(self) -> int:
+        """Размер сжатых данных в байтах."""
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"CompressedText(bytes={len(self._data)})"
+
+
+# строка описания, как она хранится в Product
+StoredText = Union[str, CompressedText]
+
+
+class StringPool:
+    """Пул одинаковых строк (и, по желанию, сжатых длинных описаний)."""
+
+    def __init__(self, compress_from: int = 0):
+        self.compress_from = compress_from  # 0 — не сжимать
+        self._strings: Dict[str, str] = {}
+        self._compressed: Dict[bytes, CompressedText] = {}
+        self.lookups = 0
+
+    def intern(self, text: str) -> str:
+        """Возвращает сохранённую в пуле строку, равную text (text сохраняется, если такой ещё нет)."""
+        self.lookups += 1
+        return self._strings.setdefault(text, text)
+
+    def description(self, text: str) -> StoredText:
+        """Как intern(), но длинные описания (от compress_from байт) возвращает сжатыми."""
+        if not self.compress_from or len(text) * 4 < self.compress_from:
+            # даже в 4 байтах на символ строка короче порога — кодировать её не нужно
+            return self.intern(text)
+        raw = text.encode("utf-8")
+        if len(raw) < self.compress_from:
+            return self.intern(text)
+        self.lookups += 1
+        key = hashlib.blake2b(raw, digest_size=16).digest()
+        compressed = self._compressed.get(key)
+        if compressed is None:
+            compressed = self._compressed[key] = CompressedText(text)
+        return compressed
+
+    def __len__(self) -> int:
+        """Число разных строк в пуле (включая сжатые)."""
+        return len(self._strings) + len(self._compressed)
+
+    def __repr__(self) -> str:
+        return f"StringPool(strings={len(self._strings)}, compressed={len(self._compressed)}, lookups={self.lookups})"
@@ -5,4 +5,10 @@ from src.category import Category
 def reset_category_counters() -> None:
     """Автоматически сбрасывает счётчики Category перед каждым тестом."""
     Category.product_count = 0
-    Category.category_count = 0
\ No newline at end of file
+    Category.category_count = 0
+
+
+@pytest.fixture(autouse=True)
+def check_category_totals(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Во всех тестах сверяет накопленные итоги категорий с пересчётом после каждого изменения."""
+    monkeypatch.setattr(Category, "consistency_checks", True)
\ No newline at end of file
@@ -0,0 +1,112 @@
+# Тесты пакетной аналитики:
+# сводные показатели по категории и по списку категорий, пустой набор,
+# гистограмма цен, работа с ProductTable, совпадение numpy- и Python-вариантов.
+
+from typing import Any, Iterator
+
+import pytest
+
+import src.analytics as analytics
+from src.analytics import catalog_price_histogram, catalog_stats, inventory_stats, price_histogram
+from src.category import Category
+from src.product import Product
+from src.product_table import ProductTable
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> Iterator[str]:
+    """Прогоняет тест и с numpy, и без него."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(analytics, "np", None)
+    yield request.param
+
+
+def make_products() -> Any:
+    return [Product("A", "Desc", 100, 10), Product("B", "Desc", 200, 2), Product("C", "Desc", 300, 0)]
+
+
+def test_category_stats(backend: str) -> None:
+    cat = Category("Cat", "Desc", make_products())
+    stats = cat.stats()
+
+    assert stats.count == 3
+    assert stats.total_units == 12
+    assert stats.total_value == pytest.approx(1400.0)
+    assert stats.min_price == 100.0
+    assert stats.max_price == 300.0
+    assert stats.mean_price == pytest.approx(200.0)
+
+
+def test_stats_empty(backend: str) -> None:
+    stats = inventory_stats([])
+    assert stats.count == 0
+    assert stats.total_units == 0
+    assert stats.total_value == 0.0
+    assert stats.min_price is None
+
+
+def test_stats_table_matches_products(backend: str) -> None:
+    products = make_products()
+    assert inventory_stats(ProductTable.from_products(products)) == inventory_stats(products)
+
+
+def test_catalog_stats(backend: str) -> None:
+    c1 = Category("C1", "Desc", make_products())
+    c2 = Category("C2", "Desc", [Product("D", "Desc", 50, 4)])
+    stats = catalog_stats([c1, c2])
+
+    assert stats.count == 4
+    assert stats.total_units == 16
+    assert stats.total_value == pytest.approx(1600.0)
+    assert stats.min_price == 50.0
+
+
+def test_price_histogram(backend: str) -> None:
+    counts, edges = price_histogram(make_products(), bins=2)
+    assert counts == [1, 2]  # правая граница включается в последний интервал
+    assert edges == pytest.approx([100.0, 200.0, 300.0])
+
+    counts, edges = Category("Cat", "Desc", make_products()).price_histogram(bins=4, price_range=(0, 400))
+    assert counts == [0, 1, 1, 1]
+    assert edges == pytest.approx([0.0, 100.0, 200.0, 300.0, 400.0])
+
+
+def test_catalog_price_histogram(backend: str) -> None:
+    c1 = Category("C1", "Desc", make_products())
+    c2 = Category("C2", "Desc", [Product("D", "Desc", 300, 1)])
+    counts, _ = catalog_price_histogram([c1, c2], bins=2)
+    assert counts == [1, 3]
+
+
+def test_price_histogram_invalid_bins() -> None:
+    with pytest.raises(ValueError):
+        price_histogram(make_products(), bins=0)
+
+
+def test_category_columns_cached_until_change(backend: str) -> None:
+    p = Product("A", "Desc", 100, 10)
+    cat = Category("Cat", "Desc", [p])
+
+    columns = cat.price_columns()
+    assert cat.price_columns() is columns
+    assert cat.stats().total_units == 10
+
+    p.quantity = 4
+    assert cat.price_columns() is not columns
+    assert cat.stats().total_units == 4
+
+    cat.add_product(Product("B", "Desc", 50, 2))
+    assert cat.stats().total_value == pytest.approx(500.0)
+
+
+def test_stats_from_generator(backend: str) -> None:
+    stats = inventory_stats(p for p in make_products())
+    assert stats.count == 3
+    assert stats.total_value == pytest.approx(1400.0)
+
+
+def test_catalog_stats_empty(backend: str) -> None:
+    assert catalog_stats([]).count == 0
+    assert catalog_price_histogram([], bins=2)[0] == [0, 0]
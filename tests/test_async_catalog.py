@@ -0,0 +1,146 @@
+# Тесты асинхронного API:
+# конкурентная загрузка нескольких файлов, политики подтверждения снижения цены,
+# 100 тысяч конкурентных обновлений цены без блокировки цикла событий.
+
+import asyncio
+import json
+from pathlib import Path
+from typing import List
+
+import pytest
+
+import src.async_catalog as async_catalog
+from src.async_catalog import approve_price_change, reject_price_change, update_price_async, update_prices_async
+from src.category import Category
+from src.counters import CounterRegistry, use_registry
+from src.product import Product
+
+
+def write_catalog(path: Path, name: str) -> None:
+    product = {"name": "P", "description": "D", "price": 10.0, "quantity": 1}
+    data = [{"name": name, "description": "D", "products": [product]}]
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+
+def test_load_many_async(tmp_path: Path) -> None:
+    paths = []
+    for i in range(5):
+        write_catalog(tmp_path / f"{i}.json", f"C{i}")
+        paths.append(str(tmp_path / f"{i}.json"))
+
+    categories = asyncio.run(async_catalog.load_many_async(paths))
+
+    assert [c.name for c in categories] == [f"C{i}" for i in range(5)]
+    assert Category.category_count == 5
+
+
+def test_async_loader_keeps_counter_scope(tmp_path: Path) -> None:
+    write_catalog(tmp_path / "a.json", "A")
+    registry = CounterRegistry()
+
+    async def main() -> List[Category]:
+        with use_registry(registry):
+            return await async_catalog.load_categories_from_json_async(str(tmp_path / "a.json"), backend="auto")
+
+    asyncio.run(main())
+    assert registry.get("category_count") == 1
+    assert Category.category_count == 0
+
+
+def test_price_policies(capsys: "pytest.CaptureFixture[str]") -> None:
+    p = Product("A", "D", 100, 1)
+
+    async def main() -> None:
+        assert await update_price_async(p, 80, reject_price_change) is False
+        assert await update_price_async(p, 120, reject_price_change) is True  # повышение не требует подтверждения
+        assert await update_price_async(p, -5, approve_price_change) is False
+        assert await update_price_async(p, 90, approve_price_change) is True
+
+        async def ask_manager(product: Product, new_price: float) -> bool:
+            await asyncio.sleep(0)
+            return new_price >= product.price * 0.5
+
+        assert await update_price_async(p, 40, ask_manager) is False
+        assert await update_price_async(p, 50, ask_manager) is True
+
+    asyncio.run(main())
+    assert p.price == 50.0
+    assert capsys.readouterr().out == ""
+
+
+def test_100k_concurrent_price_updates_do_not_block(monkeypatch: pytest.MonkeyPatch) -> None:
+    # сверка итогов после каждого из 100 тысяч изменений сделала бы тест квадратичным — сверяем один раз в конце
+    monkeypatch.setattr(Category, "consistency_checks", False)
+    products = [Product(f"P{i}", "D", 100, 1) for i in range(100_000)]
+    category = Category("C", "D", products)
+    ticks = 0
+
+    async def slow_approval(product: Product, new_price: float) -> bool:
+        await asyncio.sleep(0)
+        return product.quantity > 0
+
+    async def heartbeat(done: asyncio.Event) -> None:
+        nonlocal ticks
+        while not done.is_set():
+            ticks += 1
+            await asyncio.sleep(0)
+
+    async def main() -> List[bool]:
+        done = asyncio.Event()
+        beat = asyncio.create_task(heartbeat(done))
+        updates = [(p, 90.0 if i % 2 else 110.0) for i, p in enumerate(products)]
+        results = await update_prices_async(updates, slow_approval, concurrency=10_000)
+        done.set()
+        await beat
+        return results
+
+    results = asyncio.run(main())
+
+    assert all(results)
+    assert ticks > 1  # цикл событий продолжал обслуживать другие задачи
+    assert category.total_value == pytest.approx(50_000 * 90.0 + 50_000 * 110.0)
+    category.verify_totals()
+
+
+def test_price_decision_uses_current_price() -> None:
+    p = Product("A", "D", 100, 1)
+
+    async def approve_later(product: Product, new_price: float) -> bool:
+        await asyncio.sleep(0)
+        return False
+
+    async def main() -> List[bool]:
+        lower = asyncio.create_task(update_price_async(p, 80, approve_later))
+        await asyncio.sleep(0)
+        p.update_price(50)  # пока политика думала, цену снизили ещё сильнее
+        return [await lower]
+
+    # 80 теперь повышение относительно 50 — отказ политики не мешает
+    assert asyncio.run(main()) == [True]
+    assert p.price == 80.0
+
+
+def test_update_prices_invalid_concurrency() -> None:
+    with pytest.raises(ValueError):
+        asyncio.run(update_prices_async([], concurrency=0))
+
+
+def test_price_raised_while_waiting_asks_policy_again() -> None:
+    p = Product("A", "D", 100, 1)
+    seen: List[float] = []
+
+    async def allow_small_cut(product: Product, new_price: float) -> bool:
+        seen.append(product.price)
+        await asyncio.sleep(0)
+        return new_price >= seen[-1] * 0.9
+
+    async def main() -> bool:
+        lower = asyncio.create_task(update_price_async(p, 90, allow_small_cut))
+        await asyncio.sleep(0)
+        p.update_price(300)  # пока политика одобряла снижение 100 -> 90, цену подняли
+        return await lower
+
+    # снижение 300 -> 90 (на 70%) политика уже не одобряет
+    assert asyncio.run(main()) is False
+    assert seen == [100.0, 300.0]
+    assert p.price == 300.0
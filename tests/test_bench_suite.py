@@ -0,0 +1,35 @@
+# Тесты набора бенчмарков: прогон всех случаев на маленьком каталоге,
+# сохранение базовой линии и код возврата при регрессии.
+
+import json
+from pathlib import Path
+
+import pytest
+
+from benchmarks import suite
+
+
+def test_suite_runs_all_cases() -> None:
+    results = suite.run_suite(list(suite.CASES), [50], repeat=1)
+    assert sorted(results) == sorted(f"{name}[50]" for name in suite.CASES)
+
+
+def test_compare_flags_regressions(capsys: pytest.CaptureFixture[str]) -> None:
+    baseline = {"a[1]": 0.010, "b[1]": 0.010, "c[1]": 0.0001}
+    current = {"a[1]": 0.011, "b[1]": 0.020, "c[1]": 0.0005, "d[1]": 0.5}
+
+    assert suite.compare(baseline, current, threshold=0.2) == ["b[1]"]
+    assert "РЕГРЕССИЯ" in capsys.readouterr().out
+
+
+def test_main_save_and_compare(tmp_path: Path) -> None:
+    baseline = tmp_path / "baseline.json"
+    args = ["--scales", "20", "--repeat", "1", "--cases", "product_init"]
+
+    assert suite.main(args + ["--save", str(baseline)]) == 0
+    data = json.loads(baseline.read_text(encoding="utf-8"))
+    assert list(data["results"]) == ["product_init[20]"]
+
+    data["results"]["product_init[20]"] = 1e-9
+    baseline.write_text(json.dumps(data), encoding="utf-8")
+    assert suite.main(args + ["--compare", str(baseline), "--min-delta-ms", "0"]) == 1
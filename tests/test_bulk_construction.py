@@ -0,0 +1,71 @@
+# Тесты пакетного создания товаров и категорий из проверенных данных:
+# Product.from_rows с проверкой (те же ошибки, что у __init__, ни одного товара при ошибке) и без неё,
+# Category.from_validated (итоги, индекс, счётчики, уведомления), сборщик мусора после создания включён.
+
+import gc
+from typing import Any, List, Tuple
+
+import pytest
+
+from src.category import Category
+from src.product import Product
+
+ROWS: List[Tuple[str, str, float, int]] = [("Iphone", "512GB", 210000.0, 8), ("Xiaomi", "256GB", 31000, 14)]
+
+
+def test_from_rows_builds_products() -> None:
+    products = Product.from_rows(ROWS)
+    assert [(p.name, p.description, p.price, p.quantity) for p in products] == ROWS
+    assert all(type(p.price) is float for p in products)
+    assert Product.from_rows(iter(ROWS), validate=False)[1].name == "Xiaomi"
+    assert Product.from_rows([]) == []
+
+
+@pytest.mark.parametrize(
+    "row, error",
+    [
+        ((1, "d", 10.0, 1), TypeError),
+        (("n", None, 10.0, 1), TypeError),
+        (("n", "d", "10", 1), TypeError),
+        (("n", "d", 0, 1), ValueError),
+        (("n", "d", 10.0, 1.5), TypeError),
+        (("n", "d", 10.0, -1), ValueError),
+    ],
+)
+def test_from_rows_matches_init_errors(row: Tuple[Any, ...], error: type) -> None:
+    with pytest.raises(error) as from_init:
+        Product(*row)
+    with pytest.raises(error) as from_rows:
+        Product.from_rows(ROWS + [row])
+    assert str(from_rows.value) == str(from_init.value)
+
+
+def test_from_rows_keeps_gc_state() -> None:
+    assert gc.isenabled()
+    Product.from_rows(ROWS)
+    assert gc.isenabled()
+    gc.disable()
+    try:
+        Product.from_rows(ROWS)
+        assert not gc.isenabled()
+    finally:
+        gc.enable()
+
+
+def test_from_validated_matches_init() -> None:
+    category = Category.from_validated("Смартфоны", "Описание", Product.from_rows(ROWS))
+    reference = Category("Смартфоны", "Описание", Product.from_rows(ROWS))
+    assert str(category) == str(reference)
+    assert category.products == reference.products
+    assert category.total_value == reference.total_value
+    assert category.find_product("Xiaomi") is category.products_view()[1]
+    assert Category.category_count == 2
+    assert Category.product_count == 4
+
+
+def test_from_validated_tracks_changes() -> None:
+    category = Category.from_validated("Смартфоны", "Описание", Product.from_rows(ROWS))
+    category.products_view()[0].quantity = 1
+    assert category.total_quantity == 15
+    category.add_product(Product("Pixel", "D", 500, 2))
+    assert len(category.products_view()) == 3
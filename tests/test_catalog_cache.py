@@ -0,0 +1,104 @@
+# Тесты кэширующего загрузчика:
+# повторная загрузка из памяти, независимые копии объектов, вытеснение LRU,
+# сброс при изменении файла, дисковый кэш снимков после «перезапуска» и при повреждённом снимке.
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.catalog_cache import CatalogCache
+
+
+def write_catalog(path: Path, price: Any = 100.0, name: str = "C") -> None:
+    product = {"name": "P", "description": "D", "price": price, "quantity": 1}
+    path.write_text(json.dumps([{"name": name, "description": "D", "products": [product]}]), encoding="utf-8")
+
+
+def test_cache_hit_returns_isolated_copies(tmp_path: Path) -> None:
+    path = tmp_path / "a.json"
+    write_catalog(path)
+    cache = CatalogCache()
+
+    first = cache.load(str(path))
+    first[0].get_products()[0].update_price(1.0)
+    first[0].add_product(first[0].get_products()[0])
+    second = cache.load(str(path))
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert second[0].get_products()[0] is not first[0].get_products()[0]
+    assert second[0].get_products()[0].price == 100.0
+    assert len(second[0].get_products()) == 1
+
+
+def test_cache_lru_eviction(tmp_path: Path) -> None:
+    cache = CatalogCache(maxsize=2)
+    paths = []
+    for name in "abc":
+        paths.append(str(tmp_path / f"{name}.json"))
+        write_catalog(tmp_path / f"{name}.json")
+
+    cache.load(paths[0])
+    cache.load(paths[1])
+    cache.load(paths[0])
+    cache.load(paths[2])  # вытесняет b — он использовался раньше всех
+    cache.load(paths[0])
+    cache.load(paths[1])
+
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses) == (2, 4)
+    with pytest.raises(ValueError):
+        CatalogCache(maxsize=0)
+
+
+def test_cache_invalidated_on_file_change(tmp_path: Path) -> None:
+    path = tmp_path / "a.json"
+    write_catalog(path)
+    cache = CatalogCache()
+    cache.load(str(path))
+
+    write_catalog(path, price=250.5)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert cache.load(str(path))[0].get_products()[0].price == 250.5
+    assert cache.misses == 2
+
+
+def test_disk_snapshot_cache_survives_restart(tmp_path: Path) -> None:
+    path = tmp_path / "a.json"
+    snapshots = tmp_path / "cache"
+    write_catalog(path, name="Смартфоны")
+    CatalogCache(snapshot_dir=str(snapshots)).load(str(path))
+
+    restarted = CatalogCache(snapshot_dir=str(snapshots))
+    categories = restarted.load(str(path))
+
+    assert restarted.disk_hits == 1
+    assert categories[0].name == "Смартфоны"
+    assert categories[0].products == "P, 100.0 руб. Остаток: 1 шт.\n"
+
+    write_catalog(path, price=5, name="Смартфоны")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    fresh = CatalogCache(snapshot_dir=str(snapshots))
+
+    assert fresh.load(str(path))[0].get_products()[0].price == 5
+    assert fresh.disk_hits == 0
+    assert len(os.listdir(snapshots)) == 1  # снимок старой версии удалён
+
+
+def test_disk_cache_ignores_corrupt_snapshot(tmp_path: Path) -> None:
+    path = tmp_path / "a.json"
+    snapshots = tmp_path / "cache"
+    write_catalog(path)
+    CatalogCache(snapshot_dir=str(snapshots)).load(str(path))
+    (snapshot,) = snapshots.iterdir()
+    snapshot.write_bytes(snapshot.read_bytes()[:20])
+
+    cache = CatalogCache(snapshot_dir=str(snapshots))
+
+    assert cache.load(str(path))[0].get_products()[0].price == 100.0
+    assert cache.disk_hits == 0
@@ -0,0 +1,90 @@
+# Тесты индекса каталога:
+# выборка по диапазону цен и по наличию, автодополнение по префиксу,
+# инкрементальное обновление при добавлении товаров и при изменении цены, остатка и названия.
+
+from typing import List
+
+from src.catalog_index import CatalogIndex
+from src.category import Category
+from src.product import Product
+
+
+def make_categories() -> List[Category]:
+    phones = Category(
+        "Смартфоны",
+        "Описание",
+        [Product("Iphone 15", "D", 210000.0, 8), Product("Xiaomi Redmi", "D", 31000, 0)],
+    )
+    tvs = Category("Телевизоры", "ТВ", [Product("Xiaomi TV", "D", 45000, 3), Product("LG OLED", "D", 150000, 1)])
+    return [phones, tvs]
+
+
+def names(products: List[Product]) -> List[str]:
+    return [p.name for p in products]
+
+
+def test_price_range_and_in_stock() -> None:
+    index = CatalogIndex(make_categories())
+
+    assert len(index) == 4
+    assert names(index.price_range(40000, 150000)) == ["Xiaomi TV", "LG OLED"]
+    assert names(index.price_range(high=50000)) == ["Xiaomi Redmi", "Xiaomi TV"]
+    assert names(index.price_range(high=50000, in_stock=True)) == ["Xiaomi TV"]
+    assert names(index.price_range()) == ["Xiaomi Redmi", "Xiaomi TV", "LG OLED", "Iphone 15"]
+
+
+def test_autocomplete() -> None:
+    index = CatalogIndex(make_categories())
+
+    assert names(index.autocomplete("xiao")) == ["Xiaomi Redmi", "Xiaomi TV"]
+    assert names(index.autocomplete("XIAOMI T")) == ["Xiaomi TV"]
+    assert names(index.autocomplete("xiao", limit=1)) == ["Xiaomi Redmi"]
+    assert index.autocomplete("samsung") == []
+
+
+def test_index_updates_on_add_product() -> None:
+    phones, tvs = make_categories()
+    index = CatalogIndex([phones, tvs])
+    shared = Product("Samsung", "D", 50000, 2)
+
+    phones.add_product(shared)
+    tvs.add_products([shared, Product("Sony", "D", 99000, 0)])
+    phones.merge_product({"name": "Pixel", "description": "D", "price": 60000, "quantity": 1})
+
+    assert len(index) == 7
+    assert names(index.price_range(45000, 99000)) == ["Xiaomi TV", "Samsung", "Pixel", "Sony"]
+    assert names(index.price_range(45000, 99000, in_stock=True)) == ["Xiaomi TV", "Samsung", "Pixel"]
+    assert names(index.autocomplete("s")) == ["Samsung", "Sony"]
+
+
+def test_index_follows_product_changes() -> None:
+    categories = make_categories()
+    index = CatalogIndex(categories)
+    redmi, tv = categories[0].get_products()[1], categories[1].get_products()[0]
+
+    redmi.quantity = 5
+    tv.update_price(20000)
+    tv.quantity = 0
+    redmi.name = "Poco"
+
+    assert names(index.price_range(high=50000)) == ["Xiaomi TV", "Poco"]
+    assert names(index.price_range(high=50000, in_stock=True)) == ["Poco"]
+    assert names(index.autocomplete("xiaomi")) == ["Xiaomi TV"]
+    assert names(index.autocomplete("po")) == ["Poco"]
+
+
+def test_index_removal_keeps_shared_products() -> None:
+    phones, tvs = make_categories()
+    shared = Product("Samsung", "D", 50000, 2)
+    phones.add_product(shared)
+    tvs.add_product(shared)
+    index = CatalogIndex([phones, tvs])
+
+    phones.remove_products([shared])
+    assert shared in index
+
+    tvs.remove_products(tvs.get_products())
+    assert shared not in index
+    assert names(index.price_range()) == ["Xiaomi Redmi", "Iphone 15"]
+    shared.update_price(10)  # отписанный индекс не получает уведомлений
+    assert len(index) == 2
@@ -18,6 +18,12 @@
 # Теперь в тестах можно не сбрасывать счётчики вручную — они всегда начинаются с 0.
 
 
+import copy
+import io
+import pickle
+import weakref
+from typing import Any
+
 import pytest
 
 from src.category import Category
@@ -111,6 +117,27 @@ def test_get_products_returns_copy() -> None:
     assert len(category.get_products()) == 1
 
 
+def test_products_view_is_read_only_and_live() -> None:
+    p1, p2, p3 = Product("P1", "D", 10.0, 5), Product("P2", "D", 20.0, 3), Product("P3", "D", 30.0, 1)
+    category = Category("Cat1", "DescCat", [p1, p2])
+
+    view = category.products_view()
+    category.add_product(p3)
+
+    assert len(view) == 3
+    assert list(view) == [p1, p2, p3]
+    assert view[-1] is p3
+    assert list(view[1:]) == [p2, p3]
+    assert list(view[::-2]) == [p3, p1]
+    assert view[1:][0] is p2
+    assert p2 in view and view.index(p3) == 2
+    assert not hasattr(view, "append")
+    with pytest.raises(TypeError):
+        view[0] = p3  # type: ignore[index]
+    with pytest.raises(IndexError):
+        view[1:][5]
+
+
 def test_category_count_increments_on_creation() -> None:
     Category.category_count = 0  # Сброс перед тестом
 
@@ -185,3 +212,219 @@ def test_category_products_property() -> None:
     products_str = cat.products
     assert "Prod1, 10.0 руб. Остаток: 1 шт." in products_str
     assert "Prod2, 20.0 руб. Остаток: 2 шт." in products_str
+
+
+def test_category_merge_product_merges_and_counts() -> None:
+    p1 = Product("Яблоко", "Красное яблоко", 80, 15)
+    cat = Category("Фрукты", "Свежие фрукты", [p1])
+
+    merged = cat.merge_product({"name": "Яблоко", "description": "Свежее", "price": 85, "quantity": 5})
+    added = cat.merge_product({"name": "Банан", "description": "Желтый", "price": 50, "quantity": 20})
+
+    assert merged is p1
+    assert p1.quantity == 20
+    assert p1.price == 85
+    assert cat.get_products() == [p1, added]
+    assert Category.product_count == 2
+
+
+def test_category_totals_track_changes(monkeypatch: pytest.MonkeyPatch) -> None:
+    p1 = Product("A", "Desc", 100, 2)
+    p2 = Product("B", "Desc", 200, 3)
+    cat = Category("Cat", "Desc", [p1, p2])
+    assert cat.total_quantity == 5
+    assert cat.total_value == 800.0
+
+    cat.add_product(Product("C", "Desc", 10, 10))
+    assert cat.total_quantity == 15
+
+    p1.quantity = 7  # изменение остатка
+    p2.price = 250  # повышение цены
+    monkeypatch.setattr("builtins.input", lambda _: "y")
+    p1.price = 50  # подтверждённое снижение
+    assert cat.total_quantity == 20
+    assert cat.total_value == pytest.approx(7 * 50 + 3 * 250 + 100)
+    assert "20 шт" in str(cat)
+
+    cat.merge_product({"name": "B", "description": "Desc", "price": 300, "quantity": 1})
+    assert cat.total_quantity == 21
+    assert cat.total_value == pytest.approx(7 * 50 + 4 * 300 + 100)
+
+
+def test_category_totals_shared_product() -> None:
+    p = Product("A", "Desc", 100, 2)
+    c1 = Category("C1", "Desc", [p])
+    c2 = Category("C2", "Desc", [p])
+
+    p.quantity = 5
+    assert c1.total_quantity == 5
+    assert c2.total_quantity == 5
+
+
+def test_category_totals_rejected_price_change(monkeypatch: pytest.MonkeyPatch) -> None:
+    p = Product("A", "Desc", 100, 2)
+    cat = Category("Cat", "Desc", [p])
+
+    monkeypatch.setattr("builtins.input", lambda _: "n")
+    p.price = 50
+    p.price = -1
+    assert cat.total_value == 200.0
+
+
+def test_category_totals_product_added_twice() -> None:
+    # сверка итогов включена (conftest): она не должна срабатывать между уведомлениями о двух подписках
+    p = Product("A", "Desc", 10, 2)
+    cat = Category("Cat", "Desc", [p, Product("B", "Desc", 5, 1)])
+    cat.add_product(p)
+    assert (cat.total_quantity, cat.total_value) == (5, 45.0)
+
+    p.update_price(30)
+    assert (cat.total_quantity, cat.total_value) == (5, 125.0)
+    p.quantity = 3
+    assert (cat.total_quantity, cat.total_value) == (7, 185.0)
+
+    other = Category("Other", "Desc", [p])
+    p.quantity = 1
+    assert (cat.total_quantity, cat.total_value) == (3, 65.0)
+    assert other.total_quantity == 1
+
+
+def test_verify_totals_detects_drift() -> None:
+    p = Product("A", "Desc", 100, 2)
+    cat = Category("Cat", "Desc", [p])
+    cat.verify_totals()
+
+    # подменяем накопленное значение, имитируя рассинхронизацию
+    cat._Category__total_quantity = 99  # type: ignore[attr-defined]
+    with pytest.raises(AssertionError):
+        cat.verify_totals()
+
+
+def test_products_cache_invalidation(monkeypatch: pytest.MonkeyPatch) -> None:
+    p1 = Product("A", "Desc", 100, 2)
+    cat = Category("Cat", "Desc", [p1])
+
+    first = cat.products
+    assert cat.products is first  # строка берётся из кэша
+
+    cat.add_product(Product("B", "Desc", 200, 3))
+    assert cat.products == "A, 100.0 руб. Остаток: 2 шт.\nB, 200.0 руб. Остаток: 3 шт.\n"
+
+    p1.quantity = 5
+    assert cat.products.startswith("A, 100.0 руб. Остаток: 5 шт.\n")
+
+    p1.price = 150
+    assert cat.products.startswith("A, 150.0 руб. Остаток: 5 шт.\n")
+
+    cat.merge_product({"name": "C", "description": "Desc", "price": 10, "quantity": 1})
+    assert cat.products.endswith("C, 10.0 руб. Остаток: 1 шт.\n")
+
+
+def test_iter_product_lines_pagination() -> None:
+    cat = Category("Cat", "Desc", [Product(f"P{i}", "Desc", 10 + i, i) for i in range(5)])
+
+    assert list(cat.iter_product_lines(1, 2)) == ["P1, 11.0 руб. Остаток: 1 шт.\n", "P2, 12.0 руб. Остаток: 2 шт.\n"]
+    assert len(list(cat.iter_product_lines(3))) == 2
+    assert list(cat.iter_product_lines(10, 5)) == []
+    assert "".join(cat.iter_product_lines()) == cat.products
+
+
+def test_write_products_to_file_object() -> None:
+    cat = Category("Cat", "Desc", [Product(f"P{i}", "Desc", 10 + i, i) for i in range(5)])
+    buffer = io.StringIO()
+
+    assert cat.write_products(buffer, offset=4) == 1
+    assert buffer.getvalue() == "P4, 14.0 руб. Остаток: 4 шт.\n"
+
+
+def test_add_products_bulk_from_generator() -> None:
+    cat = Category("Cat", "Desc", [Product("A", "Desc", 100, 2)])
+
+    added = cat.add_products(Product(f"P{i}", "Desc", 10, i) for i in range(4))
+
+    assert added == 4
+    assert len(cat.get_products()) == 5
+    assert Category.product_count == 5
+    assert cat.total_quantity == 2 + 0 + 1 + 2 + 3
+    assert cat.products.endswith("P3, 10.0 руб. Остаток: 3 шт.\n")
+
+
+def test_extend_is_alias_and_atomic() -> None:
+    p1 = Product("A", "Desc", 100, 2)
+    cat = Category("Cat", "Desc", [p1])
+
+    with pytest.raises(TypeError):
+        cat.extend([Product("B", "Desc", 10, 1), "not a product"])  # type: ignore[list-item]
+
+    # при ошибке ни один товар не добавлен
+    assert cat.get_products() == [p1]
+    assert Category.product_count == 1
+    assert cat.total_quantity == 2
+
+    cat.extend([Product("B", "Desc", 10, 1)])
+    assert len(cat.get_products()) == 2
+
+
+def test_temporary_category_is_not_kept_alive_by_products() -> None:
+    p = Product("A", "Desc", 100, 2)
+    cat = Category("Cat", "Desc", [p])
+    for _ in range(5):
+        tmp = Category("tmp", "", cat.get_products())
+        tmp_ref = weakref.ref(tmp)
+        del tmp
+        # временная категория собрана сборщиком и больше не получает уведомлений
+        assert tmp_ref() is None
+
+    p.quantity = 7
+    assert cat.total_quantity == 7
+    assert len(p._Product__owners) == 1  # type: ignore[attr-defined]
+
+
+@pytest.mark.parametrize("clone", [copy.copy, copy.deepcopy, lambda p: pickle.loads(pickle.dumps(p))])
+def test_product_copy_is_not_attached_to_categories(clone: Any) -> None:
+    p = Product("A", "Desc", 100, 1)
+    cat = Category("Cat", "Desc", [p])
+
+    q = clone(p)
+    assert (q.name, q.description, q.price, q.quantity) == ("A", "Desc", 100.0, 1)
+    q.quantity = 100
+    q.name = "Copy"
+    assert cat.total_quantity == 1
+    assert cat.find_product("A") is p
+    p.quantity = 3  # оригинал по-прежнему обновляет категорию
+    assert cat.total_quantity == 3
+
+
+def test_products_cache_invalidated_on_rename() -> None:
+    p1 = Product("A", "Desc", 100, 2)
+    p2 = Product("B", "Desc", 200, 1)
+    cat = Category("Cat", "Desc", [p1, p2])
+    _ = cat.products
+
+    p1.name = "Renamed"
+    assert cat.products.startswith("Renamed, 100.0 руб.")
+
+    # индекс по названию тоже обновлён: слияние идёт по новому названию
+    merged = cat.merge_product({"name": "Renamed", "description": "Desc", "price": 150, "quantity": 1})
+    assert merged is p1
+    assert p1.quantity == 3
+    added = cat.merge_product({"name": "A", "description": "Desc", "price": 10, "quantity": 1})
+    assert added is not p1
+    assert len(cat.get_products()) == 3
+
+
+def test_remove_products() -> None:
+    p1, p2, p3 = Product("P1", "D", 10.0, 5), Product("P2", "D", 20.0, 3), Product("P3", "D", 30.0, 1)
+    category = Category("Cat1", "DescCat", [p1, p2, p3])
+    view = category.products_view()
+
+    assert category.remove_products([p2, Product("P2", "D", 20.0, 3)]) == 1
+
+    assert list(view) == [p1, p3]
+    assert category.find_product("P2") is None and category.find_product("P3") is p3
+    assert Category.product_count == 2
+    assert category.total_quantity == 6
+    p2.quantity = 100  # удалённый товар больше не влияет на итоги категории
+    assert category.total_quantity == 6
+    assert category.remove_products([p1, p3]) == 2
+    assert (category.total_quantity, category.total_value) == (0, 0.0)
@@ -0,0 +1,138 @@
+# Тесты колоночного хранения категории и запросов по колонкам:
+# сортировка по цене, остатку и стоимости, top-k, фильтрация маской, обновление колонок
+# при добавлении, изменении и удалении товаров, совместимость с обычным API Category.
+# Каждый тест прогоняется и с numpy, и без него.
+
+from typing import Iterable, Iterator, List
+
+import pytest
+
+import src.analytics as analytics
+import src.columnar as columnar
+from src.category import Category
+from src.product import Product
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> Iterator[str]:
+    """Прогоняет тест и с numpy, и без него."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(columnar, "np", None)
+        monkeypatch.setattr(analytics, "np", None)
+    yield request.param
+
+
+def make_category(use_columnar: bool = True) -> Category:
+    products = [
+        Product("A", "D", 300, 1),
+        Product("B", "D", 100, 10),
+        Product("C", "D", 200, 0),
+        Product("D", "D", 100, 4),
+    ]
+    return Category("Cat", "Desc", products, columnar=use_columnar)
+
+
+def names(products: Iterable[Product]) -> List[str]:
+    return [p.name for p in products]
+
+
+@pytest.mark.parametrize("use_columnar", [True, False])
+def test_sorted_products(backend: str, use_columnar: bool) -> None:
+    category = make_category(use_columnar)
+    assert category.columnar is use_columnar
+    assert names(category.sorted_products()) == ["B", "D", "C", "A"]
+    assert names(category.sorted_products(descending=True)) == ["A", "C", "B", "D"]
+    assert names(category.sorted_products("quantity")) == ["C", "A", "D", "B"]
+    assert names(category.sorted_products("value", descending=True)) == ["B", "D", "A", "C"]
+    with pytest.raises(ValueError):
+        category.sorted_products("name")
+
+
+def test_top_products(backend: str) -> None:
+    category = make_category()
+    assert names(category.top_products(2)) == ["A", "C"]
+    assert names(category.top_products(1, key="value")) == ["B"]
+    assert names(category.top_products(10, key="quantity")) == ["B", "D", "A", "C"]
+    assert len(category.top_products(0)) == 0
+
+
+def test_filter_products(backend: str) -> None:
+    category = make_category()
+    prices, quantities = category.price_columns()
+    mask = [p > 100 and q > 0 for p, q in zip(prices, quantities)]
+    view = category.filter_products(mask)
+    assert names(view) == ["A"]
+    assert view[0] is category.products_view()[0]
+    with pytest.raises(ValueError):
+        category.filter_products([True])
+
+
+def test_columns_follow_changes(backend: str) -> None:
+    category = make_category()
+    first = category.products_view()[0]
+    first.update_price(50)
+    first.quantity = 7
+    assert names(category.top_products(1, key="quantity")) == ["B"]
+    assert names(category.sorted_products()) == ["A", "B", "D", "C"]
+
+    category.add_product(Product("E", "D", 1000, 1))
+    category.add_products([Product("F", "D", 10, 1)])
+    category.merge_product({"name": "G", "description": "D", "price": 500, "quantity": 2})
+    assert names(category.top_products(3)) == ["E", "G", "C"]
+
+    top = category.find_product("E")
+    assert top is not None
+    category.remove_products([top])
+    assert names(category.top_products(2)) == ["G", "C"]
+    prices, quantities = category.price_columns()
+    assert list(prices) == [p.price for p in category.products_view()]
+    assert list(quantities) == [p.quantity for p in category.products_view()]
+
+
+def test_duplicate_product_rows(backend: str) -> None:
+    product = Product("A", "D", 100, 1)
+    category = Category("Cat", "Desc", [product, Product("B", "D", 200, 1)], columnar=True)
+    category.add_product(product)
+    product.update_price(300)
+    assert list(category.price_columns()[0]) == [300.0, 200.0, 300.0]
+
+
+def test_enable_columnar_keeps_api(backend: str) -> None:
+    category = make_category(use_columnar=False)
+    before = (category.products, str(category), category.stats())
+    store = category.enable_columnar()
+    assert category.enable_columnar() is store
+    assert len(store) == 4
+    assert (category.products, str(category), category.stats()) == before
+    assert names(category.get_products()) == ["A", "B", "C", "D"]
+
+
+def test_columns_survive_growth() -> None:
+    pytest.importorskip("numpy")
+    category = Category("Cat", "Desc", [], columnar=True)
+    category.add_product(Product("A", "D", 1, 1))
+    prices, _ = category.price_columns()
+    assert not prices.flags.writeable
+    category.add_products([Product(f"P{i}", "D", 2 + i, 1) for i in range(100)])
+    assert list(prices) == [1.0]
+    assert len(category.price_columns()[0]) == 101
+
+
+@pytest.mark.parametrize("use_columnar", [True, False])
+def test_price_columns_are_snapshots(backend: str, use_columnar: bool) -> None:
+    category = make_category(use_columnar)
+    product = category.find_product("A")
+    assert product is not None
+    prices, quantities = category.price_columns()
+
+    product.update_price(999)
+    product.quantity = 50
+    category.add_product(Product("E", "D", 1, 1))
+
+    # выданные ранее колонки не меняются ни с колоночным хранением, ни без него
+    assert list(prices) == [300.0, 100.0, 200.0, 100.0]
+    assert list(quantities) == [1, 10, 0, 4]
+    assert list(category.price_columns()[0]) == [999.0, 100.0, 200.0, 100.0, 1.0]
+    assert names(category.top_products(1)) == ["A"]
@@ -0,0 +1,110 @@
+# Тесты счётчиков:
+# атомарность инкрементов под нагрузкой из многих потоков,
+# изоляция реестров через use_registry, слияние снимков из процессов-воркеров,
+# совместимость Category.category_count / product_count с присваиванием.
+
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+from src.category import Category
+from src.counters import AtomicCounter, CounterRegistry, current_registry, default_registry, use_registry
+from src.product import Product
+
+
+def test_atomic_counter_threads() -> None:
+    counter = AtomicCounter()
+
+    def work() -> None:
+        for _ in range(10_000):
+            counter.add()
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert counter.value == 80_000
+
+
+def test_category_counters_exact_under_threads() -> None:
+    threads_count, per_thread = 16, 200
+    barrier = threading.Barrier(threads_count)
+
+    def work() -> None:
+        barrier.wait()
+        for i in range(per_thread):
+            cat = Category(f"C{i}", "Desc", [Product("A", "Desc", 10, 1), Product("B", "Desc", 20, 2)])
+            cat.add_product(Product("C", "Desc", 30, 3))
+            cat.add_products([Product("D", "Desc", 40, 4), Product("E", "Desc", 50, 5)])
+
+    threads = [threading.Thread(target=work) for _ in range(threads_count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert Category.category_count == threads_count * per_thread
+    assert Category.product_count == threads_count * per_thread * 5
+
+
+def test_use_registry_scopes_counters() -> None:
+    scoped = CounterRegistry()
+    with use_registry(scoped) as registry:
+        assert current_registry() is registry
+        cat = Category("Cat", "Desc", [Product("A", "Desc", 10, 1)])
+        assert Category.category_count == 1
+
+    assert current_registry() is default_registry()
+    assert Category.category_count == 0
+    assert Category.product_count == 0
+
+    # категория продолжает считать товары в реестре, в котором была создана
+    cat.add_product(Product("B", "Desc", 10, 1))
+    assert scoped.snapshot() == {"category_count": 1, "product_count": 2}
+    assert Category.product_count == 0
+
+
+def test_class_attribute_assignment_resets_counter() -> None:
+    Category("Cat", "Desc", [Product("A", "Desc", 10, 1)])
+    Category.product_count = 0
+    assert Category.product_count == 0
+    assert Category.category_count == 1
+
+
+def _build_in_worker(n: int) -> Dict[str, int]:
+    registry = CounterRegistry()
+    with use_registry(registry):
+        for i in range(n):
+            Category(f"C{i}", "Desc", [Product("A", "Desc", 10, 1)])
+    return registry.snapshot()
+
+
+def test_merge_counts_from_processes() -> None:
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        snapshots: List[Dict[str, int]] = list(pool.map(_build_in_worker, [3, 4, 5]))
+
+    total = CounterRegistry()
+    for snapshot in snapshots:
+        total.merge(snapshot)
+    assert total.snapshot() == {"category_count": 12, "product_count": 12}
+
+    total.merge(total)
+    assert total.get("category_count") == 24
+    total.reset()
+    assert total.get("product_count") == 0
+
+
+def test_counters_readable_from_instance() -> None:
+    cat = Category("Cat", "Desc", [Product("A", "Desc", 10, 1)])
+    assert cat.category_count == 1
+    assert cat.product_count == 1
+
+    scoped = CounterRegistry()
+    with use_registry(scoped):
+        other = Category("Other", "Desc", [])
+    # экземпляр читает реестр, в котором был создан
+    assert other.category_count == 1
+    assert cat.category_count == 1
+    assert Category.category_count == 1
@@ -0,0 +1,125 @@
+# Тесты инкрементального обновления каталога:
+# добавление, изменение и удаление товаров и категорий, объединение повторов в выгрузке,
+# пустая дельта без изменений, обновление итогов, счётчиков и индекса каталога, загрузка из JSON.
+
+import json
+from pathlib import Path
+from typing import List
+
+from src.catalog_index import CatalogIndex
+from src.category import Category
+from src.delta import apply_delta, apply_delta_from_json
+from src.json_backends import CategoryRow
+from src.product import Product
+
+
+def make_catalog() -> List[Category]:
+    phones = Category("Смартфоны", "Описание", [Product("Iphone", "D", 1000, 5), Product("Xiaomi", "D", 300, 2)])
+    tvs = Category("Телевизоры", "ТВ", [Product("LG", "D", 700, 1)])
+    return [phones, tvs]
+
+
+FEED: List[CategoryRow] = [
+    ("Смартфоны", "Описание", [("Iphone", "D", 900, 5), ("Pixel", "D", 500, 3)]),
+    ("Ноутбуки", "ПК", [("Lenovo", "D", 800, 4)]),
+]
+
+
+def test_apply_delta_changes() -> None:
+    catalog = make_catalog()
+    iphone = catalog[0].find_product("Iphone")
+
+    changes = apply_delta(catalog, FEED)
+
+    assert changes.added_categories == ["Ноутбуки"]
+    assert changes.removed_categories == ["Телевизоры"]
+    assert changes.added == [("Смартфоны", "Pixel"), ("Ноутбуки", "Lenovo")]
+    assert changes.updated == [("Смартфоны", "Iphone")]
+    assert changes.removed == [("Смартфоны", "Xiaomi")]
+    assert len(changes) == 6
+    assert str(changes) == "категорий: +1 -1, товаров: +2 ~1 -1"
+
+    assert [c.name for c in catalog] == ["Смартфоны", "Ноутбуки"]
+    phones = catalog[0]
+    assert iphone is not None
+    assert phones.find_product("Iphone") is iphone and iphone.price == 900
+    assert [p.name for p in phones.products_view()] == ["Iphone", "Pixel"]
+    assert phones.total_quantity == 8
+    assert phones.total_value == 900 * 5 + 500 * 3
+    assert "Xiaomi" not in phones.products
+
+
+def test_apply_delta_noop_and_counters() -> None:
+    catalog = make_catalog()
+    feed: List[CategoryRow] = [
+        ("Смартфоны", "Описание", [("Iphone", "D", 1000, 5), ("Xiaomi", "D", 300, 2)]),
+        ("Телевизоры", "ТВ", [("LG", "D", 700, 1)]),
+    ]
+
+    assert len(apply_delta(catalog, feed)) == 0
+    assert Category.product_count == 3
+
+    feed[0] = ("Смартфоны", "Описание", [("Iphone", "D", 1000, 5)])
+    apply_delta(catalog, feed)
+    assert Category.product_count == 2
+
+
+def test_apply_delta_removed_category_updates_counters() -> None:
+    catalog = make_catalog()
+    tvs = catalog[1]
+    assert (Category.category_count, Category.product_count) == (2, 3)
+
+    apply_delta(catalog, FEED)
+
+    # −«Телевизоры» (1 товар) и Xiaomi, +«Ноутбуки» (1 товар) и Pixel
+    assert (Category.category_count, Category.product_count) == (2, 3)
+    assert len(tvs.products_view()) == 0
+    assert tvs.discard() == 0  # повторное удаление не уменьшает счётчики ещё раз
+    assert Category.category_count == 2
+
+
+def test_apply_delta_merges_duplicates_in_feed() -> None:
+    catalog = make_catalog()
+    feed: List[CategoryRow] = [
+        ("Смартфоны", "Описание", [("Iphone", "D", 1000, 5), ("Xiaomi", "D", 300, 2), ("Xiaomi", "D", 350, 1)]),
+        ("Телевизоры", "ТВ", [("LG", "D", 700, 1)]),
+    ]
+
+    changes = apply_delta(catalog, feed)
+
+    xiaomi = catalog[0].find_product("Xiaomi")
+    assert changes.updated == [("Смартфоны", "Xiaomi")]
+    assert xiaomi is not None and (xiaomi.price, xiaomi.quantity) == (350, 3)
+
+
+def test_apply_delta_keeps_index_in_sync() -> None:
+    catalog = make_catalog()
+    index = CatalogIndex(catalog)
+
+    apply_delta(catalog, FEED)
+    index.add_category(catalog[1])
+
+    # товары удалённой категории «Телевизоры» пропали и из индекса
+    assert [p.name for p in index.price_range()] == ["Pixel", "Lenovo", "Iphone"]
+    assert index.autocomplete("xiao") == []
+    assert index.autocomplete("lg") == []
+    assert len(index) == 3
+
+
+def test_apply_delta_from_json(tmp_path: Path) -> None:
+    catalog = make_catalog()
+    data = [
+        {
+            "name": c,
+            "description": d,
+            "products": [dict(zip(("name", "description", "price", "quantity"), r)) for r in rows],
+        }
+        for c, d, rows in FEED
+    ]
+    path = tmp_path / "feed.json"
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+    changes = apply_delta_from_json(catalog, str(path))
+
+    assert len(changes) == 6
+    assert catalog[1].find_product("Lenovo") is not None
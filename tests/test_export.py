@@ -0,0 +1,94 @@
+# Тесты потоковой выгрузки:
+# JSON, NDJSON и CSV читаются обратно загрузчиками без потерь (в том числе пустые категории,
+# кавычки, запятые, переводы строк и кириллица), запись идёт пачками.
+
+import io
+import math
+from pathlib import Path
+from typing import Callable, Iterable, List
+
+import pytest
+
+from src.category import Category
+from src.export import export_csv, export_json, export_ndjson
+from src.loading import iter_categories_from_csv, iter_categories_from_ndjson, load_categories_from_json
+from src.product import Product
+
+
+def make_catalog() -> List[Category]:
+    return [
+        Category(
+            "Смартфоны",
+            'Описание, с "кавычками"',
+            [Product("Iphone 15", "512GB,\nGray space", 210000.5, 8), Product("Xiaomi", "", 31000, 0)],
+        ),
+        Category("Пустая", "Нет товаров", []),
+        Category("Телевизоры", "ТВ", [Product('55" QLED 4K', "Подсветка", 0.1, 7)]),
+    ]
+
+
+def dump(categories: Iterable[Category]) -> List[tuple]:
+    return [
+        (c.name, c.description, [(p.name, p.description, p.price, p.quantity) for p in c.products_view()])
+        for c in categories
+    ]
+
+
+@pytest.mark.parametrize(
+    "export, load, newline",
+    [
+        (export_json, load_categories_from_json, None),
+        (export_ndjson, iter_categories_from_ndjson, None),
+        (export_csv, iter_categories_from_csv, ""),
+    ],
+)
+def test_export_roundtrip(tmp_path: Path, export: Callable, load: Callable, newline: str) -> None:
+    catalog = make_catalog()
+    path = tmp_path / "catalog.out"
+
+    with open(path, "w", encoding="utf-8", newline=newline) as f:
+        written = export(catalog, f, chunk_size=1)
+
+    assert written == 3
+    assert dump(load(str(path))) == dump(catalog)
+
+
+@pytest.mark.parametrize(
+    "export, load, newline",
+    [
+        (export_json, load_categories_from_json, None),
+        (export_ndjson, iter_categories_from_ndjson, None),
+        (export_csv, iter_categories_from_csv, ""),
+    ],
+)
+def test_export_roundtrip_non_finite_prices(tmp_path: Path, export: Callable, load: Callable, newline: str) -> None:
+    catalog = [Category("C", "D", [Product("Inf", "D", math.inf, 1), Product("NaN", "D", math.nan, 2)])]
+    path = tmp_path / "catalog.out"
+
+    with open(path, "w", encoding="utf-8", newline=newline) as f:
+        export(catalog, f)
+
+    (loaded,) = load(str(path))
+    inf, nan = loaded.products_view()
+    assert (inf.name, inf.price, inf.quantity) == ("Inf", math.inf, 1)
+    assert nan.name == "NaN" and math.isnan(nan.price) and nan.quantity == 2
+
+
+class CountingWriter(io.StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes = 0
+
+    def write(self, s: str) -> int:
+        self.writes += 1
+        return super().write(s)
+
+
+def test_export_writes_in_chunks() -> None:
+    products = [Product(f"P{i}", "D", 1.0, i) for i in range(10)]
+    out = CountingWriter()
+
+    export_ndjson([Category("C", "D", products)], out, chunk_size=4)
+
+    assert out.writes == 3
+    assert out.getvalue().count("\n") == 10
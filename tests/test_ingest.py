@@ -0,0 +1,82 @@
+# Тесты параллельной загрузки шардов:
+# объединение категорий по названию и товаров по правилу new_product,
+# одинаковый результат в одном и нескольких процессах, поиск файлов, ошибки валидации.
+
+import json
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+
+from src.category import Category
+from src.ingest import ingest_catalog, resolve_shards
+
+
+def write_shard(path: Path, data: List[Any]) -> None:
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+
+@pytest.fixture
+def shards_dir(tmp_path: Path) -> Path:
+    write_shard(
+        tmp_path / "a.json",
+        [
+            {
+                "name": "Смартфоны",
+                "description": "Описание",
+                "products": [
+                    {"name": "Iphone 15", "description": "512GB", "price": 210000.0, "quantity": 8},
+                    {"name": "Iphone 15", "description": "512GB", "price": 200000.0, "quantity": 2},
+                ],
+            }
+        ],
+    )
+    write_shard(
+        tmp_path / "b.json",
+        [
+            {
+                "name": "Смартфоны",
+                "description": "Другое описание",
+                "products": [{"name": "Iphone 15", "description": "512GB", "price": 220000.0, "quantity": 1}],
+            },
+            {
+                "name": "Телевизоры",
+                "description": "ТВ",
+                "products": [{"name": '55" QLED 4K', "description": "Подсветка", "price": 123000.0, "quantity": 7}],
+            },
+        ],
+    )
+    (tmp_path / "notes.txt").write_text("не каталог", encoding="utf-8")
+    return tmp_path
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_ingest_merges_shards(shards_dir: Path, workers: int) -> None:
+    categories = ingest_catalog(str(shards_dir), max_workers=workers)
+
+    assert [c.name for c in categories] == ["Смартфоны", "Телевизоры"]
+    phones = categories[0]
+    assert phones.description == "Описание"
+    (iphone,) = phones.get_products()
+    assert iphone.quantity == 11
+    assert iphone.price == 220000.0
+    assert Category.category_count == 2
+    assert Category.product_count == 2
+
+
+def test_ingest_glob(shards_dir: Path) -> None:
+    assert resolve_shards(str(shards_dir / "b*.json")) == [str(shards_dir / "b.json")]
+    categories = ingest_catalog(str(shards_dir / "b*.json"))
+    assert len(categories) == 2
+
+
+def test_ingest_no_files(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        ingest_catalog(str(tmp_path))
+
+
+def test_ingest_invalid_product(tmp_path: Path) -> None:
+    product = {"name": "P", "description": "D", "price": -1, "quantity": 1}
+    write_shard(tmp_path / "bad.json", [{"name": "C", "description": "D", "products": [product]}])
+    with pytest.raises(ValueError):
+        ingest_catalog(str(tmp_path), max_workers=2)
@@ -0,0 +1,98 @@
+# Тесты инструментирования загрузки:
+# без instrument() ничего не записывается, внутри — время этапов и счётчики загрузчиков,
+# хук on_stage, скорость загрузки, профилирование одного вызова через cProfile и tracemalloc.
+
+import pstats
+import tracemalloc
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+
+from src.instrumentation import LoadStats, count, current_stats, instrument, profile_call, stage
+from src.loading import iter_categories_from_json, load_categories_from_json
+
+DATA = Path(__file__).resolve().parent.parent / "data" / "products.json"
+LOAD_STAGES = {"total", "read", "decode", "products", "categories", "counters"}
+
+
+def test_disabled_by_default() -> None:
+    assert current_stats() is None
+    with stage("read"):
+        count("products", 5)
+    assert current_stats() is None
+
+
+def test_stage_and_count() -> None:
+    with instrument() as stats:
+        assert current_stats() is stats
+        with stage("read"):
+            pass
+        with stage("read"):
+            pass
+        count("products", 3)
+        count("products")
+    assert current_stats() is None
+    assert set(stats.stages) == {"read"}
+    assert stats.stages["read"] >= 0
+    assert stats.counts == {"products": 4}
+
+
+@pytest.mark.parametrize("typed", [False, True])
+def test_load_records_stages_and_counts(typed: bool) -> None:
+    with instrument() as stats:
+        categories = load_categories_from_json(str(DATA), typed=typed)
+    assert set(stats.stages) == LOAD_STAGES
+    assert stats.counts == {
+        "bytes_read": DATA.stat().st_size,
+        "categories": len(categories),
+        "products": sum(len(c.products_view()) for c in categories),
+    }
+    assert stats.stages["total"] >= stats.stages["decode"]
+    assert stats.rate() == stats.counts["products"] / stats.stages["total"]
+
+
+def test_streaming_loader_counts() -> None:
+    with instrument() as stats:
+        categories = list(iter_categories_from_json(str(DATA)))
+    assert stats.counts["categories"] == len(categories)
+    assert stats.counts["products"] == sum(len(c.products_view()) for c in categories)
+
+
+def test_on_stage_hook() -> None:
+    calls: List[Tuple[str, float]] = []
+    with instrument(on_stage=lambda name, seconds: calls.append((name, seconds))) as stats:
+        load_categories_from_json(str(DATA))
+    assert calls[-1][0] == "total"
+    assert {name for name, _ in calls} == set(stats.stages)
+
+
+def test_reuse_stats_object() -> None:
+    stats = LoadStats()
+    for _ in range(2):
+        with instrument(stats):
+            load_categories_from_json(str(DATA))
+    assert stats.counts["bytes_read"] == 2 * DATA.stat().st_size
+    assert set(stats.as_dict()) == {"stages", "counts", "products_per_second"}
+
+
+def test_rate_without_time() -> None:
+    assert LoadStats().rate() == 0.0
+
+
+def test_profile_call_cprofile() -> None:
+    categories, report = profile_call(load_categories_from_json, str(DATA))
+    assert categories
+    assert isinstance(report, pstats.Stats)
+
+
+def test_profile_call_tracemalloc() -> None:
+    categories, report = profile_call(load_categories_from_json, str(DATA), mode="tracemalloc")
+    assert categories
+    assert isinstance(report, tracemalloc.Snapshot)
+    assert not tracemalloc.is_tracing()
+
+
+def test_profile_call_unknown_mode() -> None:
+    with pytest.raises(ValueError):
+        profile_call(load_categories_from_json, str(DATA), mode="perf")
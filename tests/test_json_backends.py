@@ -0,0 +1,87 @@
+# Тесты выбора JSON-декодера и типизированной загрузки:
+# "auto" и откат на стандартный json, ошибки для неизвестных/неустановленных декодеров,
+# одинаковый результат загрузки для всех декодеров, проверка схемы в decode_catalog.
+
+import json
+from pathlib import Path
+
+import pytest
+
+import src.json_backends as json_backends
+from src.category import Category
+from src.json_backends import available_backends, decode_catalog, get_decoder, resolve_backend
+from src.loading import load_categories_from_json
+
+CATALOG = [
+    {
+        "name": "Смартфоны",
+        "description": "Описание",
+        "products": [
+            {"name": "Iphone 15", "description": "512GB", "price": 210000.0, "quantity": 8},
+            {"name": "Xiaomi", "description": "1024GB", "price": 31000, "quantity": 14},
+        ],
+    }
+]
+
+
+@pytest.fixture
+def catalog_path(tmp_path: Path) -> Path:
+    path = tmp_path / "catalog.json"
+    path.write_text(json.dumps(CATALOG, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def test_auto_falls_back_to_stdlib(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(json_backends, "orjson", None)
+    monkeypatch.setattr(json_backends, "msgspec", None)
+    assert available_backends() == ["json"]
+    assert resolve_backend("auto") == "json"
+    assert get_decoder()(b"[1, 2]") == [1, 2]
+
+
+def test_unknown_and_missing_backend(monkeypatch: pytest.MonkeyPatch) -> None:
+    with pytest.raises(ValueError):
+        resolve_backend("simdjson")
+    monkeypatch.setattr(json_backends, "orjson", None)
+    with pytest.raises(ImportError):
+        resolve_backend("orjson")
+
+
+@pytest.mark.parametrize("backend", ["json", "orjson", "msgspec", "auto"])
+@pytest.mark.parametrize("typed", [False, True])
+def test_load_with_backend(catalog_path: Path, backend: str, typed: bool) -> None:
+    if backend != "auto" and backend not in available_backends():
+        pytest.skip(f"{backend} не установлен")
+
+    categories = load_categories_from_json(str(catalog_path), backend=backend, typed=typed)
+
+    assert len(categories) == 1
+    assert categories[0].products == "Iphone 15, 210000.0 руб. Остаток: 8 шт.\nXiaomi, 31000.0 руб. Остаток: 14 шт.\n"
+    assert categories[0].total_quantity == 22
+    assert Category.product_count == 2
+
+
+@pytest.mark.parametrize("backend", ["json", "orjson", "msgspec"])
+@pytest.mark.parametrize(
+    "product, exc_type",
+    [
+        ({"name": 1, "description": "D", "price": 10, "quantity": 1}, TypeError),
+        ({"name": "P", "description": "D", "price": "10", "quantity": 1}, TypeError),
+        ({"name": "P", "description": "D", "price": 0, "quantity": 1}, ValueError),
+        ({"name": "P", "description": "D", "price": 10, "quantity": 1.5}, TypeError),
+        ({"name": "P", "description": "D", "price": 10, "quantity": -1}, ValueError),
+    ],
+)
+def test_decode_catalog_validates_schema(backend: str, product: dict, exc_type: type) -> None:
+    if backend not in available_backends():
+        pytest.skip(f"{backend} не установлен")
+    raw = json.dumps([{"name": "C", "description": "D", "products": [product]}]).encode("utf-8")
+    with pytest.raises(exc_type):
+        decode_catalog(raw, backend=backend)
+
+
+def test_decode_catalog_auto_prefers_msgspec(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("msgspec")
+    monkeypatch.setattr(json_backends, "validate_catalog", None)
+    raw = json.dumps(CATALOG).encode("utf-8")
+    assert decode_catalog(raw, backend="auto")[0][2][1] == ("Xiaomi", "1024GB", 31000, 14)
@@ -1,10 +1,11 @@
+import io
 import json
 from pathlib import Path
 
 import pytest
 
 from src.category import Category
-from src.loading import load_categories_from_json
+from src.loading import _iter_json_array, iter_categories_from_json, load_categories_from_json
 
 
 @pytest.fixture(autouse=True)
@@ -37,3 +38,97 @@ def test_load_categories_from_json(tmp_path: Path) -> None:
     assert len(categories[0].products.strip().split("\n")) == 2
     assert Category.category_count == 1
     assert Category.product_count == 2
+
+
+def _write_catalog(path: Path, categories: int, products: int) -> None:
+    data = [
+        {
+            "name": f"Cat{c}",
+            "description": f"Описание {c}",
+            "products": [
+                {"name": f"P{c}-{i}", "description": "256GB, Серый цвет", "price": 10.0 + i, "quantity": i}
+                for i in range(products)
+            ],
+        }
+        for c in range(categories)
+    ]
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 16])
+def test_iter_categories_matches_full_loader(tmp_path: Path, chunk_size: int) -> None:
+    json_path = tmp_path / "catalog.json"
+    _write_catalog(json_path, categories=5, products=20)
+
+    expected = load_categories_from_json(str(json_path))
+    streamed = list(iter_categories_from_json(str(json_path), chunk_size=chunk_size))
+
+    assert [c.name for c in streamed] == [c.name for c in expected]
+    assert [c.products for c in streamed] == [c.products for c in expected]
+
+
+def test_iter_categories_is_lazy(tmp_path: Path) -> None:
+    json_path = tmp_path / "catalog.json"
+    _write_catalog(json_path, categories=3, products=2)
+
+    categories = iter_categories_from_json(str(json_path), chunk_size=16)
+    first = next(categories)
+
+    # создана только первая категория, остальные ещё не разобраны
+    assert first.name == "Cat0"
+    assert Category.category_count == 1
+    assert Category.product_count == 2
+
+
+def test_iter_categories_empty_array(tmp_path: Path) -> None:
+    json_path = tmp_path / "empty.json"
+    json_path.write_text(" [ ] ", encoding="utf-8")
+
+    assert list(iter_categories_from_json(str(json_path))) == []
+
+
+@pytest.mark.parametrize("content", ['{"name": "x"}', '[{"name": "x", "description": "d", "products": []} {}]', "[{"])
+def test_iter_categories_invalid_json(tmp_path: Path, content: str) -> None:
+    json_path = tmp_path / "broken.json"
+    json_path.write_text(content, encoding="utf-8")
+
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_categories_from_json(str(json_path), chunk_size=4))
+
+
+@pytest.mark.parametrize("content", ["[]x", '[{"name": "x", "description": "d", "products": []}] ]', "[ ]\n\n1"])
+def test_iter_categories_trailing_data(tmp_path: Path, content: str) -> None:
+    json_path = tmp_path / "trailing.json"
+    json_path.write_text(content, encoding="utf-8")
+
+    with pytest.raises(json.JSONDecodeError, match="Лишние данные"):
+        list(iter_categories_from_json(str(json_path), chunk_size=2))
+
+
+class CountingReader(io.StringIO):
+    def __init__(self, text: str) -> None:
+        super().__init__(text)
+        self.chars_read = 0
+
+    def read(self, size: int | None = -1) -> str:
+        chunk = super().read(size)
+        self.chars_read += len(chunk)
+        return chunk
+
+
+@pytest.mark.parametrize("broken", ['{"a": 1,, "b": 2}', '{"a": tru e}', '{"a" 1}'])
+def test_iter_json_array_fails_early_on_syntax_error(broken: str) -> None:
+    item = json.dumps({"name": "x", "description": "d" * 100, "products": []})
+    f = CountingReader("[" + ", ".join([item, broken] + [item] * 10_000) + "]")
+
+    with pytest.raises(json.JSONDecodeError):
+        list(_iter_json_array(f, chunk_size=64))
+    # ошибка найдена без дочитывания остатка файла
+    assert f.chars_read < 1024
+
+
+def test_iter_json_array_values_split_across_chunks() -> None:
+    data = [{"n": -12.5e3, "t": True, "f": False, "z": None, "s": 'Смартфоны \u0444 "x"'}, 1e5, "строка"] * 20
+    text = json.dumps(data)
+    for chunk_size in (1, 2, 3, 7):
+        assert list(_iter_json_array(io.StringIO(text), chunk_size)) == data
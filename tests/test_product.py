@@ -235,3 +235,15 @@ def test_new_product_updates_existing(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr("builtins.input", lambda _: "y")
     updated_lower = Product.new_product(data_lower_price, products)
     assert updated_lower.price == 150
+
+
+def test_update_price_without_console(capsys: "pytest.CaptureFixture[str]") -> None:
+    p = Product("Test", "Desc", 100.0, 5)
+
+    assert p.update_price(120) is True
+    assert p.update_price(0) is False
+    assert p.update_price(80, confirm=lambda old, new: new >= old * 0.9) is False
+    assert p.update_price(110, confirm=lambda old, new: new >= old * 0.9) is True
+    assert p.update_price(50) is True  # без confirm снижение разрешено
+    assert p.price == 50.0
+    assert capsys.readouterr().out == ""
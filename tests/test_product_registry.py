@@ -0,0 +1,102 @@
+# Тесты ProductRegistry:
+# поиск по названию через индекс, сохранение порядка добавления,
+# совместимость с Product.new_product (слияние дубликатов), режим casefold.
+
+from typing import Iterator
+
+import pytest
+
+from src.product import Product
+from src.product_registry import ProductRegistry
+
+
+def test_registry_find_and_order() -> None:
+    p1 = Product("Яблоко", "Красное", 80, 15)
+    p2 = Product("Банан", "Желтый", 50, 20)
+    registry = ProductRegistry([p1, p2])
+
+    assert len(registry) == 2
+    assert list(registry) == [p1, p2]
+    assert registry[1] is p2
+    assert registry[:1] == [p1]
+    assert registry.find("Банан") is p2
+    assert registry.find("Груша") is None
+    assert "Яблоко" in registry
+    assert p1 in registry
+
+
+def test_registry_find_returns_first_duplicate() -> None:
+    p1 = Product("Яблоко", "Первое", 80, 1)
+    p2 = Product("Яблоко", "Второе", 90, 2)
+    registry = ProductRegistry([p1, p2])
+
+    # как и линейный поиск в new_product — находится первый товар
+    assert registry.find("Яблоко") is p1
+    assert len(registry) == 2
+
+
+def test_registry_new_product_merges() -> None:
+    registry = ProductRegistry()
+    data = {"name": "Яблоко", "description": "Красное", "price": 80, "quantity": 15}
+
+    created = Product.new_product(data, registry)
+    merged = registry.merge({"name": "Яблоко", "description": "Свежее", "price": 85, "quantity": 10})
+
+    assert merged is created
+    assert len(registry) == 1
+    assert merged.quantity == 25
+    assert merged.price == 85
+
+
+def test_registry_merge_lower_price_asks(monkeypatch: pytest.MonkeyPatch) -> None:
+    registry = ProductRegistry([Product("Яблоко", "Красное", 80, 15)])
+
+    monkeypatch.setattr("builtins.input", lambda _: "n")
+    merged = registry.merge({"name": "Яблоко", "description": "Свежее", "price": 70, "quantity": 5})
+
+    assert merged.quantity == 20
+    assert merged.price == 80
+
+
+def test_registry_casefold() -> None:
+    registry = ProductRegistry([Product("Iphone 15", "512GB", 210000.0, 8)], casefold=True)
+
+    merged = registry.merge({"name": "IPHONE 15", "description": "512GB", "price": 220000.0, "quantity": 2})
+
+    assert len(registry) == 1
+    assert merged.quantity == 10
+    assert registry.find("iphone 15") is merged
+
+
+def test_registry_to_list_is_copy() -> None:
+    registry = ProductRegistry([Product("A", "D", 10, 1)])
+    copy = registry.to_list()
+    copy.append(Product("B", "D", 20, 2))
+
+    assert len(registry) == 1
+
+
+def test_registry_extend_is_atomic() -> None:
+    registry = ProductRegistry([Product("A", "D", 10, 1)])
+
+    def rows() -> Iterator[Product]:
+        yield Product("B", "D", 20, 2)
+        raise RuntimeError("обрыв потока")
+
+    with pytest.raises(RuntimeError):
+        registry.extend(rows())
+
+    assert len(registry) == 1
+    assert registry.find("B") is None
+
+
+def test_registry_rename_keeps_first_duplicate() -> None:
+    p1 = Product("A", "D", 10, 1)
+    p2 = Product("A", "D", 20, 2)
+    registry = ProductRegistry([p1, p2])
+
+    p1.name = "B"
+    registry.rename(p1, "A")
+
+    assert registry.find("A") is p2
+    assert registry.find("B") is p1
@@ -0,0 +1,107 @@
+# Тесты ProductTable / ProductRow:
+# строки ведут себя как Product (str, price, __add__), проверки полей те же,
+# изменения через представление попадают в колонки, as_numpy() не копирует данные.
+
+import pytest
+
+from src.product import Product
+from src.product_table import ProductRow, ProductTable
+
+
+def test_product_has_no_dict() -> None:
+    p = Product("Test", "Desc", 100.0, 5)
+    assert not hasattr(p, "__dict__")
+    with pytest.raises(AttributeError):
+        p.color = "red"  # type: ignore[attr-defined]
+
+
+def test_table_rows_behave_like_products() -> None:
+    products = [Product("A", "Desc", 100, 10), Product("B", "Desc", 200, 2)]
+    table = ProductTable.from_products(products)
+
+    assert len(table) == 2
+    row = table[0]
+    assert isinstance(row, ProductRow)
+    assert row.name == "A"
+    assert row.description == "Desc"
+    assert str(row) == str(products[0])
+    assert row + table[1] == products[0] + products[1]
+    assert row + products[1] == 1400
+    assert [r.name for r in table] == ["A", "B"]
+    assert table[-1].name == "B"
+
+
+def test_table_append_validates() -> None:
+    table = ProductTable()
+    with pytest.raises(ValueError):
+        table.append("A", "Desc", -1, 1)
+    with pytest.raises(TypeError):
+        table.append("A", "Desc", 10, 1.5)  # type: ignore[arg-type]
+    assert len(table) == 0
+
+
+def test_table_index_out_of_range() -> None:
+    table = ProductTable()
+    table.append("A", "Desc", 10, 1)
+    with pytest.raises(IndexError):
+        _ = table[1]
+
+
+def test_row_setters_write_columns(monkeypatch: pytest.MonkeyPatch, capsys: "pytest.CaptureFixture[str]") -> None:
+    table = ProductTable()
+    row = table.append("A", "Desc", 100, 5)
+
+    row.price = 150
+    row.quantity = 7
+    assert table.prices[0] == 150.0
+    assert table.quantities[0] == 7
+
+    row.price = 0
+    assert "Цена не должна быть нулевая или отрицательная" in capsys.readouterr().out
+    assert row.price == 150.0
+
+    monkeypatch.setattr("builtins.input", lambda _: "n")
+    row.price = 120
+    assert row.price == 150.0
+
+    monkeypatch.setattr("builtins.input", lambda _: "y")
+    row.price = 120
+    assert row.price == 120.0
+
+
+def test_table_to_product() -> None:
+    table = ProductTable()
+    table.append("A", "Desc", 100, 5)
+    p = table.to_product(0)
+    assert isinstance(p, Product)
+    assert str(p) == "A, 100.0 руб. Остаток: 5 шт."
+
+
+def test_table_as_numpy_shares_memory() -> None:
+    pytest.importorskip("numpy")
+    table = ProductTable()
+    table.append("A", "Desc", 100, 5)
+    prices, quantities = table.as_numpy()
+    assert prices[0] == 100.0
+    assert quantities[0] == 5
+    table.prices[0] = 200.0
+    assert prices[0] == 200.0
+
+
+@pytest.mark.parametrize("keep", ["prices", "quantities"])
+def test_table_append_blocked_by_numpy_views_is_atomic(keep: str) -> None:
+    pytest.importorskip("numpy")
+    table = ProductTable()
+    table.append("A", "Desc", 100, 5)
+    prices, quantities = table.as_numpy()
+    view = prices if keep == "prices" else quantities
+    del prices, quantities
+
+    with pytest.raises(BufferError):
+        table.append("B", "Desc", 200, 1)
+    assert len(table) == 1
+    assert (len(table.prices), len(table.quantities), len(table.descriptions)) == (1, 1, 1)
+
+    del view
+    table.append("B", "Desc", 200, 1)
+    assert (table[1].name, table[1].price, table[1].quantity) == ("B", 200.0, 1)
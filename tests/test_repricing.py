@@ -0,0 +1,71 @@
+# Тесты пакетной переоценки:
+# политики снижения цены, отчёт вместо вывода в консоль, цены по порядку и по названию,
+# обновление итогов категории, ошибка при несовпадении длины.
+
+from typing import List
+
+import pytest
+
+from src.category import Category
+from src.product import Product
+from src.repricing import allow_decrease, deny_decrease, max_decrease_percent, reprice
+
+
+def make_products() -> List[Product]:
+    return [Product("A", "Desc", 100, 1), Product("B", "Desc", 200, 2), Product("C", "Desc", 300, 3)]
+
+
+def test_reprice_deny_decrease(capsys: pytest.CaptureFixture[str]) -> None:
+    products = make_products()
+
+    report = reprice(products, [150, 100, -5], deny_decrease)
+
+    assert list(report.applied) == [0]
+    assert list(report.rejected) == [1]
+    assert list(report.invalid) == [2]
+    assert [p.price for p in products] == [150, 200, 300]
+    assert str(report) == "применено: 1, отклонено: 1, некорректно: 1"
+    assert capsys.readouterr().out == ""
+
+
+def test_reprice_allow_decrease() -> None:
+    products = make_products()
+    report = reprice(products, [50, 100, 300], allow_decrease)
+    assert list(report.applied) == [0, 1, 2]
+    assert [p.price for p in products] == [50, 100, 300]
+
+
+def test_reprice_threshold_policy() -> None:
+    products = make_products()
+
+    report = reprice(products, [90, 170, 299], max_decrease_percent(10))
+
+    assert list(report.applied) == [0, 2]
+    assert list(report.rejected) == [1]
+    with pytest.raises(ValueError):
+        max_decrease_percent(150)
+
+
+def test_reprice_by_name() -> None:
+    products = make_products()
+
+    report = reprice(iter(products), {"C": 10, "A": 120}, allow_decrease)
+
+    assert list(report.applied) == [0, 2]
+    assert [p.price for p in products] == [120, 200, 10]
+
+
+def test_reprice_length_mismatch() -> None:
+    with pytest.raises(ValueError):
+        reprice(make_products(), [1, 2])
+
+
+def test_category_reprice_updates_totals() -> None:
+    category = Category("Cat", "Desc", make_products())
+    category.products  # заполняем кэш строки
+
+    report = category.reprice({"B": 100, "C": 330}, max_decrease_percent(60))
+
+    assert len(report.applied) == 2
+    assert category.total_value == 100 * 1 + 100 * 2 + 330 * 3
+    assert "B, 100.0 руб." in category.products
@@ -0,0 +1,84 @@
+# Тесты каталога в процессах-шардах:
+# кольцо согласованного хеширования (стабильность, доля переезжающих ключей), upsert с объединением
+# повторов, итоги категорий как у Category, поиск по названию, изменение числа шардов, ошибки.
+
+from typing import List
+
+import pytest
+
+from src.category import Category
+from src.json_backends import CategoryRow
+from src.product import Product
+from src.sharded_catalog import HashRing, ShardedCatalog
+
+ROWS: List[CategoryRow] = [
+    ("Смартфоны", "Описание", [(f"Телефон {i}", "D", 100.0 + i, i) for i in range(50)]),
+    ("Телевизоры", "ТВ", [(f"ТВ {i}", "D", 1000.0 + i, 1) for i in range(30)]),
+]
+
+
+def test_hash_ring() -> None:
+    names = [f"Товар {i}" for i in range(2000)]
+    ring = HashRing(4)
+    assert [ring.shard_for(n) for n in names] == [HashRing(4).shard_for(n) for n in names]
+    assert set(ring.shard_for(n) for n in names) == {0, 1, 2, 3}
+    grown = HashRing(5)
+    moved = [n for n in names if ring.shard_for(n) != grown.shard_for(n)]
+    # переезжают только ключи нового шарда, примерно 1/5
+    assert all(grown.shard_for(n) == 4 for n in moved)
+    assert 0.1 < len(moved) / len(names) < 0.3
+    with pytest.raises(ValueError):
+        HashRing(0)
+
+
+def test_upsert_and_totals() -> None:
+    with ShardedCatalog(shards=3) as catalog:
+        assert catalog.upsert(ROWS) == 80
+        assert len(catalog) == 80
+        totals = catalog.category_totals()
+        for name, description, rows in ROWS:
+            reference = Category(name, description, [Product(*row) for row in rows])
+            assert str(totals[name]) == str(reference)
+            assert totals[name].products == len(rows)
+            assert totals[name].value == pytest.approx(reference.total_value)
+
+
+def test_new_product_merges() -> None:
+    with ShardedCatalog(shards=2) as catalog:
+        catalog.upsert(ROWS)
+        merged = catalog.new_product(
+            "Смартфоны", "Описание", {"name": "Телефон 5", "description": "", "price": 1, "quantity": 10}
+        )
+        assert (merged.description, merged.price, merged.quantity) == ("D", 105.0, 15)
+        merged = catalog.new_product(
+            "Смартфоны", "Описание", {"name": "Телефон 5", "description": "", "price": 500, "quantity": 1}
+        )
+        assert (merged.price, merged.quantity) == (500.0, 16)
+        added = catalog.new_product(
+            "Ноутбуки", "ПК", {"name": "Телефон 5", "description": "Н", "price": 7, "quantity": 2}
+        )
+        assert (added.description, added.quantity) == ("Н", 2)
+        assert [c for c, _ in catalog.find_products("Телефон 5")] == ["Смартфоны", "Ноутбуки"]
+        assert catalog.find_products("нет") == []
+        assert catalog.category_totals()["Смартфоны"].quantity == sum(range(50)) + 11
+
+
+@pytest.mark.parametrize("start, target", [(2, 4), (4, 1)])
+def test_resize_keeps_catalog(start: int, target: int) -> None:
+    with ShardedCatalog(shards=start) as catalog:
+        catalog.upsert(ROWS)
+        before = catalog.category_totals()
+        moved = catalog.resize(target)
+        assert catalog.shards == target
+        assert 0 < moved <= 80
+        assert catalog.category_totals() == before
+        assert catalog.find_products("ТВ 7")[0][1].price == 1007.0
+
+
+def test_upsert_validates() -> None:
+    with ShardedCatalog(shards=2) as catalog:
+        with pytest.raises(ValueError):
+            catalog.upsert([("A", "a", [("x", "d", 0, 1)])])
+        with pytest.raises(TypeError):
+            catalog.upsert([("A", None, [("x", "d", 1, 1)])])  # type: ignore[list-item]
+        assert len(catalog) == 0
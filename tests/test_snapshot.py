@@ -0,0 +1,101 @@
+# Тесты бинарного снимка каталога:
+# запись и чтение без потерь, ленивое создание объектов, дедупликация строк,
+# закрытие mmap, ошибка на файле чужого формата и на обрезанном файле.
+
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from src.category import Category
+from src.product import Product
+from src.snapshot import open_snapshot, write_snapshot
+
+
+def make_catalog() -> List[Category]:
+    return [
+        Category(
+            "Смартфоны",
+            "Описание",
+            [
+                Product("Iphone 15", "512GB, Gray space", 210000.0, 8),
+                Product("Xiaomi", "512GB, Gray space", 31000, 14),
+            ],
+        ),
+        Category("Пустая", "Нет товаров", []),
+        Category("Телевизоры", "ТВ", [Product('55" QLED 4K', "Подсветка", 123000.0, 7)]),
+    ]
+
+
+def test_snapshot_roundtrip(tmp_path: Path) -> None:
+    catalog = make_catalog()
+    path = tmp_path / "catalog.snap"
+    write_snapshot(catalog, str(path))
+
+    with open_snapshot(str(path)) as snapshot:
+        assert len(snapshot) == 3
+        assert snapshot.product_count == 3
+        restored = snapshot.to_categories()
+
+    assert [c.name for c in restored] == [c.name for c in catalog]
+    assert [c.description for c in restored] == [c.description for c in catalog]
+    assert [c.products for c in restored] == [c.products for c in catalog]
+    assert [p.description for p in restored[0].get_products()] == ["512GB, Gray space"] * 2
+
+
+def test_snapshot_is_lazy(tmp_path: Path) -> None:
+    path = tmp_path / "catalog.snap"
+    write_snapshot(make_catalog(), str(path))
+    Category.category_count = 0
+    Category.product_count = 0
+
+    with open_snapshot(str(path)) as snapshot:
+        phones = snapshot[0]
+        assert phones.name == "Смартфоны"
+        assert len(phones) == 2
+        assert str(phones[-1]) == "Xiaomi, 31000.0 руб. Остаток: 14 шт."
+        assert snapshot[-1].name == "Телевизоры"
+        assert list(snapshot.prices) == [210000.0, 31000.0, 123000.0]
+        # категории не создавались, пока не запрошены явно
+        assert Category.category_count == 0
+
+        phones.to_category()
+        assert Category.category_count == 1
+        assert Category.product_count == 2
+
+        with pytest.raises(IndexError):
+            _ = snapshot[3]
+        with pytest.raises(IndexError):
+            _ = phones[2]
+
+
+def test_snapshot_deduplicates_strings(tmp_path: Path) -> None:
+    products = [Product(f"P{i}", "Одинаковое длинное описание товара" * 10, 10, 1) for i in range(100)]
+    unique = tmp_path / "unique.snap"
+    write_snapshot([Category("C", "D", products)], str(unique))
+    # описание записано один раз
+    assert unique.stat().st_size < 100 * len(("Одинаковое длинное описание товара" * 10).encode("utf-8"))
+
+
+def test_snapshot_rejects_foreign_file(tmp_path: Path) -> None:
+    path = tmp_path / "data.json"
+    path.write_text("[]" * 100, encoding="utf-8")
+    with pytest.raises(ValueError):
+        open_snapshot(str(path))
+
+    short = tmp_path / "short.snap"
+    short.write_bytes(b"ECSNAP01")
+    with pytest.raises(ValueError):
+        open_snapshot(str(short))
+
+
+@pytest.mark.parametrize("cut", [8, 200, 1])
+def test_snapshot_rejects_truncated_file(tmp_path: Path, cut: int) -> None:
+    path = tmp_path / "catalog.snap"
+    write_snapshot(make_catalog(), str(path))
+    data = path.read_bytes()
+    truncated = tmp_path / "truncated.snap"
+    truncated.write_bytes(data[: len(data) - cut])
+
+    with pytest.raises(ValueError):
+        open_snapshot(str(truncated))
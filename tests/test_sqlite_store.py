@@ -0,0 +1,111 @@
+# Тесты хранилища каталога в SQLite:
+# импорт из Category и JSON, повторное открытие файла, постраничное чтение товаров,
+# upsert с семантикой Product.new_product, поиск по названию, итоги категории, ошибки.
+
+import json
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from src.category import Category
+from src.product import Product
+from src.sqlite_store import CatalogStore, open_store
+
+
+def make_catalog() -> List[Category]:
+    return [
+        Category(
+            "Смартфоны",
+            "Описание",
+            [Product("Iphone 15", "512GB", 210000.0, 8), Product("Xiaomi", "256GB", 31000.0, 14)],
+        ),
+        Category("Пустая", "Нет товаров", []),
+        Category("Телевизоры", "ТВ", [Product('55" QLED 4K', "Подсветка", 123000.0, 7)]),
+    ]
+
+
+def dump(products: List[Product]) -> List[tuple]:
+    return [(p.name, p.description, p.price, p.quantity) for p in products]
+
+
+def test_import_and_reopen(tmp_path: Path) -> None:
+    path = str(tmp_path / "catalog.db")
+    with open_store(path) as store:
+        assert store.import_categories(make_catalog()) == 3
+    with open_store(path) as store:
+        assert len(store) == 3
+        assert store.product_count == 3
+        assert [c.name for c in store] == ["Смартфоны", "Пустая", "Телевизоры"]
+        for stored, original in zip(store, make_catalog()):
+            category = stored.to_category()
+            assert category.description == original.description
+            assert dump(category.get_products()) == dump(original.get_products())
+            assert str(stored) == str(original)
+            assert len(stored) == len(original.products_view())
+
+
+def test_import_json(tmp_path: Path) -> None:
+    data = [
+        {"name": "A", "description": "a", "products": [{"name": "x", "description": "d", "price": 1, "quantity": 2}]}
+    ]
+    path = tmp_path / "catalog.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    with CatalogStore() as store:
+        assert store.import_json(str(path), backend="json") == 1
+        assert dump(list(store.category("A").iter_products())) == [("x", "d", 1.0, 2)]
+
+
+def test_pages() -> None:
+    with CatalogStore() as store:
+        store.import_rows([("A", "a", [(f"p{i}", "d", 1.0 + i, i) for i in range(10)])])
+        category = store.category("A")
+        pages = list(category.iter_pages(page_size=4))
+        assert [len(page) for page in pages] == [4, 4, 2]
+        assert [p.name for p in category.iter_products(page_size=3)] == [f"p{i}" for i in range(10)]
+        assert category.total_quantity == 45
+        assert category.total_value == sum((1.0 + i) * i for i in range(10))
+
+
+def test_new_product_upsert() -> None:
+    with CatalogStore() as store:
+        store.import_categories(make_catalog())
+        phones = store.category("Смартфоны")
+        merged = phones.new_product({"name": "Xiaomi", "description": "новое", "price": 30000.0, "quantity": 6})
+        assert dump([merged]) == [("Xiaomi", "256GB", 31000.0, 20)]
+        merged = store.new_product("Смартфоны", {"name": "Xiaomi", "description": "", "price": 35000, "quantity": 1})
+        assert (merged.price, merged.quantity) == (35000.0, 21)
+        added = phones.new_product({"name": "Pixel", "description": "D", "price": 500, "quantity": 3})
+        assert dump([added]) == [("Pixel", "D", 500.0, 3)]
+        assert [p.name for p in phones.iter_products()] == ["Iphone 15", "Xiaomi", "Pixel"]
+
+
+def test_import_merges_duplicates() -> None:
+    with CatalogStore() as store:
+        store.import_rows([("A", "a", [("x", "d", 10.0, 1), ("x", "e", 5.0, 2)]), ("A", "b", [("x", "f", 20.0, 3)])])
+        assert dump(list(store.category("A").iter_products())) == [("x", "d", 20.0, 6)]
+        assert store.category("A").description == "a"
+
+
+def test_find_products() -> None:
+    with CatalogStore() as store:
+        store.import_rows([("A", "a", [("x", "d", 1.0, 1)]), ("B", "b", [("x", "e", 2.0, 2), ("y", "f", 3.0, 3)])])
+        assert [(c, p.price) for c, p in store.find_products("x")] == [("A", 1.0), ("B", 2.0)]
+        assert store.find_products("z") == []
+        assert store.category("B").find_product("y") is not None
+        assert store.category("A").find_product("y") is None
+
+
+def test_errors() -> None:
+    with CatalogStore() as store:
+        with pytest.raises(KeyError):
+            store.category("нет")
+        with pytest.raises(KeyError):
+            store.new_product("нет", {"name": "x", "description": "d", "price": 1, "quantity": 1})
+        store.add_category("A", "a")
+        with pytest.raises(ValueError):
+            store.new_product("A", {"name": "x", "description": "d", "price": 0, "quantity": 1})
+        with pytest.raises(TypeError):
+            store.add_category("B", None)  # type: ignore[arg-type]
+        assert len(store.category("A")) == 0
+        assert str(store.category("A")) == "A, количество продуктов на складе: 0 шт."
@@ -0,0 +1,81 @@
+# Тесты пула строк:
+# одинаковые строки хранятся одним объектом, длинные описания сжимаются и распаковываются
+# при обращении, Product.from_rows и load_categories_from_json с пулом дают те же данные.
+
+import io
+import json
+from pathlib import Path
+
+from src.export import export_json
+from src.loading import load_categories_from_json
+from src.product import Product
+from src.string_pool import CompressedText, StringPool
+
+LONG = "256GB, Серый цвет, 200MP камера, " * 10
+
+
+def copy(text: str) -> str:
+    # новая строка с тем же содержимым (литералы Python уже могут быть общими)
+    return "".join(list(text))
+
+
+def test_intern_shares_equal_strings() -> None:
+    pool = StringPool()
+    first, second = copy("Серый цвет"), copy("Серый цвет")
+    assert first is not second
+    assert pool.intern(first) is first
+    assert pool.intern(second) is first
+    assert len(pool) == 1
+    assert pool.description(copy("Серый цвет")) is first
+
+
+def test_compressed_descriptions() -> None:
+    pool = StringPool(compress_from=64)
+    stored = pool.description(copy(LONG))
+    assert isinstance(stored, CompressedText)
+    assert str(stored) == LONG
+    assert len(stored) < len(LONG.encode("utf-8"))
+    assert pool.description(copy(LONG)) is stored
+    assert isinstance(pool.description("короткое"), str)
+    assert len(pool) == 2
+
+
+def test_from_rows_with_pool() -> None:
+    pool = StringPool(compress_from=64)
+    rows = [(f"Товар {i}", copy(LONG if i % 2 else "Синий"), 100.0, i) for i in range(6)]
+    products = Product.from_rows(rows, strings=pool)
+    assert [p.description for p in products] == [row[1] for row in rows]
+    assert products[0].description is products[2].description
+    assert len(pool) == 8  # 6 названий, короткое и сжатое описание
+    products[1].description = "Новое"
+    assert products[1].description == "Новое"
+    assert products[3].description == LONG
+
+
+def test_loader_with_pool(tmp_path: Path) -> None:
+    data = [
+        {
+            "name": "Смартфоны",
+            "description": "Описание",
+            "products": [
+                {"name": f"Товар {i}", "description": LONG, "price": 10 + i, "quantity": i} for i in range(5)
+            ],
+        }
+    ]
+    path = tmp_path / "catalog.json"
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+    plain = load_categories_from_json(str(path))
+    for pool in (StringPool(), StringPool(compress_from=64)):
+        for typed in (False, True):
+            categories = load_categories_from_json(str(path), typed=typed, strings=pool)
+            assert [str(p) for p in categories[0].get_products()] == [str(p) for p in plain[0].get_products()]
+            assert {p.description for p in categories[0].products_view()} == {LONG}
+            exported, expected = io.StringIO(), io.StringIO()
+            export_json(categories, exported)
+            export_json(plain, expected)
+            assert exported.getvalue() == expected.getvalue()
+    descriptions = [
+        p.description for p in load_categories_from_json(str(path), strings=StringPool())[0].products_view()
+    ]
+    assert all(d is descriptions[0] for d in descriptions)